@@ -0,0 +1,30 @@
+"""
+Benchmarks for `example.utilities.colors`.
+
+Scale(s) are configurable via environment variables:
+
+- BENCHMARK_COLORS_STRINGS: strings colored per round (default 100,000).
+"""
+
+import inspect
+
+import pytest
+
+import example.utilities.colors
+
+from conftest import scale
+
+total = scale("colors_strings", 100000)
+
+strings = ["Example String {}".format(index) for index in range(total)]
+
+functions = [name for name, function in inspect.getmembers(example.utilities.colors, inspect.isfunction) if function.__module__ == example.utilities.colors.__name__]
+
+@pytest.mark.parametrize("function", functions)
+def benchmark_color(benchmark, function: str):
+    benchmark.group = "colors"
+    benchmark.extra_info["strings"] = total
+
+    callable = getattr(example.utilities.colors, function)
+
+    benchmark.pedantic(lambda: [callable(string) for string in strings], rounds=5, iterations=1)
@@ -0,0 +1,71 @@
+"""
+Shared benchmark fixture(s).
+
+S3 benchmarks run against an in-process, mocked S3 service (moto) by default. To benchmark against a local
+S3-compatible server (e.g. MinIO) instead, export "AWS_ENDPOINT_URL_S3" (and the server's credentials); botocore
+routes all S3 clients to the given endpoint.
+"""
+
+import os
+import uuid
+import logging
+
+import pytest
+
+logger = logging.getLogger(__name__)
+
+endpoint = os.getenv("AWS_ENDPOINT_URL_S3") or os.getenv("AWS_ENDPOINT_URL")
+
+def scale(name: str, default: int) -> int:
+    """
+    Returns a benchmark's scale from the "BENCHMARK_<NAME>" environment variable, else the default.
+    """
+
+    return int(os.getenv("BENCHMARK_{}".format(name.upper()), str(default)))
+
+@pytest.fixture(scope="session")
+def s3(tmp_path_factory: pytest.TempPathFactory):
+    """
+    Provides an `example.api.aws.S3` instance, and a bucket name, against moto or a local S3-compatible server.
+    """
+
+    import example.api.aws
+
+    bucket = "example-benchmarks-{}".format(uuid.uuid4().hex[:12])
+
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        if endpoint is None:
+            moto = pytest.importorskip("moto")
+
+            directory = tmp_path_factory.mktemp("aws")
+
+            monkeypatch.delenv("AWS_PROFILE", raising=False)
+            monkeypatch.setenv("AWS_ACCESS_KEY_ID", "benchmarking")
+            monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "benchmarking")
+            monkeypatch.setenv("AWS_SESSION_TOKEN", "benchmarking")
+            monkeypatch.setenv("AWS_CONFIG_FILE", str(directory.joinpath("config")))
+            monkeypatch.setenv("AWS_SHARED_CREDENTIALS_FILE", str(directory.joinpath("credentials")))
+
+            context = moto.mock_aws()
+        else:
+            context = pytest.MonkeyPatch.context()
+
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+
+        with context:
+            instance = example.api.aws.S3()
+
+            client = instance.client
+            client.create_bucket(Bucket=bucket, CreateBucketConfiguration={"LocationConstraint": "us-east-2"})
+
+            logger.info("Benchmarking S3 Bucket: %s (Endpoint: %s)", bucket, endpoint or "moto")
+
+            yield instance, bucket
+
+            if endpoint is not None:
+                for page in client.get_paginator("list_objects_v2").paginate(Bucket=bucket):
+                    objects = [{"Key": item["Key"]} for item in page.get("Contents", [])]
+                    if objects:
+                        client.delete_objects(Bucket=bucket, Delete={"Objects": objects, "Quiet": True})
+
+                client.delete_bucket(Bucket=bucket)
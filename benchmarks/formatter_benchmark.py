@@ -0,0 +1,53 @@
+"""
+Benchmarks for the CLI's log formatter, measuring formatted records per second.
+
+The "baseline" group member reproduces the formatter's original implementation (a string pattern passed to
+`re.sub` for every record, and no timestamp caching) for before-and-after comparison(s).
+"""
+
+import re
+import logging
+
+import pytest
+
+import example.cli.main
+
+class Baseline(logging.Formatter):
+    expression = r"(?<!\w)'([^\s']+)'(?!\w)"
+    substitution = r'"\1"'
+
+    def format(self, record) -> str:
+        v = super().format(record)
+
+        return re.sub(self.expression, self.substitution, v)
+
+template = "[%(levelname)s] (%(asctime)s) (%(name)s) %(message)s"
+
+formatters = {
+    "baseline": lambda: Baseline(template),
+    "optimized": lambda: example.cli.main.Formatter(template),
+    "optimized-uncached": lambda: example.cli.main.Formatter(template, cache=False),
+}
+
+messages = {
+    "unquoted": ("Attempting to Download %s from %s", ("objects/2026/10/19/object.bin", "example-bucket")),
+    "quoted": ("Arguments: %r", ({"log_level": "INFO", "verbose": None},)),
+}
+
+def records(msg: str, args: tuple, total: int = 1000) -> list[logging.LogRecord]:
+    return [logging.makeLogRecord({"name": "example.api.aws", "levelno": logging.INFO, "levelname": "INFO", "msg": msg, "args": args}) for _ in range(total)]
+
+@pytest.mark.parametrize("message", list(messages))
+@pytest.mark.parametrize("formatter", list(formatters))
+def benchmark_formatter(benchmark, formatter: str, message: str):
+    benchmark.group = "formatter-{}".format(message)
+    benchmark.extra_info["records"] = 1000
+
+    instance = formatters[formatter]()
+    batch = records(*messages[message])
+
+    def execute():
+        for record in batch:
+            instance.format(record)
+
+    benchmark(execute)
@@ -0,0 +1,83 @@
+"""
+Cold-start import benchmarks, using "python -X importtime".
+
+Each module's cumulative import time (the best of several cold interpreter starts) is recorded in the benchmark's
+"extra_info" (and therefore in the saved JSON results), alongside the slowest transitively imported modules. A module
+exceeding its budget fails the benchmark.
+
+Budget(s) are configurable via environment variables:
+
+- BENCHMARK_IMPORT_BUDGET_MS: overrides every module's cumulative import time budget, in milliseconds.
+- BENCHMARK_IMPORT_SAMPLES: cold interpreter starts per module (default 5).
+"""
+
+import os
+import sys
+import pathlib
+import subprocess
+
+import pytest
+
+from conftest import scale
+
+samples = scale("import_samples", 5)
+
+budgets = {
+    "example": 50,
+    "example.api": 50,
+    "example.api.aws": 150,
+    "example.cli.main": 150,
+    # --> dominated by pydantic's own import time.
+    "example.models.base": 750,
+    "example.utilities.systems": 150,
+}
+"""
+Each module's default cumulative import time budget, in milliseconds.
+"""
+
+if os.getenv("BENCHMARK_IMPORT_BUDGET_MS"):
+    budgets = dict.fromkeys(budgets, float(os.environ["BENCHMARK_IMPORT_BUDGET_MS"]))
+
+source = str(pathlib.Path(__file__).resolve().parent.parent.joinpath("src"))
+
+def importtime(module: str) -> dict[str, int]:
+    """
+    Returns each imported module's cumulative import time, in microseconds, from a cold interpreter start.
+    """
+
+    environment = os.environ.copy()
+    environment["PYTHONPATH"] = os.pathsep.join([source, environment.get("PYTHONPATH", "")])
+
+    process = subprocess.run([sys.executable, "-X", "importtime", "-c", "import {}".format(module)], env=environment, capture_output=True, text=True, check=True)
+
+    results = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+
+        _, cumulative, name = (partial.strip() for partial in line.removeprefix("import time:").split("|"))
+
+        results[name] = int(cumulative)
+
+    return results
+
+@pytest.mark.parametrize("module", list(budgets))
+def benchmark_import(benchmark, module: str):
+    benchmark.group = "imports"
+
+    runs: list[dict[str, int]] = []
+
+    benchmark.pedantic(lambda: runs.append(importtime(module)), rounds=samples, iterations=1)
+
+    best = min(runs, key=lambda run: run[module])
+
+    milliseconds, budget = best[module] / 1000, budgets[module]
+
+    benchmark.extra_info.update({
+        "module": module,
+        "cumulative_ms": milliseconds,
+        "budget_ms": budget,
+        "slowest": {name: value / 1000 for name, value in sorted(best.items(), key=lambda item: item[1], reverse=True)[:10]},
+    })
+
+    assert milliseconds <= budget, "Import Time Budget Exceeded ({}): {:.2f} ms > {:.2f} ms".format(module, milliseconds, budget)
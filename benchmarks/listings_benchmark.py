@@ -0,0 +1,47 @@
+"""
+Benchmarks for `example.api.listings` storage-report queries over a large, synthetic listing.
+
+Scale(s) are configurable via environment variables:
+
+- BENCHMARK_LISTINGS_KEYS: keys in the synthetic listing (default 1,000,000), spread across a three-level hierarchy.
+"""
+
+import pytest
+
+import example.api.listings
+
+from conftest import scale
+
+total = scale("listings_keys", 1000000)
+
+@pytest.fixture(scope="module")
+def listing() -> example.api.listings.Listing:
+    return example.api.listings.Listing.from_items(
+        {"Key": "logs/{:02d}/{:04d}/{:08d}.log".format(index % 100, index // 1000 % 1000, index), "Size": (index * 7919) % 1048576, "LastModified": 0.0, "ETag": "\"d41d8cd98f00b204e9800998ecf8427e\""}
+        for index in range(total)
+    )
+
+@pytest.fixture(scope="module")
+def index(listing: example.api.listings.Listing) -> example.api.listings.Index:
+    return example.api.listings.Index(listing)
+
+def benchmark_index_construction(benchmark, listing: example.api.listings.Listing):
+    benchmark.group = "listings-index"
+    benchmark.extra_info["keys"] = len(listing)
+
+    benchmark.pedantic(lambda: example.api.listings.Index(listing), rounds=3, iterations=1)
+
+def benchmark_prefix_total(benchmark, index: example.api.listings.Index):
+    benchmark.group = "listings-query"
+
+    assert benchmark(index.total, "logs/42/") > 0
+
+def benchmark_levels(benchmark, index: example.api.listings.Index):
+    benchmark.group = "listings-query"
+
+    assert len(benchmark(lambda: list(index.du("logs/", depth=2)))) > 0
+
+def benchmark_largest(benchmark, index: example.api.listings.Index):
+    benchmark.group = "listings-query"
+
+    assert len(benchmark.pedantic(index.largest, args=(100, "logs/42/"), rounds=3, iterations=1)) == 100
@@ -0,0 +1,67 @@
+"""
+Benchmarks for `example.models`.
+
+Scale(s) are configurable via environment variables:
+
+- BENCHMARK_MODELS: models instantiated, or names converted, per round (default 5,000).
+"""
+
+import pydantic
+import pytest
+
+import example.models.base
+import example.models.configuration
+import example.models.internal.base
+import example.models.internal.utilities
+
+from conftest import scale
+
+total = scale("models", 5000)
+
+names = ["example_field_name_{}".format(index) for index in range(total)]
+classes = ["ExampleModelName{}".format(index) for index in range(total)]
+
+class Example(example.models.internal.base.Model):
+    """
+    An example model.
+    """
+
+    example_name: str = pydantic.Field(...)
+    example_count: int = pydantic.Field(default=0)
+    example_tags: list[str] = pydantic.Field(default_factory=list)
+
+@pytest.mark.parametrize("function", ["snake_case_to_train_case", "snake_case_to_train_case_alias_generator"])
+def benchmark_utilities_snake_case(benchmark, function: str):
+    benchmark.group = "models-utilities"
+    benchmark.extra_info["names"] = total
+
+    callable = getattr(example.models.internal.utilities, function)
+
+    benchmark(lambda: [callable(name) for name in names])
+
+def benchmark_utilities_pascal_case(benchmark):
+    benchmark.group = "models-utilities"
+    benchmark.extra_info["names"] = total
+
+    benchmark(lambda: [example.models.internal.utilities.pascal_to_train_case(name) for name in classes])
+
+def benchmark_configuration_default(benchmark):
+    benchmark.group = "models-configuration"
+    benchmark.extra_info["configurations"] = total
+
+    benchmark(lambda: [example.models.configuration.default(title="example") for _ in range(total)])
+
+def benchmark_model_jsonify(benchmark):
+    benchmark.group = "models-serialization"
+    benchmark.extra_info["models"] = total
+
+    instances = [Example(example_name="example-{}".format(index), example_count=index, example_tags=["a", "b"]) for index in range(total)]
+
+    benchmark(lambda: [instance.jsonify() for instance in instances])
+
+@pytest.mark.parametrize("lazy", [False, True], ids=["eager", "lazy"])
+def benchmark_base_instantiation(benchmark, lazy: bool):
+    benchmark.group = "models-base"
+    benchmark.extra_info["models"] = total
+
+    benchmark.pedantic(lambda: [example.models.base.Base(lazy=lazy) for _ in range(total)], rounds=5, iterations=1)
@@ -0,0 +1,194 @@
+"""
+Benchmarks for the S3 layer (`example.api.aws.S3`).
+
+Scale(s) are configurable via environment variables:
+
+- BENCHMARK_S3_LIST_KEYS: objects listed from the backend (default 2,000; moto's listing is quadratic, so raise this
+  only against a local S3-compatible server, e.g. 1,000,000).
+- BENCHMARK_S3_LIST_PROCESSING_KEYS: synthetic keys processed by `S3.list` and `S3.listing` without a backend (default 1,000,000).
+- BENCHMARK_S3_SMALL_OBJECTS: small objects transferred per round (default 50).
+- BENCHMARK_S3_SMALL_OBJECT_BYTES: the size of each small object (default 16 KiB).
+- BENCHMARK_S3_LARGE_OBJECT_BYTES: the size of the multipart object (default 64 MiB).
+"""
+
+import os
+import datetime
+import concurrent.futures
+
+import pytest
+
+import example.api.aws
+import example.api.types
+
+from conftest import scale
+
+class Pages:
+    """
+    A minimal stand-in for a boto3 client that yields pre-generated `list_objects_v2` pages.
+    """
+
+    def __init__(self, total: int, size: int = 1000):
+        timestamp = datetime.datetime(2026, 1, 1, tzinfo=datetime.timezone.utc)
+
+        self.pages = [
+            {"Contents": [{"Key": "listing/{:012d}".format(index), "LastModified": timestamp, "ETag": "\"d41d8cd98f00b204e9800998ecf8427e\"", "Size": 0, "StorageClass": "STANDARD"} for index in range(start, min(start + size, total))]}
+            for start in range(0, total, size)
+        ]
+
+    def get_paginator(self, name: str):
+        return self
+
+    def paginate(self, **kwargs):
+        return iter(self.pages)
+
+def stubbed(client: Pages) -> example.api.aws.S3:
+    class Stubbed(example.api.aws.S3):
+        @property
+        def client(self):
+            return client
+
+    return Stubbed()
+
+def benchmark_client_construction(benchmark, s3):
+    benchmark.group = "s3-client"
+
+    instance, _ = s3
+
+    benchmark(lambda: instance.client)
+
+def benchmark_list(benchmark, s3):
+    benchmark.group = "s3-list"
+
+    instance, bucket = s3
+
+    total = scale("s3_list_keys", 2000)
+
+    client = instance.client
+    with concurrent.futures.ThreadPoolExecutor(max_workers=16) as executor:
+        list(executor.map(lambda index: client.put_object(Bucket=bucket, Key="listing/{:012d}".format(index), Body=b""), range(total)))
+
+    benchmark.extra_info["keys"] = total
+
+    result = benchmark.pedantic(instance.list, args=(example.api.types.S3.List(key="listing/", bucket_name=bucket),), rounds=3, iterations=1)
+
+    assert len(result) == total
+
+def benchmark_list_processing(benchmark):
+    benchmark.group = "s3-list"
+
+    total = scale("s3_list_processing_keys", 1000000)
+
+    benchmark.extra_info["keys"] = total
+
+    def setup():
+        # --> S3.list mutates each item in-place; every round requires fresh pages.
+        return (stubbed(Pages(total)), example.api.types.S3.List(key="listing/", bucket_name="stubbed")), {}
+
+    result = benchmark.pedantic(lambda instance, configuration: instance.list(configuration), setup=setup, rounds=3, iterations=1)
+
+    assert len(result) == total
+
+def benchmark_listing_processing(benchmark):
+    benchmark.group = "s3-list"
+
+    total = scale("s3_list_processing_keys", 1000000)
+
+    def setup():
+        return (stubbed(Pages(total)), example.api.types.S3.List(key="listing/", bucket_name="stubbed")), {}
+
+    result = benchmark.pedantic(lambda instance, configuration: instance.listing(configuration), setup=setup, rounds=3, iterations=1)
+
+    benchmark.extra_info["keys"] = total
+    benchmark.extra_info["bytes"] = result.nbytes()
+
+    assert len(result) == total
+
+@pytest.fixture(scope="module")
+def small(s3, tmp_path_factory: pytest.TempPathFactory):
+    instance, bucket = s3
+
+    total, size = scale("s3_small_objects", 50), scale("s3_small_object_bytes", 16 * 1024)
+
+    directory = tmp_path_factory.mktemp("small")
+
+    sources = []
+    for index in range(total):
+        source = directory.joinpath("{:06d}.bin".format(index))
+        source.write_bytes(os.urandom(size))
+        sources.append(source)
+
+    return instance, bucket, sources, size
+
+def benchmark_small_upload(benchmark, small):
+    benchmark.group = "s3-small-objects"
+
+    instance, bucket, sources, size = small
+
+    benchmark.extra_info.update({"objects": len(sources), "bytes": len(sources) * size})
+
+    def execute():
+        for source in sources:
+            instance.upload(example.api.types.S3.Upload(key="small/{}".format(source.name), bucket_name=bucket, source=source))
+
+    benchmark.pedantic(execute, rounds=5, iterations=1)
+
+def benchmark_small_download(benchmark, small, tmp_path):
+    benchmark.group = "s3-small-objects"
+
+    instance, bucket, sources, size = small
+
+    for source in sources:
+        instance.upload(example.api.types.S3.Upload(key="small/{}".format(source.name), bucket_name=bucket, source=source))
+
+    benchmark.extra_info.update({"objects": len(sources), "bytes": len(sources) * size})
+
+    def execute():
+        for source in sources:
+            instance.download(example.api.types.S3.Download(key="small/{}".format(source.name), bucket_name=bucket, directory=tmp_path))
+
+    benchmark.pedantic(execute, rounds=5, iterations=1)
+
+@pytest.fixture(scope="module")
+def large(s3, tmp_path_factory: pytest.TempPathFactory):
+    instance, bucket = s3
+
+    size = scale("s3_large_object_bytes", 64 * 1024 * 1024)
+
+    source = tmp_path_factory.mktemp("large").joinpath("large.bin")
+
+    with open(source, "wb") as file:
+        for _ in range(0, size, 1024 * 1024):
+            file.write(os.urandom(1024 * 1024))
+
+    return instance, bucket, source, source.stat().st_size
+
+def benchmark_multipart_upload(benchmark, large):
+    benchmark.group = "s3-multipart"
+
+    instance, bucket, source, size = large
+
+    benchmark.extra_info["bytes"] = size
+
+    benchmark.pedantic(instance.upload, args=(example.api.types.S3.Upload(key="large/large.bin", bucket_name=bucket, source=source),), rounds=3, iterations=1)
+
+def benchmark_multipart_download(benchmark, large, tmp_path):
+    benchmark.group = "s3-multipart"
+
+    instance, bucket, source, size = large
+
+    instance.upload(example.api.types.S3.Upload(key="large/large.bin", bucket_name=bucket, source=source))
+
+    benchmark.extra_info["bytes"] = size
+
+    benchmark.pedantic(instance.download, args=(example.api.types.S3.Download(key="large/large.bin", bucket_name=bucket, directory=tmp_path),), rounds=3, iterations=1)
+
+def benchmark_ranged_download(benchmark, large, tmp_path):
+    benchmark.group = "s3-multipart"
+
+    instance, bucket, source, size = large
+
+    instance.upload(example.api.types.S3.Upload(key="large/large.bin", bucket_name=bucket, source=source))
+
+    benchmark.extra_info["bytes"] = size
+
+    benchmark.pedantic(instance.download, args=(example.api.types.S3.Download(key="large/large.bin", bucket_name=bucket, directory=tmp_path, ranged=True),), rounds=3, iterations=1)
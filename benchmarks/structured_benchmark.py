@@ -0,0 +1,44 @@
+"""
+Benchmarks for structured logging, comparing the cost of filtered (below-level) and emitted records.
+"""
+
+import io
+import logging
+
+import pytest
+
+import example.logging.adapter
+import example.logging.structured
+
+@pytest.fixture()
+def instance(request: pytest.FixtureRequest):
+    handler = logging.StreamHandler(io.StringIO())
+    handler.setFormatter(example.logging.structured.Formatter())
+
+    v = logging.getLogger(request.node.name)
+    v.handlers = [handler]
+    v.propagate = False
+    v.setLevel(logging.INFO)
+
+    return v
+
+def benchmark_context_filtered(benchmark, instance: logging.Logger):
+    benchmark.group = "structured-filtered"
+
+    adapter = example.logging.structured.Context(instance, {"bucket": "example-bucket"})
+
+    benchmark(adapter.debug, "Downloaded %s", "object.bin", extra={"size": 1024})
+
+def benchmark_prefixed_adapter_filtered(benchmark, instance: logging.Logger):
+    benchmark.group = "structured-filtered"
+
+    adapter = example.logging.adapter.Adapter(instance)
+
+    benchmark(adapter.debug, "Downloaded %s", "object.bin", name="example-bucket")
+
+def benchmark_context_emitted(benchmark, instance: logging.Logger):
+    benchmark.group = "structured-emitted"
+
+    adapter = example.logging.structured.Context(instance, {"bucket": "example-bucket"}).bind(service="s3")
+
+    benchmark(adapter.info, "Downloaded %s", "object.bin", extra={"size": 1024})
@@ -0,0 +1,50 @@
+"""
+Benchmarks for `example.utilities.systems` descriptor predicates over a large file tree.
+
+Scale(s) are configurable via environment variables:
+
+- BENCHMARK_SYSTEMS_FILES: files in the generated tree (default 100,000), spread across directories of 1,000 files.
+"""
+
+import os
+
+import pytest
+
+import example.utilities.systems
+
+from conftest import scale
+
+total = scale("systems_files", 100000)
+
+@pytest.fixture(scope="module")
+def tree(tmp_path_factory: pytest.TempPathFactory) -> list[str]:
+    root = tmp_path_factory.mktemp("tree")
+
+    paths = []
+    for index in range(total):
+        directory = os.path.join(root, "{:04d}".format(index // 1000))
+        if index % 1000 == 0:
+            os.mkdir(directory)
+
+        path = os.path.join(directory, "{:06d}.bin".format(index))
+        with open(path, "wb"):
+            ...
+
+        paths.append(path)
+
+    return paths
+
+def benchmark_descriptor_construction(benchmark, tree: list[str]):
+    benchmark.group = "systems-descriptor"
+    benchmark.extra_info["files"] = len(tree)
+
+    benchmark.pedantic(lambda: [example.utilities.systems.Descriptor(path) for path in tree], rounds=3, iterations=1)
+
+@pytest.mark.parametrize("predicate", ["is_readable", "is_writable", "is_executable", "is_user_readable", "is_group_readable", "get_current_permissions"])
+def benchmark_descriptor_predicate(benchmark, tree: list[str], predicate: str):
+    benchmark.group = "systems-descriptor"
+    benchmark.extra_info["files"] = len(tree)
+
+    descriptors = [example.utilities.systems.Descriptor(path) for path in tree]
+
+    benchmark.pedantic(lambda: [getattr(descriptor, predicate)() for descriptor in descriptors], rounds=3, iterations=1)
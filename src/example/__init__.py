@@ -1,7 +1,32 @@
 """
 ...
+
+Sub-packages, as well as the package's `Version`, are loaded lazily upon first attribute access (PEP 562) in
+order to keep the package's (and CLI's) cold-start time to a minimum.
 """
 
-import example.internal.versioning
+import importlib
+import typing
+
+if typing.TYPE_CHECKING:
+    import example.internal.versioning
+
+    Version: example.internal.versioning.Version
+
+__all__ = ["Version", "api", "cli", "internal", "logging", "models", "utilities"]
+
+def __getattr__(name: str) -> typing.Any:
+    if name == "Version":
+        import example.internal.versioning
+
+        value = globals()["Version"] = example.internal.versioning.current()
+
+        return value
+
+    if name in __all__:
+        return importlib.import_module("{}.{}".format(__name__, name))
+
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
 
-Version = example.internal.versioning.Version()
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,3 +1,20 @@
 """
+The api package provides interfaces for external service(s).
 
+Modules are loaded lazily upon first attribute access (PEP 562); importing `example.api` doesn't import any
+third-party SDK (e.g. `boto3`).
 """
+
+import importlib
+import typing
+
+__all__ = ["aws", "caches", "integrity", "listings", "metrics", "packing", "patterns", "pools", "transfers", "types"]
+
+def __getattr__(name: str) -> typing.Any:
+    if name in __all__:
+        return importlib.import_module("{}.{}".format(__name__, name))
+
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,23 +1,28 @@
 import contextlib
+import io
 import json
 import logging
 import os
 import pathlib
 import sys
 import tempfile
+import time
 import typing
 import dataclasses
+import threading
 import configparser
 
 import example.utilities.colors
 
-from tqdm import tqdm
-
-import boto3
-from botocore.config import Config
-from botocore.client import ClientError
-
 import example.api.types
+import example.api.metrics
+import example.api.patterns
+import example.api.pools
+import example.api.integrity
+import example.api.transfers
+
+# --> boto3, botocore, tqdm and urllib3 are imported within the functions requiring them, ensuring that importing
+#     this module (e.g. for a CLI command that never interacts with AWS) doesn't incur the SDKs' import cost(s).
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +37,128 @@ def disable_ssl_warnings():
 
         yield None
 
+def interactive() -> bool:
+    """
+    Whether progress bars should be displayed: standard-output is a capable terminal, and the environment isn't CI.
+    """
+
+    try:
+        terminal = os.isatty(sys.stdout.fileno())
+    except (AttributeError, OSError, ValueError):  # --> e.g. standard-output was replaced by an in-memory stream.
+        return False
+
+    return terminal and (os.getenv("CI", default="") == "" or os.getenv("CI", default="") == "false")
+
+def transfer(chunk_size: typing.Optional[int] = None, concurrency: typing.Optional[int] = None):
+    """
+    Returns a boto3 transfer configuration for the given multipart chunk size and concurrency, or None if neither was specified.
+
+    Parameters
+    ----------
+    chunk_size : int, optional
+        The multipart chunk size (and threshold), in bytes.
+    concurrency : int, optional
+        The maximum number of threads transferring a single object's parts.
+    """
+
+    if chunk_size is None and concurrency is None:
+        return None
+
+    from boto3.s3.transfer import TransferConfig
+
+    options = {}
+    if chunk_size is not None:
+        options.update(multipart_threshold=chunk_size, multipart_chunksize=chunk_size)
+    if concurrency is not None:
+        options.update(max_concurrency=concurrency)
+
+    return TransferConfig(**options)
+
+def readinto(stream: typing.Any, view: memoryview) -> int:
+    """
+    Fills a buffer from a (botocore) streaming body, returning the number of bytes read; fewer than the buffer's
+    length only if the stream ended early.
+
+    Once the buffer is filled, the stream is read to its end, such that botocore verifies the body's length and (if
+    enabled) its checksum. A stream extending beyond the buffer raises a `RuntimeError`.
+    """
+
+    function = getattr(stream, "readinto", None)
+
+    def fill(target: memoryview) -> int:
+        if function is not None:
+            return function(target)
+
+        chunk = stream.read(len(target))
+        target[:len(chunk)] = chunk
+
+        return len(chunk)
+
+    total = 0
+    while total < len(view):
+        count = fill(view[total:])
+        if not count:
+            return total
+
+        total += count
+
+    if fill(memoryview(bytearray(1))):
+        raise RuntimeError("Stream Exceeded its Expected Length of {} Byte(s)".format(len(view)))
+
+    return total
+
+def terminate(prefix: str) -> str:
+    """
+    Returns a non-empty key prefix terminated by "/", such that e.g. "build/1" matches the keys under "build/1/", but
+    not those under "build/10/" (nor "build/1.txt").
+    """
+
+    return prefix + "/" if prefix and not prefix.endswith("/") else prefix
+
+def inherited(head: dict) -> dict:
+    """
+    Returns the metadata arguments (e.g. "ContentType" and "Metadata") of a `head_object` response, with which a copy
+    of the object inherits its metadata.
+    """
+
+    return {name: head[name] for name in ("ContentType", "CacheControl", "ContentDisposition", "ContentEncoding", "ContentLanguage", "Metadata") if head.get(name)}
+
+class Buffer(io.RawIOBase):
+    """
+    A seekable, read-only file object over a bytes-like object, such that any buffer (e.g. a `memoryview` slice) can be
+    uploaded without first being copied into `bytes`.
+    """
+
+    def __init__(self, data: typing.Any):
+        self.view = memoryview(data).cast("B")
+        self.position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: typing.Any) -> int:
+        target = memoryview(buffer).cast("B")
+
+        count = min(len(target), len(self.view) - self.position)
+        target[:count] = self.view[self.position:self.position + count]
+
+        self.position += count
+
+        return count
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self.position, io.SEEK_END: len(self.view)}[whence]
+
+        self.position = max(0, base + offset)
+
+        return self.position
+
+    def tell(self) -> int:
+        return self.position
+
 def write_aws_configurations(session_token: str, session_token_expiration: str, access_key: str, secret_key: str, region: str, profile_name: typing.Optional[str] = "default"):
     """
     Writes both an AWS ~/.aws/config and ~/.aws/credentials file using provided functional parameters.
@@ -97,6 +224,7 @@ def write_aws_configurations(session_token: str, session_token_expiration: str,
 class Settings:
     profile: typing.Optional[str] = None
     region: str = os.getenv("AWS_REGION", "us-east-2")
+    connections: int = 10  # --> botocore's maximum connection pool size; raise alongside transfer concurrency.
 
     def __post_init__(self):
         validations = {
@@ -108,9 +236,22 @@ class Settings:
 
             raise ValueError("Invalid Region Provided: {}. Valid Region(s): {}".format(self.region, json.dumps(validations["regions"])))
 
+_construction = threading.Lock()
+
 @dataclasses.dataclass(frozen=True)
 class AWS:
+    """
+    Attributes
+    ----------
+    settings : Settings
+        The client's profile, region and connection settings.
+    reuse : bool
+        Whether a single client is constructed (once) and shared across calls, rather than constructing a new client
+        upon each access of `client`. boto3 clients are thread-safe, so a shared client may be used across threads.
+    """
+
     settings: Settings = Settings()
+    reuse: bool = False
 
     def __post_init__(self):
         if type(self) != AWS and isinstance(self, AWS):  # --> if the instance is a child of AWS
@@ -140,8 +281,27 @@ class AWS:
 
     @property
     def client(self):
+        if not self.reuse:
+            return self._construct()
+
+        instance = self.__dict__.get("_client")
+        if instance is None:
+            with _construction:
+                instance = self.__dict__.get("_client")
+                if instance is None:
+                    instance = self.__dict__["_client"] = self._construct()
+
+        return instance
+
+    def _construct(self):
+        import boto3
+        from botocore.config import Config
+
+        start = time.perf_counter()
+
         configuration = Config(
             region_name=self.settings.region,
+            max_pool_connections=self.settings.connections,
             retries={
                 "max_attempts": 3,
                 "mode": "standard"
@@ -195,6 +355,10 @@ class AWS:
 
         instance = session.client(self.service, verify=True, config=configuration)
 
+        if example.api.metrics.enabled():
+            example.api.metrics.instrument(instance)
+            example.api.metrics.sink.observe("example_aws_client_construction_seconds", time.perf_counter() - start, (("service", self.service),))
+
         return instance
 
 @dataclasses.dataclass(frozen=True)
@@ -240,6 +404,8 @@ class S3(AWS):
 
         """
 
+        from botocore.client import ClientError
+
         logger.debug("Attempting to Verify Access to Bucket \"%s\"", bucket_name)
 
         try:
@@ -263,9 +429,41 @@ class S3(AWS):
         return True
 
     def list(self, configuration: example.api.types.S3.List):
-        contents = []
+        return [*self.iterate(configuration)]
+
+    def listing(self, configuration: example.api.types.S3.List) -> "example.api.listings.Listing":
+        """
+        Lists the objects under a prefix into a compact, columnar `example.api.listings.Listing`.
 
-        with disable_ssl_warnings():
+        Pages are consumed as they're received, such that the listing's per-object dictionaries are never retained.
+        """
+
+        import example.api.listings
+
+        return example.api.listings.Listing.from_items(self.iterate(configuration))
+
+    def iterate(self, configuration: example.api.types.S3.List) -> typing.Iterator[dict]:
+        """
+        Lazily lists the objects under a prefix, yielding each object as its page is received.
+
+        Unlike `list`, memory usage is bounded by a single page (at most 1000 objects), and the first objects are
+        available before the listing completes.
+
+        When the configuration includes a pattern, only its literal prefix is listed, non-matching "directories" are
+        pruned via delimited listings, and the remaining keys are matched during pagination.
+
+        Parameters
+        ----------
+        configuration : example.api.types.S3.List
+            The listing's bucket and key prefix.
+
+        Yields
+        ------
+        dict
+            Each object's listing entry, with "LastModified" converted to a POSIX timestamp.
+        """
+
+        with disable_ssl_warnings(), example.api.metrics.timer("s3.list", bucket=configuration.bucket_name):
             bucket_name = configuration.bucket_name
 
             prefix = configuration.key.removeprefix("/")
@@ -278,15 +476,19 @@ class S3(AWS):
             logger.debug("Attempting to List \"%s\" from \"%s\"", prefix, bucket_name)
 
             paginator = self.client.get_paginator("list_objects_v2")
-            iterator = paginator.paginate(Bucket=bucket_name, Prefix=prefix)
+            options = {"StartAfter": configuration.start_after} if configuration.start_after else {}
 
-            for page in iterator:
-                if "Contents" in page:
-                    for item in page["Contents"]:
-                        item["LastModified"] = item["LastModified"].timestamp()
-                        contents.append(item)
+            def pages(prefix: str, delimiter: typing.Optional[str] = None) -> typing.Iterable[dict]:
+                return paginator.paginate(Bucket=bucket_name, Prefix=prefix, **({"Delimiter": delimiter} if delimiter else {}), **options)
 
-        return contents
+            if configuration.pattern is not None:
+                items = example.api.patterns.Matcher(prefix, configuration.pattern).walk(pages)
+            else:
+                items = (item for page in pages(prefix) for item in page.get("Contents", ()))
+
+            for item in items:
+                item["LastModified"] = item["LastModified"].timestamp()
+                yield item
 
     def download(self, configuration: example.api.types.S3.Download) -> pathlib.Path:
         """
@@ -309,15 +511,28 @@ class S3(AWS):
         ------
         RuntimeError
             If the downloaded file does not exist or is not valid.
+        example.api.integrity.IntegrityError
+            With `configuration.verify`, if the downloaded bytes don't match the object's ETag (or checksum) twice.
         """
-        with disable_ssl_warnings():
+        if configuration.cache is not None:
+            return example.api.integrity.retry(configuration.cache.fetch, self, configuration)
+
+        if configuration.ranged or configuration.resume:
+            return example.api.integrity.retry(example.api.transfers.download, self, configuration)
+
+        return example.api.integrity.retry(self._download, configuration)
+
+    def _download(self, configuration: example.api.types.S3.Download) -> pathlib.Path:
+        with disable_ssl_warnings(), example.api.metrics.timer("s3.download", bucket=configuration.bucket_name) as measurement:
             key = configuration.key
             bucket_name = configuration.bucket_name
             directory = configuration.directory
 
             logger.debug("Attempting to Download \"%s\" from \"%s\"", key, bucket_name)
 
-            response = self.client.head_object(Bucket=bucket_name, Key=key.removeprefix("/"))
+            client = self.client
+
+            response = client.head_object(Bucket=bucket_name, Key=key.removeprefix("/"), **({"ChecksumMode": "ENABLED"} if configuration.verify else {}))
 
             size = response["ContentLength"]
 
@@ -337,18 +552,40 @@ class S3(AWS):
 
             logger.debug("Downloading S3 Object: file://%s", target)
 
+            config = transfer(configuration.chunk_size, configuration.concurrency)
+
+            digests, extra_args = None, None
+            if configuration.verify:
+                # --> the digests are computed as boto3 writes the (in-order) bytes; where versioned, the object is pinned.
+                digests = example.api.integrity.Digests.expecting(client, bucket_name, key.removeprefix("/"), response)
+
+                version = response.get("VersionId")
+                extra_args = {"VersionId": version} if version and version != "null" else None
+
             # --> display progress bar if output device is capable, and environment isn't CI.
-            if os.isatty(sys.stdout.fileno()) and (os.getenv("CI", default="") == "" or os.getenv("CI", default="") == "false"):
+            if configuration.progress if configuration.progress is not None else interactive():
+                from tqdm import tqdm
+
                 with tqdm(total=size, unit="B", unit_scale=True) as progress:
                     with open(target, "wb") as file:
-                        self.client.download_fileobj(bucket_name, key, file, Callback=progress.update)
+                        client.download_fileobj(bucket_name, key, file if digests is None else example.api.integrity.Writer(file, digests), ExtraArgs=extra_args, Callback=progress.update, Config=config)
             else:
                 with open(target, "wb") as f:
-                    self.client.download_fileobj(bucket_name, key.removeprefix("/"), f)
+                    client.download_fileobj(bucket_name, key.removeprefix("/"), f if digests is None else example.api.integrity.Writer(f, digests), ExtraArgs=extra_args, Config=config)
 
             if not (pathlib.Path(target).exists() and pathlib.Path(target).is_file()):
                 raise RuntimeError("Local S3 Downloaded File Does Not Exist or Isn't a Valid File.")
 
+            if digests is not None:
+                try:
+                    digests.verify(response, key)
+                except example.api.integrity.IntegrityError:
+                    os.unlink(target)
+
+                    raise
+
+            measurement.bytes, measurement.direction = size, "download"
+
             return pathlib.Path(target)
 
     def upload(self, configuration: example.api.types.S3.Upload) -> typing.Tuple[str, int]:
@@ -375,9 +612,22 @@ class S3(AWS):
         ------
         RuntimeError
             If the source file does not exist or is not a valid file.
+        example.api.integrity.IntegrityError
+            With `configuration.verify`, if the uploaded object's ETag (or checksum) doesn't match the file twice.
         """
 
-        with disable_ssl_warnings():
+        if configuration.skip_unchanged and self.unchanged(configuration):
+            logger.debug("Skipping Upload of Unchanged \"%s\" to \"%s\"", configuration.key, configuration.bucket_name)
+
+            return configuration.key.removeprefix("/"), os.path.getsize(configuration.source)
+
+        if configuration.resume:
+            return example.api.integrity.retry(example.api.transfers.upload, self, configuration)
+
+        return example.api.integrity.retry(self._upload, configuration)
+
+    def _upload(self, configuration: example.api.types.S3.Upload) -> typing.Tuple[str, int]:
+        with disable_ssl_warnings(), example.api.metrics.timer("s3.upload", bucket=configuration.bucket_name) as measurement:
             key = configuration.key.removeprefix("/")
             bucket_name = configuration.bucket_name
             source = configuration.source
@@ -392,20 +642,414 @@ class S3(AWS):
 
             size: int = os.path.getsize(source)
 
+            client = self.client
+
+            config = transfer(configuration.chunk_size, configuration.concurrency)
+
+            digests = None
+            if configuration.verify:
+                # --> the file is read sequentially (once), its digests computed as boto3 reads each part for upload.
+                chunk = example.api.transfers.chunking(size, configuration.chunk_size)
+
+                config = transfer(chunk, configuration.concurrency)
+                digests = example.api.integrity.Digests(("etag", "crc32"), chunk if size >= chunk else None)
+
+            def send(**options: typing.Any) -> None:
+                if digests is None:
+                    client.upload_file(source, bucket_name, key, ExtraArgs=extra_args, Config=config, **options)
+                    return
+
+                with open(source, "rb") as file:
+                    client.upload_fileobj(example.api.integrity.Reader(file, digests), bucket_name, key, ExtraArgs=extra_args, Config=config, **options)
+
             # --> display progress bar if output device is capable, and environment isn't CI.
-            if os.isatty(sys.stdout.fileno()) and (os.getenv("CI", default="") == "" or os.getenv("CI", default="") == "false"):
+            if configuration.progress if configuration.progress is not None else interactive():
+                from tqdm import tqdm
+
                 with tqdm(total=size, unit="B", unit_scale=True) as progress:
-                    self.client.upload_file(source, bucket_name, key, ExtraArgs=extra_args, Callback=progress.update)
+                    send(Callback=progress.update)
+            else:
+                send()
+
+            if digests is not None:
+                digests.verify(client.head_object(Bucket=bucket_name, Key=key, ChecksumMode="ENABLED"), key)
+
+            measurement.bytes, measurement.direction = size, "upload"
+
+            return key, size
+
+    def unchanged(self, configuration: example.api.types.S3.Upload, remote: typing.Optional[dict] = None) -> bool:
+        """
+        Whether an upload's destination object is identical to its source file, such that the upload can be skipped.
+
+        The object must be of the file's size, and its ETag must equal the file's ETag as computed locally, with the
+        part size that the upload would use (see `example.api.transfers.sizing`). The file is only hashed if the sizes,
+        and the number of parts, match.
+
+        Parameters
+        ----------
+        configuration : example.api.types.S3.Upload
+            The upload's source, destination, and chunk size.
+        remote : dict, optional
+            The destination's listing entry (with "Size" and "ETag") or `head_object` response. If not provided, the
+            object is retrieved via `head_object`.
+
+        Returns
+        -------
+        bool
+            Whether the object exists, and is identical to the file. An object whose ETag isn't an MD5 (e.g. a KMS
+            encrypted object) is never considered identical.
+        """
+
+        from botocore.exceptions import ClientError
+
+        key = configuration.key.removeprefix("/")
+
+        if remote is None:
+            try:
+                with disable_ssl_warnings():
+                    remote = self.client.head_object(Bucket=configuration.bucket_name, Key=key)
+            except ClientError as e:
+                if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+                    return False
+
+                raise
+
+        size = os.path.getsize(configuration.source)
+        if remote.get("Size", remote.get("ContentLength")) != size:
+            return False
+
+        etag = example.api.integrity.expected(remote).get("etag")
+        if etag is None:
+            return False
+
+        part = example.api.transfers.sizing(configuration, size)
+        if example.api.integrity.parts(etag) != (None if part is None else -(-size // part)):
+            return False
+
+        return example.api.integrity.etag(configuration.source, part, configuration.concurrency or 8) == etag
+
+    def copy(self, configuration: example.api.types.S3.Copy) -> typing.Tuple[str, int]:
+        """
+        Copies an object server-side, within or between buckets, such that none of its bytes transit the local host.
+
+        Objects up to the chunk size are copied via a single `copy_object` request. Larger objects (and any object
+        beyond `copy_object`'s 5 GiB limit) are copied as a multipart upload whose byte ranges are copied concurrently
+        via `upload_part_copy`. Every request is conditioned on the source's ETag, such that a concurrent overwrite of
+        the source fails the copy, rather than producing an object assembled from both versions.
+
+        Parameters
+        ----------
+        configuration : example.api.types.S3.Copy
+            The source and destination objects, and the multipart part size and concurrency.
+
+        Returns
+        -------
+        tuple of (str, int)
+            The destination key, and the copied object's size in bytes.
+        """
+
+        with disable_ssl_warnings(), example.api.metrics.timer("s3.copy", bucket=configuration.bucket_name) as measurement:
+            client = self.client
+
+            key = configuration.key.removeprefix("/")
+            bucket_name = configuration.bucket_name
+            extra_args = configuration.extra_arguments or {}
+
+            source = {"Bucket": configuration.source_bucket, "Key": configuration.source_key.removeprefix("/")}
+
+            logger.debug("Attempting to Copy \"%s\" from \"%s\" to \"%s\" in \"%s\"", source["Key"], source["Bucket"], key, bucket_name)
+
+            response = client.head_object(**source)
+
+            size, etag = response["ContentLength"], response["ETag"]
+
+            # --> pin the source's version (if versioned), such that every part is copied from the same object.
+            if response.get("VersionId") not in (None, "null"):
+                source["VersionId"] = response["VersionId"]
+
+            # --> parts (other than the last) must be at least 5 MiB, and an upload may consist of at most 10,000 parts.
+            chunk = max(configuration.chunk_size or 64 * 1024 * 1024, 5 * 1024 * 1024, -(-size // 10000))
+
+            if size <= min(chunk, 5 * 1024 * 1024 * 1024):
+                # --> copy_object ignores metadata arguments unless replacing the source's metadata; as a multipart copy
+                # does, the source's metadata is then inherited, and overridden by the extra arguments.
+                if extra_args:
+                    extra_args = {"MetadataDirective": "REPLACE", **inherited(response), **extra_args}
+
+                client.copy_object(Bucket=bucket_name, Key=key, CopySource=source, CopySourceIfMatch=etag, **extra_args)
             else:
-                self.client.upload_file(source, bucket_name, key, ExtraArgs=extra_args)
+                self._copy_parts(source, etag, response, bucket_name, key, chunk, configuration.concurrency or 8, extra_args)
+
+            measurement.bytes, measurement.direction = size, "copy"
 
             return key, size
 
+    def _copy_parts(self, source: dict, etag: str, head: dict, bucket_name: str, key: str, chunk: int, concurrency: int, extra_args: dict) -> None:
+        client = self.client
+
+        size = head["ContentLength"]
+
+        # --> unlike copy_object, a multipart upload doesn't inherit the source's metadata.
+        upload = client.create_multipart_upload(Bucket=bucket_name, Key=key, **{**inherited(head), **extra_args})["UploadId"]
+
+        ranges = [(number, offset, min(offset + chunk, size) - 1) for number, offset in enumerate(range(0, size, chunk), start=1)]
+
+        logger.debug("Copying %d Part(s) of %d Byte(s) with a Concurrency of %d", len(ranges), chunk, concurrency)
+
+        def part(number: int, first: int, last: int) -> dict:
+            response = client.upload_part_copy(Bucket=bucket_name, Key=key, UploadId=upload, PartNumber=number, CopySource=source, CopySourceIfMatch=etag, CopySourceRange="bytes={}-{}".format(first, last))
+
+            return {"PartNumber": number, "ETag": response["CopyPartResult"]["ETag"]}
+
+        try:
+            parts = list(example.api.pools.execute(part, ranges, concurrency, ordered=True, name="example-s3-copy"))
+
+            client.complete_multipart_upload(Bucket=bucket_name, Key=key, UploadId=upload, MultipartUpload={"Parts": parts})
+        except BaseException:
+            logger.warning("Aborting Multipart Copy of \"%s\" (Upload %s)", key, upload)
+
+            client.abort_multipart_upload(Bucket=bucket_name, Key=key, UploadId=upload)
+
+            raise
+
+    def replicate(self, configuration: example.api.types.S3.Replicate) -> typing.Iterator[typing.Tuple[str, str, typing.Optional[str]]]:
+        """
+        Copies every object under a prefix server-side, with bounded concurrency.
+
+        The concurrency is divided between objects in flight and each (multipart) object's concurrent part copies.
+
+        Parameters
+        ----------
+        configuration : example.api.types.S3.Replicate
+            The source and destination prefixes, an optional pattern, and the concurrency.
+
+        Yields
+        ------
+        tuple of (str, str, str or None)
+            Each source key, its destination key, and its error message (None if the object was copied), in
+            completion order.
+        """
+
+        from botocore.exceptions import BotoCoreError, ClientError
+
+        # --> prefixes are "/"-terminated, such that e.g. "build/1" neither copies nor rewrites the keys under "build/10/".
+        source_prefix, prefix = terminate(configuration.source_prefix.removeprefix("/")), terminate(configuration.prefix)
+
+        keys = [item["Key"] for item in self.iterate(example.api.types.S3.List(key=source_prefix, bucket_name=configuration.source_bucket, pattern=configuration.pattern))]
+
+        workers = max(1, min(configuration.concurrency, len(keys)))
+        parts = max(1, configuration.concurrency // workers)
+
+        logger.debug("Copying %d Object(s) from \"%s\" to \"%s\" - Concurrent Object(s): %d, Part(s): %d", len(keys), configuration.source_bucket, configuration.bucket_name, workers, parts)
+
+        def function(source_key: str) -> typing.Tuple[str, str, typing.Optional[str]]:
+            key = prefix + source_key.removeprefix(source_prefix)
+
+            try:
+                self.copy(example.api.types.S3.Copy(
+                    source_bucket=configuration.source_bucket, source_key=source_key, bucket_name=configuration.bucket_name, key=key,
+                    chunk_size=configuration.chunk_size, concurrency=parts, extra_arguments=configuration.extra_arguments,
+                ))
+            except (BotoCoreError, ClientError) as e:
+                return source_key, key, str(e)
+
+            return source_key, key, None
+
+        yield from example.api.pools.execute(function, [(key,) for key in keys], workers, name="example-s3-replicate")
+
+    def publish(self, configuration: example.api.types.S3.Publish) -> typing.Iterator[typing.Tuple[pathlib.Path, str, bool, typing.Optional[str]]]:
+        """
+        Uploads every file within a local directory to a prefix, skipping files whose objects are unchanged; repeated
+        publications of the same directory upload only new or changed files.
+
+        The prefix is listed once, and each file of an existing object's size is compared by its ETag (see
+        `unchanged`); no per-file `head_object` request is made. The concurrency is divided between files in flight
+        (hashed or uploaded) and each file's parts.
+
+        Parameters
+        ----------
+        configuration : example.api.types.S3.Publish
+            The local directory, the destination prefix, and the concurrency.
+
+        Yields
+        ------
+        tuple of (pathlib.Path, str, bool, str or None)
+            Each file, its key, whether it was uploaded (False if unchanged), and its error message (None if the file
+            was uploaded or skipped), in completion order.
+        """
+
+        from botocore.exceptions import BotoCoreError, ClientError
+
+        source = pathlib.Path(configuration.source)
+        if not source.is_dir():
+            raise RuntimeError("Source Does Not Exist or Isn't a Valid Directory.")
+
+        prefix = configuration.prefix.removeprefix("/")
+
+        remote = {item["Key"]: item for item in self.iterate(example.api.types.S3.List(key=prefix, bucket_name=configuration.bucket_name))}
+
+        paths = sorted(pathlib.Path(root, filename) for root, _, filenames in os.walk(source) for filename in filenames)
+
+        workers = max(1, min(configuration.concurrency, len(paths)))
+        parts = max(1, configuration.concurrency // workers)
+
+        logger.debug("Publishing %d File(s) to \"%s\" - Concurrent File(s): %d, Part(s): %d", len(paths), configuration.bucket_name, workers, parts)
+
+        def function(path: pathlib.Path) -> typing.Tuple[pathlib.Path, str, bool, typing.Optional[str]]:
+            key = prefix + path.relative_to(source).as_posix()
+
+            upload = example.api.types.S3.Upload(
+                key=key, bucket_name=configuration.bucket_name, source=path,
+                extra_arguments=configuration.extra_arguments, chunk_size=configuration.chunk_size, concurrency=parts, progress=False,
+            )
+
+            try:
+                if key in remote and self.unchanged(upload, remote[key]):
+                    return path, key, False, None
+
+                self.upload(upload)
+            except (BotoCoreError, ClientError, OSError, RuntimeError) as e:
+                return path, key, False, str(e)
+
+            return path, key, True, None
+
+        yield from example.api.pools.execute(function, [(path,) for path in paths], workers, name="example-s3-publish")
+
+    def read_bytes(self, configuration: example.api.types.S3.Read) -> memoryview:
+        """
+        Reads an object into memory, without an intermediate file.
+
+        The object is read directly into a `bytearray` preallocated from its "ContentLength", and returned as a
+        (writable) `memoryview` of it; the object's bytes aren't otherwise copied.
+
+        Raises
+        ------
+        RuntimeError
+            If fewer bytes than the object's length were received.
+        """
+
+        return self._read(self.client, configuration.bucket_name, configuration.key)
+
+    def _read(self, client, bucket_name: str, key: str) -> memoryview:
+        with disable_ssl_warnings(), example.api.metrics.timer("s3.read", bucket=bucket_name) as measurement:
+            key = key.removeprefix("/")
+
+            logger.debug("Attempting to Read \"%s\" from \"%s\"", key, bucket_name)
+
+            response = client.get_object(Bucket=bucket_name, Key=key)
+
+            view = memoryview(bytearray(response["ContentLength"]))
+
+            received = readinto(response["Body"], view)
+            if received != len(view):
+                raise RuntimeError("Incomplete Read of \"{}\": Received {} of {} Byte(s)".format(key, received, len(view)))
+
+            measurement.bytes, measurement.direction = received, "download"
+
+            return view
+
+    def read_all(self, configuration: example.api.types.S3.ReadAll) -> typing.Dict[str, memoryview]:
+        """
+        Concurrently reads many (small) objects into memory; see `read_bytes`.
+
+        Parameters
+        ----------
+        configuration : example.api.types.S3.ReadAll
+            The bucket, the objects' keys, and the maximum number of concurrent requests.
+
+        Returns
+        -------
+        dict of str to memoryview
+            Each key's contents, in the order of the given keys.
+        """
+
+        bucket_name = configuration.bucket_name
+
+        keys = list(dict.fromkeys(configuration.keys))
+        if not keys:
+            return {}
+
+        workers = max(1, min(configuration.concurrency or self.settings.connections, len(keys)))
+
+        # --> a single (thread-safe) client is shared by every read, rather than constructing one per object.
+        client = self.client
+
+        # --> upon a failure, the reads that haven't yet started are cancelled.
+        views = example.api.pools.execute(self._read, [(client, bucket_name, key) for key in keys], workers, ordered=True, name="example-s3-read")
+
+        return dict(zip(keys, views))
+
+    def write_bytes(self, configuration: example.api.types.S3.Write) -> int:
+        """
+        Writes a bytes-like object (e.g. `bytes`, `bytearray` or a `memoryview`) to an object, without an
+        intermediate file, or a copy of the data.
+
+        Returns
+        -------
+        int
+            The number of bytes written.
+        """
+
+        bucket_name, data, extra_arguments = configuration.bucket_name, configuration.data, configuration.extra_arguments
+
+        with disable_ssl_warnings(), example.api.metrics.timer("s3.write", bucket=bucket_name) as measurement:
+            key = configuration.key.removeprefix("/")
+
+            # --> bytes and bytearray objects are sent as-is; other buffers are read (and re-read upon retries) in place.
+            body = data if isinstance(data, (bytes, bytearray)) else Buffer(data)
+
+            size = memoryview(data).nbytes
+
+            logger.debug("Attempting to Write %d Byte(s) to \"%s\" in \"%s\"", size, key, bucket_name)
+
+            self.client.put_object(Bucket=bucket_name, Key=key, Body=body, **(extra_arguments or {}))
+
+            measurement.bytes, measurement.direction = size, "upload"
+
+            return size
+
     def delete(self, configuration: example.api.types.S3.Delete):
-        with disable_ssl_warnings():
+        with disable_ssl_warnings(), example.api.metrics.timer("s3.delete", bucket=configuration.bucket_name):
             key = configuration.key
             bucket_name = configuration.bucket_name
 
             logger.debug("Attempting to Delete \"%s\" from \"%s\"", key, bucket_name)
 
             self.client.delete_object(Bucket=bucket_name, Key=key.removeprefix("/"))
+
+    def purge(self, configuration: example.api.types.S3.Purge) -> typing.Iterator[typing.Tuple[str, typing.Optional[str]]]:
+        """
+        Deletes many objects using batched (up to 1000 keys per request) delete requests.
+
+        Parameters
+        ----------
+        configuration : example.api.types.S3.Purge
+            The bucket, and the keys to delete.
+
+        Yields
+        ------
+        tuple of (str, str or None)
+            Each key, alongside its error message (None if the object was deleted).
+        """
+
+        client = self.client
+
+        bucket_name = configuration.bucket_name
+
+        keys = iter(configuration.keys)
+
+        while True:
+            batch = [key.removeprefix("/") for _, key in zip(range(1000), keys)]
+            if not batch:
+                return
+
+            logger.debug("Attempting to Delete %d Object(s) from \"%s\"", len(batch), bucket_name)
+
+            with disable_ssl_warnings(), example.api.metrics.timer("s3.purge", bucket=bucket_name):
+                response = client.delete_objects(Bucket=bucket_name, Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True})
+
+            errors = {error["Key"]: "{}: {}".format(error.get("Code"), error.get("Message")) for error in response.get("Errors", [])}
+
+            for key in batch:
+                yield key, errors.get(key)
@@ -4,6 +4,7 @@ import os
 import logging
 
 import example.api.aws
+import example.api.types
 
 logger = logging.getLogger(__name__)
 
@@ -68,3 +69,164 @@ def test_sts_client():
     instance = example.api.aws.STS()
 
     assert instance.client is not None
+
+@pytest.mark.description("Unit-Test that verifies single-request and multipart server-side copies.")
+def test_s3_copy(s3, bucket):
+    client = s3.client
+
+    body = os.urandom(11 * 1024 * 1024 + 7)
+
+    client.put_object(Bucket=bucket, Key="source/small.txt", Body=b"small", ContentType="text/plain", Metadata={"owner": "example"})
+    client.put_object(Bucket=bucket, Key="source/large.bin", Body=body, ContentType="application/octet-stream", Metadata={"owner": "example"})
+
+    key, size = s3.copy(example.api.types.S3.Copy(source_bucket=bucket, source_key="source/small.txt", bucket_name=bucket, key="destination/small.txt"))
+
+    assert (key, size) == ("destination/small.txt", 5)
+    assert client.get_object(Bucket=bucket, Key=key)["Body"].read() == b"small"
+
+    key, size = s3.copy(example.api.types.S3.Copy(source_bucket=bucket, source_key="source/large.bin", bucket_name=bucket, key="destination/large.bin", chunk_size=5 * 1024 * 1024, concurrency=3))
+
+    assert size == len(body)
+
+    response = client.get_object(Bucket=bucket, Key=key)
+
+    assert response["Body"].read() == body
+    assert response["ETag"].strip("\"").endswith("-3")
+    assert response["ContentType"] == "application/octet-stream"
+    assert response["Metadata"] == {"owner": "example"}
+
+    assert client.list_multipart_uploads(Bucket=bucket).get("Uploads", []) == []
+
+    # --> extra arguments override the inherited metadata alike, whether the copy is a single request or multipart.
+    for source, chunk in (("source/small.txt", None), ("source/large.bin", 5 * 1024 * 1024)):
+        key, _ = s3.copy(example.api.types.S3.Copy(source_bucket=bucket, source_key=source, bucket_name=bucket, key="replaced/" + source, chunk_size=chunk, extra_arguments={"Metadata": {"stage": "release"}}))
+
+        response = client.head_object(Bucket=bucket, Key=key)
+
+        assert response["Metadata"] == {"stage": "release"}
+        assert response["ContentType"] == client.head_object(Bucket=bucket, Key=source)["ContentType"]
+
+@pytest.mark.description("Unit-Test that verifies bulk server-side copies of a prefix into another bucket.")
+def test_s3_replicate(s3, bucket):
+    client = s3.client
+
+    client.create_bucket(Bucket="example-destination", CreateBucketConfiguration={"LocationConstraint": "us-east-2"})
+
+    for key in ("build/1/app.whl", "build/1/app.tar.gz", "build/1/logs/output.log", "build/2/app.whl", "build/10/app.whl"):
+        client.put_object(Bucket=bucket, Key=key, Body=key.encode())
+
+    configuration = example.api.types.S3.Replicate(source_bucket=bucket, source_prefix="build/1/", bucket_name="example-destination", prefix="release/", pattern="app.*", concurrency=4)
+
+    results = sorted(s3.replicate(configuration))
+
+    assert results == [("build/1/app.tar.gz", "release/app.tar.gz", None), ("build/1/app.whl", "release/app.whl", None)]
+
+    assert [item["Key"] for item in s3.list(example.api.types.S3.List(key="", bucket_name="example-destination"))] == ["release/app.tar.gz", "release/app.whl"]
+    assert client.get_object(Bucket="example-destination", Key="release/app.whl")["Body"].read() == b"build/1/app.whl"
+
+    # --> prefixes without a trailing "/" are "/"-terminated, rather than matching (and rewriting) "build/10/".
+    configuration = example.api.types.S3.Replicate(source_bucket=bucket, source_prefix="build/1", bucket_name="example-destination", prefix="unterminated", pattern="app.*")
+
+    assert sorted(s3.replicate(configuration)) == [("build/1/app.tar.gz", "unterminated/app.tar.gz", None), ("build/1/app.whl", "unterminated/app.whl", None)]
+
+@pytest.mark.description("Unit-Test that verifies in-memory reads and writes of bytes-like objects.")
+def test_s3_bytes(s3, bucket):
+    Read, Write = example.api.types.S3.Read, example.api.types.S3.Write
+
+    assert s3.write_bytes(Write(key="memory/bytes.json", bucket_name=bucket, data=b"{\"a\": 1}", extra_arguments={"ContentType": "application/json"})) == 8
+    assert s3.write_bytes(Write(key="memory/bytearray.bin", bucket_name=bucket, data=bytearray(b"0123"))) == 4
+
+    data = memoryview(bytearray(os.urandom(3 * 1024 * 1024)))
+
+    assert s3.write_bytes(Write(key="memory/view.bin", bucket_name=bucket, data=data[1024:])) == len(data) - 1024
+
+    view = s3.read_bytes(Read(key="memory/view.bin", bucket_name=bucket))
+
+    assert isinstance(view, memoryview)
+    assert view == data[1024:]
+
+    assert bytes(s3.read_bytes(Read(key="memory/bytes.json", bucket_name=bucket))) == b"{\"a\": 1}"
+    assert s3.client.head_object(Bucket=bucket, Key="memory/bytes.json")["ContentType"] == "application/json"
+
+    s3.write_bytes(Write(key="memory/empty.bin", bucket_name=bucket, data=b""))
+    assert len(s3.read_bytes(Read(key="memory/empty.bin", bucket_name=bucket))) == 0
+
+@pytest.mark.description("Unit-Test that verifies concurrent reads of many small objects.")
+def test_s3_read_all(s3, bucket):
+    client = s3.client
+
+    keys = ["manifests/{:03d}.json".format(index) for index in range(50)]
+
+    for key in keys:
+        client.put_object(Bucket=bucket, Key=key, Body=key.encode())
+
+    contents = s3.read_all(example.api.types.S3.ReadAll(bucket_name=bucket, keys=reversed(keys), concurrency=8))
+
+    assert list(contents) == keys[::-1]
+    assert all(bytes(contents[key]) == key.encode() for key in keys)
+
+    assert s3.read_all(example.api.types.S3.ReadAll(bucket_name=bucket, keys=[])) == {}
+
+    with pytest.raises(Exception):
+        s3.read_all(example.api.types.S3.ReadAll(bucket_name=bucket, keys=keys + ["manifests/missing.json"]))
+
+@pytest.mark.description("Unit-Test that verifies streams are read to their end, and that unexpected lengths are detected.")
+def test_readinto():
+    import io
+
+    view = memoryview(bytearray(4))
+
+    assert example.api.aws.readinto(io.BytesIO(b"0123"), view) == 4
+    assert bytes(view) == b"0123"
+
+    assert example.api.aws.readinto(io.BytesIO(b"01"), memoryview(bytearray(4))) == 2
+
+    with pytest.raises(RuntimeError):
+        example.api.aws.readinto(io.BytesIO(b"012345"), memoryview(bytearray(4)))
+
+@pytest.mark.description("Unit-Test that verifies locally computed ETags match those of objects uploaded via each upload path.")
+def test_s3_unchanged(s3, bucket, tmp_path):
+    MiB = 1024 * 1024
+
+    source = tmp_path.joinpath("source.bin")
+    source.write_bytes(os.urandom(12 * MiB))
+
+    for options in ({}, {"chunk_size": 5 * MiB}, {"chunk_size": 5 * MiB, "verify": True}, {"chunk_size": 5 * MiB, "resume": True}, {"chunk_size": 16 * MiB}):
+        configuration = example.api.types.S3.Upload(key="unchanged.bin", bucket_name=bucket, source=source, progress=False, **options)
+
+        s3.upload(configuration)
+
+        assert s3.unchanged(configuration), options
+
+    # --> an object of a different part size, or of different content, is changed.
+    assert not s3.unchanged(example.api.types.S3.Upload(key="unchanged.bin", bucket_name=bucket, source=source, chunk_size=5 * MiB))
+
+    with open(source, "r+b") as file:
+        file.write(b"\0")
+
+    assert not s3.unchanged(configuration)
+    assert not s3.unchanged(example.api.types.S3.Upload(key="missing.bin", bucket_name=bucket, source=source))
+
+@pytest.mark.description("Unit-Test that verifies unchanged uploads are skipped, individually and when publishing a directory.")
+def test_s3_publish(s3, bucket, tmp_path, monkeypatch):
+    source = tmp_path.joinpath("site")
+    source.joinpath("assets").mkdir(parents=True)
+    source.joinpath("index.html").write_text("<html></html>")
+    source.joinpath("assets", "app.js").write_text("console.log(1);")
+
+    configuration = example.api.types.S3.Publish(source=source, bucket_name=bucket, prefix="site/", concurrency=4)
+
+    assert sorted((key, uploaded, error) for _, key, uploaded, error in s3.publish(configuration)) == [("site/assets/app.js", True, None), ("site/index.html", True, None)]
+    assert [uploaded for *_, uploaded, _ in s3.publish(configuration)] == [False, False]
+
+    source.joinpath("index.html").write_text("<html>changed</html>")
+
+    assert sorted((key, uploaded) for _, key, uploaded, _ in s3.publish(configuration)) == [("site/assets/app.js", False), ("site/index.html", True)]
+
+    uploads = []
+    monkeypatch.setattr(example.api.aws.S3, "_upload", lambda self, configuration: uploads.append(configuration.key))
+
+    upload = example.api.types.S3.Upload(key="site/index.html", bucket_name=bucket, source=source.joinpath("index.html"), skip_unchanged=True)
+
+    assert s3.upload(upload) == ("site/index.html", len("<html>changed</html>"))
+    assert uploads == []
@@ -0,0 +1,553 @@
+"""
+Persistent, host-local cache(s) for S3 metadata and objects.
+
+`Listings` stores object listings (key, size, ETag and modification time) in SQLite, keyed by bucket and prefix.
+Lookups under an already-listed prefix are answered locally (including for narrower, nested prefixes), and, once a
+listing is older than its TTL, it's refreshed incrementally: only keys sorting after the last-seen key are requested,
+via `StartAfter`.
+
+    listings = Listings(ttl=300)
+
+    contents = listings.list(s3, example.api.types.S3.List(key="logs/2025/", bucket_name="example-bucket"))
+
+Incremental refreshes observe new keys sorting after the listing's last key, which suits append-only prefixes (e.g.
+date or sequence-ordered keys). Overwritten or deleted keys are only observed upon a full refresh (`full=True`) or
+after `invalidate`.
+
+`Objects` is a content-addressed cache of downloaded objects, keyed by bucket, key and ETag, shared by every process on
+the host. Concurrent fetches of the same object coalesce into a single transfer, and cached objects are delivered into
+the caller's directory as hard links (or reflinks, or copies) rather than being downloaded again.
+
+    objects = Objects(budget=10 * 1024 ** 3)
+
+    path = s3.download(example.api.types.S3.Download(key="model.bin", bucket_name="example-bucket", directory=None, cache=objects))
+"""
+
+import os
+import time
+import typing
+import hashlib
+import logging
+import pathlib
+import sqlite3
+import tempfile
+import threading
+import contextlib
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platform(s)
+    fcntl = None
+
+import example.api.aws
+import example.api.types
+import example.api.integrity
+import example.api.metrics
+import example.api.patterns
+import example.api.listings
+import example.utilities.systems
+
+logger = logging.getLogger(__name__)
+
+def bounds(prefix: str) -> typing.Tuple[str, tuple]:
+    """
+    Returns a SQL condition (and its parameters) matching keys beginning with the prefix.
+    """
+
+    upper = example.api.listings.successor(prefix)
+    if upper is None:
+        return "key >= ?", (prefix,)
+
+    return "key >= ? AND key < ?", (prefix, upper)
+
+class Listings:
+    """
+    A persistent, SQLite-backed cache of S3 object listings.
+
+    Instances are thread-safe, and the underlying database may be shared between processes.
+
+    Parameters
+    ----------
+    path : os.PathLike | str, optional
+        The database's file path. Defaults to "example-s3-listings.sqlite3" in the temporary directory.
+    ttl : float
+        The number of seconds a listing is served without a (incremental) refresh.
+    """
+
+    schema = """
+    CREATE TABLE IF NOT EXISTS objects (
+        bucket TEXT NOT NULL,
+        key TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        etag TEXT,
+        modified REAL NOT NULL,
+        PRIMARY KEY (bucket, key)
+    ) WITHOUT ROWID;
+
+    CREATE TABLE IF NOT EXISTS prefixes (
+        bucket TEXT NOT NULL,
+        prefix TEXT NOT NULL,
+        refreshed REAL NOT NULL,
+        last TEXT,
+        PRIMARY KEY (bucket, prefix)
+    ) WITHOUT ROWID;
+    """
+
+    def __init__(self, path: typing.Optional[os.PathLike | str] = None, ttl: float = 300.0):
+        self.path = os.fspath(path) if path is not None else os.path.join(tempfile.gettempdir(), "example-s3-listings.sqlite3")
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+
+        self._connection = sqlite3.connect(self.path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(self.schema)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "Listings":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+        return False
+
+    def covering(self, bucket_name: str, prefix: str) -> typing.Optional[typing.Tuple[str, float, typing.Optional[str]]]:
+        """
+        Returns the most specific cached prefix covering the given prefix, alongside its refresh time and last key.
+        """
+
+        with self._lock:
+            return self._connection.execute(
+                "SELECT prefix, refreshed, last FROM prefixes WHERE bucket = ? AND substr(?, 1, length(prefix)) = prefix ORDER BY length(prefix) DESC LIMIT 1",
+                (bucket_name, prefix)
+            ).fetchone()
+
+    def query(self, bucket_name: str, prefix: str = "", start_after: typing.Optional[str] = None) -> typing.List[dict]:
+        """
+        Returns the cached objects under a prefix, without any network requests, in `S3.list`'s format.
+        """
+
+        condition, parameters = bounds(prefix)
+        if start_after is not None:
+            condition, parameters = condition + " AND key > ?", parameters + (start_after,)
+
+        with self._lock:
+            rows = self._connection.execute("SELECT key, size, etag, modified FROM objects WHERE bucket = ? AND " + condition + " ORDER BY key", (bucket_name,) + parameters).fetchall()
+
+        return [{"Key": key, "Size": size, "ETag": etag, "LastModified": modified} for key, size, etag, modified in rows]
+
+    def list(self, s3, configuration: example.api.types.S3.List, full: bool = False) -> typing.List[dict]:
+        """
+        Lists the objects under a prefix, serving the listing locally whenever a fresh, covering listing is cached.
+
+        Parameters
+        ----------
+        s3 : example.api.aws.S3
+            The S3 instance used for (incremental) refreshes.
+        configuration : example.api.types.S3.List
+            The listing's bucket, key prefix and (optional) pattern.
+        full : bool
+            Whether to discard any cached listing for the prefix, and list it in full.
+
+        Returns
+        -------
+        list of dict
+            The objects' listing entries, sorted by key, in `S3.list`'s format.
+        """
+
+        bucket_name = configuration.bucket_name
+        prefix = configuration.key.removeprefix("/")
+
+        cached = None if full else self.covering(bucket_name, prefix)
+
+        if cached is None:
+            logger.debug("Listing Cache Miss (s3://%s/%s) - Performing a Full Listing", bucket_name, prefix)
+
+            self.refresh(s3, bucket_name, prefix, full=True)
+        elif time.time() - cached[1] >= self.ttl:
+            logger.debug("Listing Cache Expired (s3://%s/%s) - Refreshing After \"%s\"", bucket_name, cached[0], cached[2])
+
+            self.refresh(s3, bucket_name, cached[0], full=False)
+        else:
+            logger.debug("Listing Cache Hit (s3://%s/%s)", bucket_name, prefix)
+
+        if configuration.pattern is None:
+            return self.query(bucket_name, prefix, configuration.start_after)
+
+        # --> cached listings are complete for their prefix; patterns are matched locally, rather than pruned.
+        matcher = example.api.patterns.Matcher(prefix, configuration.pattern)
+
+        return [item for item in self.query(bucket_name, matcher.literal, configuration.start_after) if matcher(item["Key"])]
+
+    def refresh(self, s3, bucket_name: str, prefix: str, full: bool = False) -> int:
+        """
+        Refreshes a prefix's cached listing, either in full or incrementally (after the last-seen key).
+
+        Returns
+        -------
+        int
+            The number of listed objects.
+        """
+
+        cached = None if full else self.covering(bucket_name, prefix)
+        last = cached[2] if cached is not None and cached[0] == prefix else None
+
+        started = time.time()
+
+        # --> the listing is requested before the write transaction begins, such that readers aren't blocked by the network.
+        items = s3.iterate(example.api.types.S3.List(key=prefix, bucket_name=bucket_name, start_after=last))
+
+        rows = [(bucket_name, item["Key"], item["Size"], item.get("ETag", "").strip("\""), item["LastModified"]) for item in items]
+
+        with self._lock:
+            connection = self._connection
+
+            connection.execute("BEGIN IMMEDIATE")
+
+            try:
+                if last is None:
+                    condition, parameters = bounds(prefix)
+
+                    connection.execute("DELETE FROM objects WHERE bucket = ? AND " + condition, (bucket_name,) + parameters)
+                    # --> narrower listings are superseded by (and now covered by) this listing.
+                    connection.execute("DELETE FROM prefixes WHERE bucket = ? AND substr(prefix, 1, ?) = ?", (bucket_name, len(prefix), prefix))
+
+                connection.executemany("INSERT OR REPLACE INTO objects (bucket, key, size, etag, modified) VALUES (?, ?, ?, ?, ?)", rows)
+
+                connection.execute("INSERT OR REPLACE INTO prefixes (bucket, prefix, refreshed, last) VALUES (?, ?, ?, ?)", (bucket_name, prefix, started, rows[-1][1] if rows else last))
+
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+
+                raise
+
+        logger.debug("Refreshed Listing Cache (s3://%s/%s) - %s Object(s): %d", bucket_name, prefix, "Listed" if last is None else "New", len(rows))
+
+        return len(rows)
+
+    def invalidate(self, bucket_name: str, prefix: str = "") -> None:
+        """
+        Discards the cached listings (and objects) under a prefix.
+        """
+
+        condition, parameters = bounds(prefix)
+
+        with self._lock:
+            connection = self._connection
+
+            connection.execute("BEGIN IMMEDIATE")
+
+            try:
+                connection.execute("DELETE FROM objects WHERE bucket = ? AND " + condition, (bucket_name,) + parameters)
+                # --> broader listings covering the prefix are no longer complete, and are discarded as well.
+                connection.execute("DELETE FROM prefixes WHERE bucket = ? AND (substr(prefix, 1, ?) = ? OR substr(?, 1, length(prefix)) = prefix)", (bucket_name, len(prefix), prefix, prefix))
+
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+
+                raise
+
+Delivery = typing.Literal["link", "reflink", "copy"]
+"""
+The preferred means of delivering a cached object into the caller's directory:
+
+- "link": a hard link (falling back to a reflink, then a copy, e.g. across file-systems). Hard links share the cached
+  object's inode, and are therefore read-only.
+- "reflink": a copy-on-write clone (falling back to a copy) on supporting file-systems (e.g. Btrfs, XFS).
+- "copy": a full copy.
+"""
+
+deliveries: typing.Tuple[str, ...] = typing.get_args(Delivery)
+
+FICLONE = 0x40049409
+"""
+Linux's FICLONE ioctl request, cloning (reflinking) one file's extents into another.
+"""
+
+class Objects:
+    """
+    A shared, content-addressed, on-disk cache of S3 objects, with a size budget and least-recently-used eviction.
+
+    Objects are stored read-only, named by the SHA-256 digest of their bucket, key and ETag, such that a changed object
+    is never served stale. Fetches of the same object are serialized by an exclusive `flock`, so concurrent workers
+    (threads or processes) coalesce into a single transfer; eviction skips objects that are being fetched or delivered.
+
+    Parameters
+    ----------
+    directory : os.PathLike | str, optional
+        The cache's directory. Defaults to "example-s3-objects" in the temporary directory.
+    budget : int, optional
+        The maximum total size (in bytes) of cached objects. Unbounded if None.
+    delivery : Delivery
+        The preferred means of delivering cached objects (see `Delivery`).
+    """
+
+    schema = """
+    CREATE TABLE IF NOT EXISTS entries (
+        digest TEXT NOT NULL PRIMARY KEY,
+        bucket TEXT NOT NULL,
+        key TEXT NOT NULL,
+        etag TEXT NOT NULL,
+        size INTEGER NOT NULL,
+        accessed REAL NOT NULL
+    ) WITHOUT ROWID;
+
+    CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+    """
+
+    def __init__(self, directory: typing.Optional[os.PathLike | str] = None, budget: typing.Optional[int] = None, delivery: Delivery = "link"):
+        if delivery not in deliveries:
+            raise ValueError("Invalid Delivery: {}. Valid Deliveries: {}".format(delivery, ", ".join(deliveries)))
+
+        self.directory = pathlib.Path(directory) if directory is not None else pathlib.Path(tempfile.gettempdir(), "example-s3-objects")
+        self.budget = budget
+        self.delivery = delivery
+
+        for name in ("objects", "locks", "partial"):
+            os.makedirs(self.directory.joinpath(name), exist_ok=True)
+
+        self._lock = threading.Lock()
+
+        self._connection = sqlite3.connect(self.directory.joinpath("index.sqlite3"), timeout=30, isolation_level=None, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(self.schema)
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> "Objects":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+        return False
+
+    @staticmethod
+    def digest(bucket_name: str, key: str, etag: str) -> str:
+        return hashlib.sha256("\0".join((bucket_name, key, etag)).encode("utf-8")).hexdigest()
+
+    def path(self, digest: str) -> pathlib.Path:
+        """
+        Returns a cached object's path, beneath a two-character fan-out directory.
+        """
+
+        return self.directory.joinpath("objects", digest[:2], digest)
+
+    @contextlib.contextmanager
+    def locked(self, digest: str, blocking: bool = True) -> typing.Iterator[bool]:
+        """
+        Holds an exclusive, cross-process lock for a cached object, yielding whether the lock was acquired.
+
+        Locks are striped across 256 lock files (by the digest's first two characters), which are never removed,
+        such that every process always contends on the same inode.
+        """
+
+        if fcntl is None:
+            yield True
+            return
+
+        with open(self.directory.joinpath("locks", digest[:2] + ".lock"), "a+b") as file:
+            try:
+                fcntl.flock(file.fileno(), fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+            except BlockingIOError:
+                yield False
+                return
+
+            try:
+                yield True
+            finally:
+                fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+
+    def usage(self) -> int:
+        """
+        The total size, in bytes, of the cached objects.
+        """
+
+        with self._lock:
+            return self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def fetch(self, s3, configuration: example.api.types.S3.Download) -> pathlib.Path:
+        """
+        Delivers an object into the configuration's directory, downloading it into the cache only if it's not already cached.
+
+        Parameters
+        ----------
+        s3 : example.api.aws.S3
+            The S3 instance used to resolve the object's ETag, and download it upon a cache miss.
+        configuration : example.api.types.S3.Download
+            The download's key, bucket, and destination directory (a new temporary directory if None).
+
+        Returns
+        -------
+        pathlib.Path
+            Local filesystem path to the delivered file.
+        """
+
+        bucket_name = configuration.bucket_name
+        key = configuration.key.removeprefix("/")
+
+        client = s3.client
+
+        with example.api.aws.disable_ssl_warnings():
+            response = client.head_object(Bucket=bucket_name, Key=key, **({"ChecksumMode": "ENABLED"} if configuration.verify else {}))
+
+        etag = response["ETag"]
+        digest = self.digest(bucket_name, key, etag.strip("\""))
+
+        cached = self.path(digest)
+
+        with self.locked(digest):
+            hit = cached.exists()
+
+            if hit:
+                logger.debug("Object Cache Hit (s3://%s/%s): %s", bucket_name, key, cached)
+            else:
+                logger.debug("Object Cache Miss (s3://%s/%s) - Downloading %d Byte(s)", bucket_name, key, response["ContentLength"])
+
+                self._download(client, configuration, key, response, cached)
+
+            target = self._deliver(cached, configuration.directory, os.path.basename(key))
+
+            with self._lock:
+                self._connection.execute(
+                    "INSERT INTO entries (digest, bucket, key, etag, size, accessed) VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (digest) DO UPDATE SET accessed = excluded.accessed",
+                    (digest, bucket_name, key, etag.strip("\""), response["ContentLength"], time.time())
+                )
+
+        if example.api.metrics.enabled():
+            example.api.metrics.sink.increment("example_aws_cache_requests_total", 1, example.api.metrics.normalize({"bucket": bucket_name, "result": "hit" if hit else "miss"}))
+
+        if not hit:
+            self.enforce()
+
+        return target
+
+    def _download(self, client, configuration: example.api.types.S3.Download, key: str, response: dict, cached: pathlib.Path) -> None:
+        os.makedirs(cached.parent, exist_ok=True)
+
+        # --> pin the transfer to the resolved version, where available, such that the content matches the cached ETag.
+        version = response.get("VersionId")
+        arguments = {"VersionId": version} if version and version != "null" else {}
+
+        partial = self.directory.joinpath("partial", "{}.{}.{}".format(cached.name, os.getpid(), threading.get_ident()))
+
+        # --> with `configuration.verify`, the object is verified as it's written, before it's ever cached.
+        digests = example.api.integrity.Digests.expecting(client, configuration.bucket_name, key, response) if configuration.verify else None
+
+        try:
+            with example.api.aws.disable_ssl_warnings(), example.api.metrics.timer("s3.download", bucket=configuration.bucket_name) as measurement:
+                with open(partial, "wb") as file:
+                    client.download_fileobj(configuration.bucket_name, key, file if digests is None else example.api.integrity.Writer(file, digests), ExtraArgs=arguments, Config=example.api.aws.transfer(configuration.chunk_size, configuration.concurrency))
+
+                measurement.bytes, measurement.direction = os.path.getsize(partial), "download"
+
+                if digests is not None:
+                    digests.verify(response, key)
+
+                # --> otherwise (i.e. unversioned buckets), verify the object wasn't overwritten during the transfer.
+                if not arguments and client.head_object(Bucket=configuration.bucket_name, Key=key)["ETag"] != response["ETag"]:
+                    raise RuntimeError("S3 Object Changed During Download: s3://{}/{}".format(configuration.bucket_name, key))
+
+            os.chmod(partial, 0o444)
+            os.replace(partial, cached)
+        finally:
+            partial.unlink(missing_ok=True)
+
+    def _deliver(self, source: pathlib.Path, directory: typing.Optional[os.PathLike | str], name: str) -> pathlib.Path:
+        if directory is None:
+            directory = tempfile.mkdtemp(prefix="{}-".format("aws-s3-bucket-objects"))
+        else:
+            os.makedirs(directory, exist_ok=True)
+
+        target = pathlib.Path(os.fspath(directory), name)
+
+        # --> never write through an existing target, which may itself be a hard link to a cached object.
+        if os.path.lexists(target):
+            os.unlink(target)
+
+        methods = deliveries[deliveries.index(self.delivery):]
+
+        for method in methods:
+            try:
+                if method == "link":
+                    os.link(source, target)
+                elif method == "reflink":
+                    if fcntl is None:
+                        continue
+
+                    with open(source, "rb") as reader, open(target, "wb") as writer:
+                        fcntl.ioctl(writer.fileno(), FICLONE, reader.fileno())
+
+                    os.chmod(target, 0o644)
+                else:
+                    example.utilities.systems.File(source).copy(target)
+
+                    os.chmod(target, 0o644)
+            except OSError as e:
+                logger.debug("Unable to Deliver Cached Object via \"%s\" (%s) - Falling Back", method, e)
+
+                if method != "link" and os.path.lexists(target):
+                    os.unlink(target)
+
+                if method == methods[-1]:
+                    raise
+
+                continue
+
+            logger.debug("Delivered Cached Object via \"%s\": %s", method, target)
+
+            return target
+
+    def enforce(self) -> int:
+        """
+        Evicts least-recently-used objects until the cache's total size is within its budget.
+
+        Objects locked by another fetch (or delivery) are skipped. Previously delivered hard links remain valid.
+
+        Returns
+        -------
+        int
+            The number of evicted objects.
+        """
+
+        if self.budget is None:
+            return 0
+
+        with self._lock:
+            total = self._connection.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+            if total <= self.budget:
+                return 0
+
+            candidates = self._connection.execute("SELECT digest, size FROM entries ORDER BY accessed").fetchall()
+
+        evicted = 0
+
+        for digest, size in candidates:
+            if total <= self.budget:
+                break
+
+            with self.locked(digest, blocking=False) as acquired:
+                if not acquired:
+                    continue
+
+                self.path(digest).unlink(missing_ok=True)
+
+                with self._lock:
+                    self._connection.execute("DELETE FROM entries WHERE digest = ?", (digest,))
+
+            total -= size
+            evicted += 1
+
+        logger.debug("Evicted %d Cached Object(s) - Total Size: %d Byte(s), Budget: %d Byte(s)", evicted, total, self.budget)
+
+        return evicted
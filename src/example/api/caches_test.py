@@ -0,0 +1,183 @@
+import logging
+import concurrent.futures
+
+import pytest
+
+import example.api.types
+import example.api.caches
+import example.api.metrics
+
+logger = logging.getLogger(__name__)
+
+@pytest.fixture()
+def sink():
+    instance = example.api.metrics.Memory()
+
+    example.api.metrics.configure(instance)
+
+    yield instance
+
+    example.api.metrics.configure(None)
+
+def put(s3, bucket: str, *keys: str) -> None:
+    client = s3.client
+
+    for key in keys:
+        client.put_object(Bucket=bucket, Key=key, Body=key.encode())
+
+class Recorder:
+    """
+    Wraps an S3 instance, recording each listing's configuration.
+    """
+
+    def __init__(self, s3):
+        self.s3 = s3
+        self.configurations = []
+
+    def iterate(self, configuration: example.api.types.S3.List):
+        self.configurations.append(configuration)
+
+        return self.s3.iterate(configuration)
+
+def requests(sink: example.api.metrics.Memory, bucket: str) -> float:
+    return sink.counter("example_aws_operations_total", operation="s3.list", bucket=bucket)
+
+@pytest.mark.description("Unit-Test that verifies fresh listings, and nested prefixes, are served without network requests.")
+def test_listings_cache_hit(s3, bucket, sink, tmp_path):
+    put(s3, bucket, "logs/a.txt", "logs/nested/b.txt", "other/c.txt")
+
+    with example.api.caches.Listings(tmp_path.joinpath("listings.sqlite3"), ttl=3600) as listings:
+        contents = listings.list(s3, example.api.types.S3.List(key="logs/", bucket_name=bucket))
+
+        assert [item["Key"] for item in contents] == ["logs/a.txt", "logs/nested/b.txt"]
+        assert contents[0]["Size"] == len("logs/a.txt")
+        assert requests(sink, bucket) == 1
+
+        nested = listings.list(s3, example.api.types.S3.List(key="logs/nested/", bucket_name=bucket))
+
+        assert [item["Key"] for item in nested] == ["logs/nested/b.txt"]
+        assert requests(sink, bucket) == 1
+
+    # --> the cache persists across instances (and processes).
+    with example.api.caches.Listings(tmp_path.joinpath("listings.sqlite3"), ttl=3600) as listings:
+        listings.list(s3, example.api.types.S3.List(key="logs/", bucket_name=bucket))
+
+        assert requests(sink, bucket) == 1
+
+@pytest.mark.description("Unit-Test that verifies expired listings are refreshed incrementally, after the last-seen key.")
+def test_listings_incremental_refresh(s3, bucket, tmp_path):
+    put(s3, bucket, "logs/0001.txt", "logs/0002.txt")
+
+    with example.api.caches.Listings(tmp_path.joinpath("listings.sqlite3"), ttl=0) as listings:
+        listings.list(s3, example.api.types.S3.List(key="logs/", bucket_name=bucket))
+
+        put(s3, bucket, "logs/0003.txt")
+
+        recorder = Recorder(s3)
+
+        listings.list(recorder, example.api.types.S3.List(key="logs/", bucket_name=bucket))
+
+        assert [configuration.start_after for configuration in recorder.configurations] == ["logs/0002.txt"]
+
+        contents = listings.query(bucket, "logs/")
+
+        assert [item["Key"] for item in contents] == ["logs/0001.txt", "logs/0002.txt", "logs/0003.txt"]
+
+@pytest.mark.description("Unit-Test that verifies full refreshes and invalidation observe deleted keys.")
+def test_listings_invalidate(s3, bucket, tmp_path):
+    put(s3, bucket, "logs/a.txt", "logs/b.txt")
+
+    with example.api.caches.Listings(tmp_path.joinpath("listings.sqlite3"), ttl=3600) as listings:
+        listings.list(s3, example.api.types.S3.List(key="logs/", bucket_name=bucket))
+
+        s3.client.delete_object(Bucket=bucket, Key="logs/a.txt")
+
+        assert len(listings.list(s3, example.api.types.S3.List(key="logs/", bucket_name=bucket))) == 2
+        assert len(listings.list(s3, example.api.types.S3.List(key="logs/", bucket_name=bucket), full=True)) == 1
+
+        listings.invalidate(bucket, "logs/b.txt")
+
+        assert listings.covering(bucket, "logs/") is None
+        assert listings.query(bucket, "logs/") == []
+
+@pytest.mark.description("Unit-Test that verifies listing from a start-after key, both remotely and locally.")
+def test_start_after(s3, bucket, tmp_path):
+    put(s3, bucket, "logs/a.txt", "logs/b.txt", "logs/c.txt")
+
+    configuration = example.api.types.S3.List(key="logs/", bucket_name=bucket, start_after="logs/a.txt")
+
+    assert [item["Key"] for item in s3.list(configuration)] == ["logs/b.txt", "logs/c.txt"]
+
+    with example.api.caches.Listings(tmp_path.joinpath("listings.sqlite3")) as listings:
+        assert [item["Key"] for item in listings.list(s3, configuration)] == ["logs/b.txt", "logs/c.txt"]
+
+def downloads(sink: example.api.metrics.Memory, bucket: str) -> float:
+    return sink.counter("example_aws_operations_total", operation="s3.download", bucket=bucket)
+
+@pytest.mark.description("Unit-Test that verifies cached objects are delivered as hard links without re-downloading.")
+def test_objects_cache_hit(s3, bucket, sink, tmp_path):
+    put(s3, bucket, "data/object.bin")
+
+    with example.api.caches.Objects(tmp_path.joinpath("cache")) as objects:
+        first = s3.download(example.api.types.S3.Download(key="data/object.bin", bucket_name=bucket, directory=tmp_path.joinpath("first"), cache=objects))
+        second = s3.download(example.api.types.S3.Download(key="data/object.bin", bucket_name=bucket, directory=tmp_path.joinpath("second"), cache=objects))
+
+        assert downloads(sink, bucket) == 1
+        assert sink.counter("example_aws_cache_requests_total", bucket=bucket, result="hit") == 1
+
+        assert first.read_bytes() == second.read_bytes() == b"data/object.bin"
+        assert first.stat().st_ino == second.stat().st_ino
+        assert first.stat().st_nlink == 3
+
+        # --> a changed object (i.e. a new ETag) is never served stale.
+        s3.client.put_object(Bucket=bucket, Key="data/object.bin", Body=b"changed")
+
+        third = s3.download(example.api.types.S3.Download(key="data/object.bin", bucket_name=bucket, directory=tmp_path.joinpath("second"), cache=objects))
+
+        assert downloads(sink, bucket) == 2
+        assert third.read_bytes() == b"changed"
+        assert first.read_bytes() == b"data/object.bin"
+
+@pytest.mark.description("Unit-Test that verifies concurrent fetches of the same object coalesce into a single transfer.")
+def test_objects_coalescing(s3, bucket, sink, tmp_path):
+    put(s3, bucket, "data/object.bin")
+
+    with example.api.caches.Objects(tmp_path.joinpath("cache")) as objects:
+        def fetch(index: int):
+            return objects.fetch(s3, example.api.types.S3.Download(key="data/object.bin", bucket_name=bucket, directory=tmp_path.joinpath(str(index))))
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            paths = list(executor.map(fetch, range(8)))
+
+        assert downloads(sink, bucket) == 1
+        assert all(path.read_bytes() == b"data/object.bin" for path in paths)
+
+@pytest.mark.description("Unit-Test that verifies least-recently-used objects are evicted beyond the cache's budget.")
+def test_objects_eviction(s3, bucket, tmp_path):
+    put(s3, bucket, "data/a.bin", "data/b.bin")
+
+    with example.api.caches.Objects(tmp_path.joinpath("cache"), budget=len("data/a.bin")) as objects:
+        a = s3.download(example.api.types.S3.Download(key="data/a.bin", bucket_name=bucket, directory=tmp_path, cache=objects))
+        s3.download(example.api.types.S3.Download(key="data/b.bin", bucket_name=bucket, directory=tmp_path, cache=objects))
+
+        assert objects.usage() == len("data/b.bin")
+        assert len([path for path in tmp_path.joinpath("cache", "objects").rglob("*") if path.is_file()]) == 1
+
+        # --> previously delivered hard links outlive the evicted cache entry.
+        assert a.read_bytes() == b"data/a.bin"
+
+@pytest.mark.description("Unit-Test that verifies copy delivery produces independent, writable files.")
+def test_objects_copy_delivery(s3, bucket, tmp_path):
+    put(s3, bucket, "data/object.bin")
+
+    with example.api.caches.Objects(tmp_path.joinpath("cache"), delivery="copy") as objects:
+        path = objects.fetch(s3, example.api.types.S3.Download(key="data/object.bin", bucket_name=bucket, directory=tmp_path.joinpath("output")))
+
+        path.write_bytes(b"modified")
+
+        again = objects.fetch(s3, example.api.types.S3.Download(key="data/object.bin", bucket_name=bucket, directory=tmp_path.joinpath("output")))
+
+        assert again.read_bytes() == b"data/object.bin"
+
+    with pytest.raises(ValueError):
+        example.api.caches.Objects(tmp_path.joinpath("cache"), delivery="invalid")
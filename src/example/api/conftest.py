@@ -1,9 +1,77 @@
+import io
+
 import pytest
 
 import logging
 
 logger = logging.getLogger(__name__)
 
+class Client:
+    """
+    Wraps a client, recording the keyword arguments of each call to an operation; optionally failing the operation
+    (with a RuntimeError) after a number of calls, or corrupting (the first byte of) the bodies of its first responses.
+    """
+
+    def __init__(self, client, operation: str, failure: int | None = None, corrupt: int = 0):
+        self.client = client
+        self.operation = operation
+        self.failure = failure
+        self.corrupt = corrupt
+        self.requests: list[dict] = []
+
+    @property
+    def calls(self) -> int:
+        return len(self.requests)
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self.client, name)
+        if name != self.operation:
+            return attribute
+
+        def function(*arguments, **keywords):
+            self.requests.append(keywords)
+
+            calls = len(self.requests)
+            if self.failure is not None and calls > self.failure:
+                raise RuntimeError("Injected Failure")
+
+            response = attribute(*arguments, **keywords)
+            if calls > self.corrupt:
+                return response
+
+            from botocore.response import StreamingBody
+
+            data = bytearray(response["Body"].read())
+            data[0] ^= 0xFF
+
+            return {**response, "Body": StreamingBody(io.BytesIO(data), len(data))}
+
+        return function
+
+class Instance:
+    """
+    Substitutes for an S3 instance, exposing a wrapped client; other attributes are the instance's own.
+    """
+
+    def __init__(self, s3, client: Client):
+        self.s3 = s3
+        self.client = client
+
+    def __getattr__(self, name: str):
+        return getattr(self.s3, name)
+
+@pytest.fixture()
+def wrap(s3):
+    """
+    Returns a factory of substitutes for the "s3" fixture's instance, whose client's operation is wrapped (see
+    `Client`): e.g. `wrap("get_object", failure=1)`.
+    """
+
+    def function(operation: str, failure: int | None = None, corrupt: int = 0) -> Instance:
+        return Instance(s3, Client(s3.client, operation, failure=failure, corrupt=corrupt))
+
+    return function
+
 def pytest_collection_modifyitems(session: pytest.Session, config: pytest.Config, items: list[pytest.Item]):
     for item in items:
         for marker in item.iter_markers(name="description"):
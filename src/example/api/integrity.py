@@ -0,0 +1,503 @@
+"""
+Integrity verification of S3 transfers, computed inline.
+
+Digests are computed incrementally as an object's bytes stream through a transfer (never by a second read of the
+data), and are then compared against the digests that S3 reports for the object:
+
+- "etag": the object's ETag; the MD5 of a single-part object or, for a multipart object, the MD5 of its parts'
+  (binary) MD5s, suffixed by "-<parts>". The ETags of KMS (or customer-key) encrypted objects aren't MD5s, and are
+  never compared.
+- "crc32", "crc32c" and "sha256": the object's additional checksum (see `ChecksumMode`), if it's a checksum of the
+  full object rather than a composite of its parts' checksums. CRC32C requires the optional `awscrt` package.
+
+CRCs can be combined (see `combine`), such that ranges downloaded concurrently, and out of order, are verified against a
+full-object checksum without being reassembled. MD5s can't; ranges verified by ETag are instead aligned to the object's
+parts (see `plan`).
+
+A mismatch raises an `IntegrityError`; transfers are retried once (see `retry`) before failing.
+
+Conversely, `etag` computes a local file's ETag, such that the upload of an unchanged file can be skipped (see
+`example.api.aws.S3.unchanged`).
+"""
+
+import io
+import os
+import re
+import zlib
+import base64
+import typing
+import logging
+import functools
+
+import example.api.pools
+
+logger = logging.getLogger(__name__)
+
+Method = typing.Literal["etag", "crc32", "crc32c", "sha256"]
+methods: typing.Tuple[Method, ...] = typing.get_args(Method)
+
+polynomials = {"crc32": 0xEDB88320, "crc32c": 0x82F63B78}
+"""
+The (reflected) polynomials of the combinable CRC methods.
+"""
+
+class IntegrityError(RuntimeError):
+    """
+    A transferred object's computed digest doesn't match the digest reported by S3.
+    """
+
+@functools.cache
+def available(method: Method) -> bool:
+    """
+    Whether a method's digest can be computed; CRC32C requires the optional `awscrt` package.
+    """
+
+    if method != "crc32c":
+        return True
+
+    try:
+        import awscrt.checksums  # noqa: F401
+    except ImportError:  # pragma: no cover - optional dependency
+        return False
+
+    return True
+
+def crc(method: Method, data: typing.Any, value: int = 0) -> int:
+    """
+    Continues a CRC32 (or CRC32C) from a previous value over the given bytes.
+    """
+
+    if method == "crc32c":
+        import awscrt.checksums
+
+        return awscrt.checksums.crc32c(data, value)
+
+    return zlib.crc32(data, value)
+
+def multiply(matrix: typing.Sequence[int], vector: int) -> int:
+    """
+    Multiplies a 32x32 matrix over GF(2) (a sequence of columns) by a vector.
+    """
+
+    total, index = 0, 0
+    while vector:
+        if vector & 1:
+            total ^= matrix[index]
+
+        vector, index = vector >> 1, index + 1
+
+    return total
+
+@functools.lru_cache(maxsize=64)
+def operator(method: Method, length: int) -> typing.Tuple[int, ...]:
+    """
+    Returns the matrix advancing a CRC over `length` zero bytes; cached, as a transfer's ranges share a length.
+    """
+
+    # --> the operator appending a single zero bit, squared into the operators appending two, and then four, zero bits.
+    odd = [polynomials[method]] + [1 << index for index in range(31)]
+    even = [multiply(odd, column) for column in odd]
+    odd = [multiply(even, column) for column in even]
+
+    result = [1 << index for index in range(32)]
+
+    # --> composes the operators appending each (set) power-of-two count of zero bytes within the length.
+    while length:
+        even = [multiply(odd, column) for column in odd]
+        if length & 1:
+            result = [multiply(even, column) for column in result]
+
+        length >>= 1
+        if not length:
+            break
+
+        odd = [multiply(even, column) for column in even]
+        if length & 1:
+            result = [multiply(odd, column) for column in result]
+
+        length >>= 1
+
+    return tuple(result)
+
+def combine(method: Method, first: int, second: int, length: int) -> int:
+    """
+    Returns the CRC of two concatenated byte ranges, from each range's CRC and the second range's length (i.e.
+    zlib's `crc32_combine`).
+    """
+
+    if length <= 0:
+        return first
+
+    return multiply(operator(method, length), first) ^ second
+
+def encode(method: Method, value: typing.Any) -> str:
+    """
+    Encodes a computed digest as S3 reports it: a quoted hexadecimal ETag, or a base64 checksum.
+    """
+
+    if method == "etag":
+        return "\"{}\"".format(value)
+
+    if method in polynomials:
+        value = value.to_bytes(4, "big")
+
+    return base64.b64encode(value).decode()
+
+def multipart(digests: typing.Sequence[bytes]) -> str:
+    """
+    Returns a multipart object's ETag (unquoted) from its parts' binary MD5 digests.
+    """
+
+    import hashlib
+
+    return "{}-{}".format(hashlib.md5(b"".join(digests), usedforsecurity=False).hexdigest(), len(digests))
+
+def parts(etag: str) -> typing.Optional[int]:
+    """
+    Returns the number of parts of a multipart object's ETag, or None for a single-part object's ETag.
+    """
+
+    match = re.fullmatch(r"\"?[0-9a-fA-F]+-([0-9]+)\"?", etag)
+
+    return int(match.group(1)) if match else None
+
+def expected(head: dict) -> typing.Dict[Method, str]:
+    """
+    Returns the digests that an object's `head_object` (or `get_object`) response provides that are comparable against
+    the object's bytes, by method.
+
+    Additional checksums are only reported when the request specified `ChecksumMode="ENABLED"`.
+    """
+
+    remote: typing.Dict[Method, str] = {}
+
+    etag = head.get("ETag", "")
+
+    encrypted = head.get("ServerSideEncryption", "").startswith("aws:kms") or "SSECustomerAlgorithm" in head
+    if re.fullmatch(r"\"?[0-9a-f]{32}(-[0-9]+)?\"?", etag) and not encrypted:
+        remote["etag"] = "\"{}\"".format(etag.strip("\""))
+
+    for method in ("crc32", "crc32c", "sha256"):
+        value = head.get("Checksum" + method.upper())
+        if not value:
+            continue
+
+        # --> absent a reported type, a checksum is assumed composite if the object (or the checksum) is multipart.
+        if head.get("ChecksumType", "FULL_OBJECT" if "-" not in value and parts(etag) is None else "COMPOSITE") == "FULL_OBJECT":
+            remote[method] = value
+
+    return remote
+
+def layout(client, bucket_name: str, key: str, head: dict) -> typing.Optional[int]:
+    """
+    Returns a multipart object's part size (the size of its first part), or None if the object isn't multipart, or
+    isn't divided into equally sized parts (such that its parts' boundaries are unknown).
+    """
+
+    count = parts(head.get("ETag", ""))
+    if count is None:
+        return None
+
+    size = head["ContentLength"]
+
+    part = client.head_object(Bucket=bucket_name, Key=key, PartNumber=1)["ContentLength"]
+
+    if part <= 0 or -(-size // part) != count:
+        return None
+
+    return part
+
+class Digest:
+    """
+    Incrementally computes a single method's digest of a stream of bytes.
+
+    For "etag", `part_size` is the size of the object's parts if multipart, or None if the object is a single part.
+    """
+
+    def __init__(self, method: Method, part_size: typing.Optional[int] = None):
+        import hashlib
+
+        self.method = method
+        self.part_size = part_size
+
+        self.digests: typing.List[bytes] = []
+        self.remaining = part_size
+
+        self.factory = functools.partial(hashlib.new, "md5" if method == "etag" else method, usedforsecurity=False)
+        self.value = 0 if method in polynomials else self.factory()
+
+    def update(self, data: typing.Any) -> None:
+        view = memoryview(data).cast("B")
+
+        if self.method in polynomials:
+            self.value = crc(self.method, view, self.value)
+        elif self.part_size is None:
+            self.value.update(view)
+        else:
+            # --> a multipart ETag's MD5 is restarted at each of the object's part boundaries.
+            while view:
+                count = min(len(view), self.remaining)
+
+                self.value.update(view[:count])
+
+                view, self.remaining = view[count:], self.remaining - count
+
+                if not self.remaining:
+                    self.digests.append(self.value.digest())
+
+                    self.value, self.remaining = self.factory(), self.part_size
+
+    def result(self) -> typing.Any:
+        """
+        Returns the digest: an int for CRCs, a (binary) digest for SHA-256, and a hexadecimal string for ETags.
+        """
+
+        if self.method in polynomials:
+            return self.value
+
+        if self.method != "etag":
+            return self.value.digest()
+
+        if self.part_size is None:
+            return self.value.hexdigest()
+
+        pending = [self.value.digest()] if self.remaining != self.part_size else []
+
+        return multipart(self.digests + pending)
+
+class Digests:
+    """
+    Incrementally computes the digests of one or more methods, over a stream of bytes passing through a transfer,
+    and verifies them against an object's `head_object` response.
+    """
+
+    def __init__(self, methods: typing.Iterable[Method], part_size: typing.Optional[int] = None):
+        self.digests = [Digest(method, part_size) for method in methods]
+
+    @classmethod
+    def expecting(cls, client, bucket_name: str, key: str, head: dict) -> "Digests":
+        """
+        Returns the (single, cheapest) digest verifying a download of the object, given its `head_object` response.
+        """
+
+        remote = expected(head)
+
+        for method in ("crc32c", "crc32", "etag", "sha256"):
+            if method not in remote or not available(method):
+                continue
+
+            if method != "etag":
+                return cls([method])
+
+            part = layout(client, bucket_name, key, head)
+            if part is not None or parts(remote["etag"]) is None:
+                return cls([method], part)
+
+        return cls([])
+
+    def update(self, data: typing.Any) -> None:
+        for digest in self.digests:
+            digest.update(data)
+
+    def verify(self, head: dict, key: str) -> bool:
+        """
+        Compares each computed digest with the object's corresponding (reported) digest, if any.
+
+        Returns
+        -------
+        bool
+            Whether any digest was compared.
+
+        Raises
+        ------
+        IntegrityError
+            If a digest doesn't match.
+        """
+
+        return check({digest.method: digest.result() for digest in self.digests}, head, key)
+
+def check(computed: typing.Mapping[Method, typing.Any], head: dict, key: str) -> bool:
+    """
+    Compares computed digests with the object's corresponding (reported) digests; see `Digests.verify`.
+    """
+
+    remote = expected(head)
+
+    compared = False
+    for method, value in computed.items():
+        if method not in remote:
+            continue
+
+        label = "ETag" if method == "etag" else method.upper()
+
+        if encode(method, value) != remote[method]:
+            raise IntegrityError("Integrity Verification of \"{}\" Failed - Expected {} {}, Computed {}".format(key, label, remote[method], encode(method, value)))
+
+        logger.debug("Verified %s of \"%s\": %s", label, key, remote[method])
+
+        compared = True
+
+    if not compared:
+        logger.warning("Unable to Verify Integrity of \"%s\" - S3 Reported No Comparable ETag or Checksum", key)
+
+    return compared
+
+class Reader(io.RawIOBase):
+    """
+    A non-seekable, read-only file object computing digests over the bytes read from a file.
+
+    Being non-seekable, boto3 reads the file sequentially (once), retaining each part in memory for its (concurrent)
+    upload and any retry.
+    """
+
+    def __init__(self, file: typing.BinaryIO, digests: Digests):
+        self.file = file
+        self.digests = digests
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: typing.Any) -> int:
+        count = self.file.readinto(buffer)
+
+        self.digests.update(memoryview(buffer)[:count])
+
+        return count
+
+class Writer(io.RawIOBase):
+    """
+    A non-seekable, write-only file object computing digests over the bytes written to a file.
+
+    Being non-seekable, boto3 writes its concurrently downloaded ranges in order, such that the digests are computed
+    over the object's bytes as they're written.
+    """
+
+    def __init__(self, file: typing.BinaryIO, digests: Digests):
+        self.file = file
+        self.digests = digests
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: typing.Any) -> int:
+        count = self.file.write(data)
+
+        self.digests.update(data)
+
+        return count
+
+def etag(path: os.PathLike | str, part_size: typing.Optional[int] = None, concurrency: int = 1) -> str:
+    """
+    Computes a local file's ETag (quoted, as S3 reports it) were it uploaded with the given part size (None for a
+    single-part upload).
+
+    A multipart ETag's parts are hashed concurrently; `hashlib` releases the GIL while hashing.
+    """
+
+    import hashlib
+
+    size = os.path.getsize(path)
+
+    def function(offset: int, length: int) -> typing.Any:
+        digest = hashlib.md5(usedforsecurity=False)
+
+        buffer = memoryview(bytearray(min(length, 1024 * 1024)))
+
+        with open(path, "rb", buffering=0) as file:
+            file.seek(offset)
+
+            while length > 0:
+                count = file.readinto(buffer[:min(length, len(buffer))])
+                if not count:
+                    raise RuntimeError("File Changed While Hashing: {}".format(path))
+
+                digest.update(buffer[:count])
+                length -= count
+
+        return digest
+
+    if part_size is None:
+        return encode("etag", function(0, size).hexdigest())
+
+    ranges = [(offset, min(part_size, size - offset)) for offset in range(0, size, part_size)]
+
+    digests = [digest.digest() for digest in example.api.pools.execute(function, ranges, concurrency, ordered=True, name="example-s3-etag")]
+
+    return encode("etag", multipart(digests))
+
+def plan(client, bucket_name: str, key: str, head: dict, size: int, chunk: int) -> typing.Tuple[typing.Optional[Method], int]:
+    """
+    Returns the method verifying a ranged download (see `example.api.transfers.download`), and its range size.
+
+    A full-object CRC is preferred, leaving the ranges unchanged. Otherwise, ranges are aligned to a multipart object's
+    parts, each range's MD5 being its part's MD5; a single-part object (whose MD5 can't be computed from out-of-order
+    ranges) is downloaded as a single range.
+    """
+
+    remote = expected(head)
+
+    for method in ("crc32c", "crc32"):
+        if method in remote and available(method):
+            return method, chunk
+
+    if "etag" in remote:
+        if parts(remote["etag"]) is None:
+            if size > chunk:
+                logger.debug("Downloading \"%s\" as a Single Range - Its MD5 ETag Requires Sequential Hashing", key)
+
+            return "etag", max(size, 1)
+
+        part = layout(client, bucket_name, key, head)
+        if part is not None:
+            return "etag", part
+
+    if "sha256" in remote:
+        return "sha256", max(size, 1)
+
+    logger.warning("Unable to Verify Integrity of \"%s\" - S3 Reported No Comparable ETag or Checksum", key)
+
+    return None, chunk
+
+def serialize(method: Method, digest: Digest) -> typing.Any:
+    """
+    Returns a range's digest as a JSON-serializable value (i.e. for a checkpoint).
+    """
+
+    return digest.value if method in polynomials else digest.value.hexdigest()
+
+def assemble(method: Method, ranges: typing.Sequence[typing.Tuple[int, typing.Any]], multipart_object: bool) -> typing.Any:
+    """
+    Returns an object's digest from its (ordered) ranges' lengths and serialized digests; see `plan`.
+    """
+
+    if not ranges:
+        return Digest(method).result()
+
+    if method in polynomials:
+        value = 0
+        for length, digest in ranges:
+            value = combine(method, value, digest, length)
+
+        return value
+
+    if method == "sha256":
+        return bytes.fromhex(ranges[0][1])
+
+    if multipart_object:
+        return multipart([bytes.fromhex(digest) for _, digest in ranges])
+
+    return ranges[0][1]
+
+def retry(function: typing.Callable[..., typing.Any], *arguments: typing.Any, attempts: int = 2, **keywords: typing.Any) -> typing.Any:
+    """
+    Calls a transfer function, retrying it upon an `IntegrityError` up to a total number of attempts.
+    """
+
+    for attempt in range(1, attempts + 1):
+        try:
+            return function(*arguments, **keywords)
+        except IntegrityError as e:
+            if attempt == attempts:
+                raise
+
+            logger.warning("Retrying Transfer (Attempt %d of %d): %s", attempt + 1, attempts, e)
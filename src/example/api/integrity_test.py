@@ -0,0 +1,127 @@
+import os
+import zlib
+import hashlib
+import logging
+
+import pytest
+
+import example.api.types
+import example.api.integrity
+import example.api.transfers
+
+logger = logging.getLogger(__name__)
+
+MiB = 1024 * 1024
+
+@pytest.mark.description("Unit-Test that verifies combined CRCs equal the CRC of the concatenated bytes.")
+def test_combine():
+    first, second = os.urandom(1000), os.urandom(12345)
+
+    assert example.api.integrity.combine("crc32", zlib.crc32(first), zlib.crc32(second), len(second)) == zlib.crc32(first + second)
+    assert example.api.integrity.combine("crc32", zlib.crc32(first), zlib.crc32(b""), 0) == zlib.crc32(first)
+
+    ranges = [(len(first), zlib.crc32(first)), (len(second), zlib.crc32(second))]
+
+    assert example.api.integrity.assemble("crc32", ranges, False) == zlib.crc32(first + second)
+
+@pytest.mark.description("Unit-Test that verifies incremental ETags, across writes that straddle the part boundaries.")
+def test_etag():
+    digest = example.api.integrity.Digest("etag", 5)
+    for block in (b"abc", b"defghij", b"k"):
+        digest.update(block)
+
+    assert digest.result() == example.api.integrity.multipart([hashlib.md5(part).digest() for part in (b"abcde", b"fghij", b"k")])
+    assert digest.result().endswith("-3")
+
+    digest = example.api.integrity.Digest("etag")
+    digest.update(b"abc")
+
+    assert digest.result() == hashlib.md5(b"abc").hexdigest()
+
+@pytest.mark.description("Unit-Test that verifies only comparable ETags and full-object checksums are expected.")
+def test_expected():
+    etag = "\"{}\"".format(hashlib.md5(b"").hexdigest())
+
+    assert example.api.integrity.expected({"ETag": etag, "ChecksumCRC32": "AAAAAA=="}) == {"etag": etag, "crc32": "AAAAAA=="}
+    assert example.api.integrity.expected({"ETag": etag, "ServerSideEncryption": "aws:kms"}) == {}
+
+    # --> absent a reported type, a multipart object's checksum is assumed composite.
+    multipart = "\"{}-2\"".format("0" * 32)
+
+    assert example.api.integrity.expected({"ETag": multipart, "ChecksumCRC32": "AAAAAA=="}) == {"etag": multipart}
+    assert example.api.integrity.expected({"ETag": multipart, "ChecksumCRC32": "AAAAAA==", "ChecksumType": "FULL_OBJECT"})["crc32"] == "AAAAAA=="
+
+@pytest.mark.description("Unit-Test that verifies uploads and downloads of single-part and multipart objects, verified by their ETags and checksums.")
+def test_verify(s3, bucket, wrap, tmp_path):
+    for name, size in (("small.bin", MiB), ("large.bin", 12 * MiB)):
+        source = tmp_path.joinpath(name)
+        source.write_bytes(os.urandom(size))
+
+        s3.upload(example.api.types.S3.Upload(key=name, bucket_name=bucket, source=source, chunk_size=5 * MiB, progress=False, verify=True))
+
+        for ranged in (False, True):
+            configuration = example.api.types.S3.Download(key=name, bucket_name=bucket, directory=tmp_path.joinpath("downloads", str(ranged)), chunk_size=2 * MiB, progress=False, ranged=ranged, verify=True)
+
+            assert s3.download(configuration).read_bytes() == source.read_bytes()
+
+    # --> the multipart object's ETag is verified from ranges aligned to its 5 MiB parts.
+    instance = wrap("get_object")
+
+    example.api.transfers.download(instance, example.api.types.S3.Download(key="large.bin", bucket_name=bucket, directory=tmp_path, chunk_size=2 * MiB, ranged=True, verify=True))
+
+    assert instance.client.calls == 3
+
+@pytest.mark.description("Unit-Test that verifies corrupted ranges fail verification, are retried, and are never retained.")
+def test_corruption(s3, bucket, wrap, tmp_path):
+    body = os.urandom(3 * MiB)
+
+    s3.client.put_object(Bucket=bucket, Key="data/corrupted.bin", Body=body)
+
+    configuration = example.api.types.S3.Download(key="data/corrupted.bin", bucket_name=bucket, directory=tmp_path, chunk_size=MiB, ranged=True, resume=True, verify=True)
+
+    with pytest.raises(example.api.integrity.IntegrityError):
+        example.api.transfers.download(wrap("get_object", corrupt=1), configuration)
+
+    assert os.listdir(tmp_path) == []
+
+    path = example.api.integrity.retry(example.api.transfers.download, wrap("get_object", corrupt=1), configuration)
+
+    assert path.read_bytes() == body
+    assert os.listdir(tmp_path) == ["corrupted.bin"]
+
+@pytest.mark.description("Unit-Test that verifies an upload whose object doesn't match the bytes read is retried once, then fails.")
+def test_upload_mismatch(s3, bucket, tmp_path, monkeypatch):
+    source = tmp_path.joinpath("source.bin")
+    source.write_bytes(os.urandom(MiB))
+
+    update = example.api.integrity.Digests.update
+    corrupted = []
+
+    def function(self, data):
+        # --> simulates bytes altered after being read (i.e. in transit), for the configured number of attempts.
+        if len(corrupted) < attempts and self not in corrupted:
+            corrupted.append(self)
+            data = bytes(data)[::-1]
+
+        update(self, data)
+
+    monkeypatch.setattr(example.api.integrity.Digests, "update", function)
+
+    configuration = example.api.types.S3.Upload(key="mismatch.bin", bucket_name=bucket, source=source, progress=False, verify=True)
+
+    attempts = 1
+    assert s3.upload(configuration) == ("mismatch.bin", MiB)
+
+    attempts = 2
+    corrupted.clear()
+
+    with pytest.raises(example.api.integrity.IntegrityError):
+        s3.upload(configuration)
+
+@pytest.mark.description("Unit-Test that verifies local files' single-part and (concurrently hashed) multipart ETags.")
+def test_local_etag(tmp_path):
+    path = tmp_path.joinpath("local.bin")
+    path.write_bytes(b"abcdefghijk")
+
+    assert example.api.integrity.etag(path) == "\"{}\"".format(hashlib.md5(b"abcdefghijk").hexdigest())
+    assert example.api.integrity.etag(path, 5, concurrency=3) == "\"{}\"".format(example.api.integrity.multipart([hashlib.md5(part).digest() for part in (b"abcde", b"fghij", b"k")]))
@@ -0,0 +1,420 @@
+"""
+Compact representation(s) of S3 listings.
+
+`S3.list` returns botocore's per-object dictionaries, each costing several hundred bytes (more than a kilobyte with
+its `StorageClass`, `ETag` and `ChecksumAlgorithm` strings). For bulk use, a `Listing` stores a listing's columns
+separately: keys in a single list, sizes and modification times in `array` buffers, ETags as packed binary digests,
+and storage classes as single-byte codes, reducing a million-object listing from gigabytes to tens of megabytes.
+`Entry` is the slotted, per-object record produced when indexing or iterating a listing.
+
+An `Index` over a listing answers storage-report queries without scanning it: objects, counts and bytes under any
+prefix (via binary search over the sorted keys, and prefix sums over their sizes), per-"directory" aggregates at each
+level (`du`-style), and the largest objects.
+
+    index = example.api.listings.Index(listing)
+
+    for level in index.levels("logs/"):
+        print(level.prefix, level.count, level.size)
+
+    listing = s3.listing(example.api.types.S3.List(key="logs/", bucket_name="example-bucket"))
+
+    total = listing.total()
+
+    for entry in listing:
+        ...
+"""
+
+from __future__ import annotations
+
+import sys
+import heapq
+import array
+import bisect
+import typing
+import itertools
+import dataclasses
+
+def successor(prefix: str) -> typing.Optional[str]:
+    """
+    Returns the smallest string sorting after every string beginning with the prefix, or None if unbounded.
+
+    Allows prefix queries to be expressed as a range (key >= prefix AND key < successor).
+    """
+
+    while prefix:
+        last = ord(prefix[-1])
+        if last < 0x10FFFF:
+            return prefix[:-1] + chr(last + 1)
+
+        prefix = prefix[:-1]
+
+    return None
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class Entry:
+    """
+    A single listed object.
+
+    Attributes
+    ----------
+    key : str
+        The object's key.
+    size : int
+        The object's size, in bytes.
+    modified : float
+        The object's last modification time, as a POSIX timestamp.
+    etag : str
+        The object's (unquoted) ETag.
+    storage_class : str
+        The object's storage class.
+    """
+
+    key: str
+    size: int
+    modified: float
+    etag: str = ""
+    storage_class: str = "STANDARD"
+
+    @classmethod
+    def from_item(cls, item: typing.Mapping[str, typing.Any]) -> Entry:
+        """
+        Creates an entry from a listing dictionary, as returned by `S3.list` or botocore.
+        """
+
+        modified = item["LastModified"]
+
+        return cls(
+            key=item["Key"],
+            size=item["Size"],
+            modified=modified if isinstance(modified, (int, float)) else modified.timestamp(),
+            etag=item.get("ETag", "").strip("\""),
+            storage_class=item.get("StorageClass", "STANDARD"),
+        )
+
+    def to_item(self) -> typing.Dict[str, typing.Any]:
+        """
+        Converts the entry into `S3.list`'s dictionary format.
+        """
+
+        return {"Key": self.key, "Size": self.size, "LastModified": self.modified, "ETag": "\"{}\"".format(self.etag), "StorageClass": self.storage_class}
+
+class Listing:
+    """
+    A columnar, memory-compact container of listed objects.
+
+    ETags are stored as 16-byte binary digests alongside their multipart part count (e.g. "<md5>-12"); the rare ETag
+    that isn't an MD5-based digest is stored verbatim.
+
+    Attributes
+    ----------
+    keys : list of str
+        The objects' keys.
+    sizes : array.array
+        The objects' sizes, in bytes (signed 64-bit integers).
+    modified : array.array
+        The objects' last modification times, as POSIX timestamps (doubles).
+    """
+
+    __slots__ = ("keys", "sizes", "modified", "digests", "parts", "irregular", "codes", "classes", "_lookup")
+
+    def __init__(self):
+        self.keys: typing.List[str] = []
+        self.sizes = array.array("q")
+        self.modified = array.array("d")
+
+        self.digests = bytearray()
+        self.parts = array.array("i")
+        self.irregular: typing.Dict[int, str] = {}
+
+        self.codes = array.array("B")
+        self.classes: typing.List[str] = []
+
+        self._lookup: typing.Dict[str, int] = {}
+
+    @classmethod
+    def from_items(cls, items: typing.Iterable[typing.Mapping[str, typing.Any]]) -> Listing:
+        """
+        Creates a listing from (e.g. streamed) listing dictionaries, without retaining them.
+        """
+
+        instance = cls()
+        instance.extend(items)
+
+        return instance
+
+    @classmethod
+    def from_entries(cls, entries: typing.Iterable[Entry]) -> Listing:
+        instance = cls()
+
+        instance.extend({"Key": entry.key, "Size": entry.size, "LastModified": entry.modified, "ETag": entry.etag, "StorageClass": entry.storage_class} for entry in entries)
+
+        return instance
+
+    def append(self, item: typing.Mapping[str, typing.Any]) -> None:
+        self.extend((item,))
+
+    def extend(self, items: typing.Iterable[typing.Mapping[str, typing.Any]]) -> None:
+        # --> the columns' methods are bound once, as this loop runs once per listed object.
+        keys, sizes, modified, digests, parts, codes = self.keys.append, self.sizes.append, self.modified.append, self.digests.extend, self.parts.append, self.codes.append
+        lookup, fromhex = self._lookup, bytes.fromhex
+
+        for item in items:
+            index = len(self.keys)
+
+            keys(item["Key"])
+            sizes(item["Size"])
+
+            timestamp = item["LastModified"]
+            modified(timestamp if isinstance(timestamp, float) else float(timestamp) if isinstance(timestamp, int) else timestamp.timestamp())
+
+            etag = item.get("ETag", "").strip("\"")
+            if len(etag) == 32:
+                digest, count = etag, 0
+            else:
+                digest, _, count = etag.partition("-")
+                count = int(count) if count.isdigit() and len(digest) == 32 else -1
+
+            try:
+                digests(fromhex(digest) if count >= 0 else bytes(16))
+            except ValueError:
+                digests(bytes(16))
+                count = -1
+
+            parts(count)
+            if count < 0:
+                self.irregular[index] = etag
+
+            storage_class = item.get("StorageClass", "STANDARD")
+
+            code = lookup.get(storage_class)
+            if code is None:
+                code = lookup[storage_class] = len(self.classes)
+                self.classes.append(storage_class)
+
+            codes(code)
+
+    def etag(self, index: int) -> str:
+        """
+        Returns an object's (unquoted) ETag.
+        """
+
+        parts = self.parts[index]
+        if parts < 0:
+            return self.irregular[index]
+
+        digest = self.digests[index * 16:(index + 1) * 16].hex()
+
+        return "{}-{}".format(digest, parts) if parts else digest
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __getitem__(self, index: int) -> Entry:
+        if index < 0:
+            index += len(self.keys)
+
+        return Entry(key=self.keys[index], size=self.sizes[index], modified=self.modified[index], etag=self.etag(index), storage_class=self.classes[self.codes[index]])
+
+    def __iter__(self) -> typing.Iterator[Entry]:
+        for index in range(len(self.keys)):
+            yield self[index]
+
+    def items(self) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+        """
+        Yields each object in `S3.list`'s dictionary format.
+        """
+
+        for entry in self:
+            yield entry.to_item()
+
+    def total(self) -> int:
+        """
+        The listing's total size, in bytes.
+        """
+
+        return sum(self.sizes)
+
+    def nbytes(self) -> int:
+        """
+        The approximate memory footprint, in bytes, of the listing's columns (including its key strings).
+        """
+
+        return (
+            sys.getsizeof(self.keys) + sum(sys.getsizeof(key) for key in self.keys)
+            + self.sizes.buffer_info()[1] * self.sizes.itemsize
+            + self.modified.buffer_info()[1] * self.modified.itemsize
+            + len(self.digests)
+            + self.parts.buffer_info()[1] * self.parts.itemsize
+            + self.codes.buffer_info()[1] * self.codes.itemsize
+            + sum(sys.getsizeof(value) for value in self.irregular.values())
+        )
+
+@dataclasses.dataclass(slots=True, frozen=True)
+class Level:
+    """
+    The aggregate of a single "directory" (common prefix), or of a single object, at one level beneath a prefix.
+
+    Attributes
+    ----------
+    prefix : str
+        The directory's prefix (ending with the delimiter), or the object's key.
+    count : int
+        The number of objects beneath the prefix.
+    size : int
+        The total size, in bytes, of the objects beneath the prefix.
+    """
+
+    prefix: str
+    count: int
+    size: int
+
+class Index:
+    """
+    A sorted index over a listing, with prefix sums over its sizes.
+
+    Counts and totals beneath any prefix are answered in O(log n); a level's per-directory aggregates in O(d log n) for
+    d directories; and the largest objects in O(n log k), or, for the entire index, from a precomputed size ordering.
+
+    Parameters
+    ----------
+    listing : Listing
+        The indexed listing. S3 returns keys in sorted order, in which case the listing isn't copied or re-ordered.
+    """
+
+    __slots__ = ("listing", "keys", "cumulative", "positions", "_ordering")
+
+    def __init__(self, listing: Listing):
+        self.listing = listing
+
+        keys = listing.keys
+
+        # --> S3 lists keys in (UTF-8 binary, and therefore code-point) order, such that sorting is rarely required.
+        if all(itertools.starmap(str.__le__, zip(keys, itertools.islice(keys, 1, None)))):
+            self.keys = keys
+            self.positions = None
+        else:
+            self.positions = array.array("q", sorted(range(len(keys)), key=keys.__getitem__))
+            self.keys = [keys[position] for position in self.positions]
+
+        sizes = listing.sizes if self.positions is None else (listing.sizes[position] for position in self.positions)
+
+        self.cumulative = array.array("q", itertools.accumulate(sizes, initial=0))
+
+        self._ordering: typing.Optional[array.array] = None
+
+    @classmethod
+    def from_items(cls, items: typing.Iterable[typing.Mapping[str, typing.Any]]) -> Index:
+        """
+        Creates an index from (e.g. streamed) listing dictionaries.
+        """
+
+        return cls(Listing.from_items(items))
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _position(self, index: int) -> int:
+        return index if self.positions is None else self.positions[index]
+
+    def range(self, prefix: str = "") -> typing.Tuple[int, int]:
+        """
+        Returns the (sorted) index range of the objects beneath a prefix.
+        """
+
+        lower = bisect.bisect_left(self.keys, prefix)
+
+        upper = successor(prefix)
+        upper = len(self.keys) if upper is None else bisect.bisect_left(self.keys, upper, lower)
+
+        return lower, upper
+
+    def count(self, prefix: str = "") -> int:
+        lower, upper = self.range(prefix)
+
+        return upper - lower
+
+    def total(self, prefix: str = "") -> int:
+        """
+        The total size, in bytes, of the objects beneath a prefix.
+        """
+
+        lower, upper = self.range(prefix)
+
+        return self.cumulative[upper] - self.cumulative[lower]
+
+    def under(self, prefix: str = "") -> typing.Iterator[Entry]:
+        """
+        Yields the objects beneath a prefix, in key order.
+        """
+
+        lower, upper = self.range(prefix)
+
+        for index in range(lower, upper):
+            yield self.listing[self._position(index)]
+
+    def levels(self, prefix: str = "", delimiter: str = "/") -> typing.Iterator[Level]:
+        """
+        Yields the aggregates of each directory (and object) one level beneath a prefix, in key order.
+
+        Each directory's objects are skipped by binary search, rather than visited.
+        """
+
+        keys, cumulative = self.keys, self.cumulative
+
+        index, upper = self.range(prefix)
+
+        while index < upper:
+            key = keys[index]
+
+            position = key.find(delimiter, len(prefix))
+            if position < 0:
+                end, name = index + 1, key
+            else:
+                name = key[:position + len(delimiter)]
+
+                bound = successor(name)
+                end = upper if bound is None else bisect.bisect_left(keys, bound, index, upper)
+
+            yield Level(prefix=name, count=end - index, size=cumulative[end] - cumulative[index])
+
+            index = end
+
+    def du(self, prefix: str = "", depth: int = 1, delimiter: str = "/") -> typing.Iterator[typing.Tuple[int, Level]]:
+        """
+        Yields each directory's aggregate (alongside its depth) up to the given depth beneath a prefix, depth-first.
+        """
+
+        for level in self.levels(prefix, delimiter):
+            if not level.prefix.endswith(delimiter):
+                continue
+
+            yield 1, level
+
+            if depth > 1:
+                for nested, child in self.du(level.prefix, depth - 1, delimiter):
+                    yield nested + 1, child
+
+    def largest(self, count: int, prefix: str = "") -> typing.List[Entry]:
+        """
+        Returns the largest objects beneath a prefix, in descending order of size.
+
+        A few objects are selected via a bounded heap, in O(n log count); the full ordering (by size) of the index is
+        only sorted (and retained, for subsequent calls) once a large share of the objects is requested.
+        """
+
+        if count <= 0:
+            return []
+
+        lower, upper = self.range(prefix)
+
+        sizes = self.cumulative
+
+        if lower == 0 and upper == len(self.keys) and (self._ordering is not None or count * 8 >= upper):
+            if self._ordering is None:
+                self._ordering = array.array("q", sorted(range(len(self.keys)), key=lambda index: sizes[index] - sizes[index + 1]))
+
+            indices = itertools.islice(self._ordering, count)
+        else:
+            indices = heapq.nlargest(count, range(lower, upper), key=lambda index: sizes[index + 1] - sizes[index])
+
+        return [self.listing[self._position(index)] for index in indices]
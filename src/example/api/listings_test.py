@@ -0,0 +1,139 @@
+import sys
+import logging
+import datetime
+
+import pytest
+
+import example.api.types
+import example.api.listings
+
+logger = logging.getLogger(__name__)
+
+def item(index: int, etag: str = "\"d41d8cd98f00b204e9800998ecf8427e\"", storage_class: str = "STANDARD") -> dict:
+    return {"Key": "listing/{:012d}".format(index), "LastModified": 1760000000.0 + index, "ETag": etag, "Size": index, "StorageClass": storage_class, "ChecksumAlgorithm": ["CRC32"]}
+
+@pytest.mark.description("Unit-Test that verifies prefix successors bound every string beginning with the prefix.")
+def test_successor():
+    assert example.api.listings.successor("logs/") == "logs0"
+    assert example.api.listings.successor("") is None
+    assert example.api.listings.successor("a" + chr(0x10FFFF)) == "b"
+
+    assert "logs/" <= "logs/z" < example.api.listings.successor("logs/")
+
+@pytest.mark.description("Unit-Test that verifies entries round-trip through the listing's dictionary format.")
+def test_entry():
+    entry = example.api.listings.Entry.from_item({**item(1), "LastModified": datetime.datetime.fromtimestamp(1760000001.0, tz=datetime.timezone.utc)})
+
+    assert entry.key == "listing/000000000001"
+    assert entry.modified == 1760000001.0
+    assert entry.etag == "d41d8cd98f00b204e9800998ecf8427e"
+    assert example.api.listings.Entry.from_item(entry.to_item()) == entry
+
+    assert not hasattr(entry, "__dict__")
+
+@pytest.mark.description("Unit-Test that verifies the columnar listing preserves every entry, including irregular ETags.")
+def test_listing():
+    items = [
+        item(0),
+        item(1, etag="\"9b2cf535f27731c974343645a3985328-12\"", storage_class="GLACIER"),
+        item(2, etag="\"not-an-md5-etag\""),
+    ]
+
+    listing = example.api.listings.Listing.from_items(items)
+
+    assert len(listing) == 3
+    assert listing.total() == 3
+    assert listing.classes == ["STANDARD", "GLACIER"]
+
+    assert [entry.etag for entry in listing] == ["d41d8cd98f00b204e9800998ecf8427e", "9b2cf535f27731c974343645a3985328-12", "not-an-md5-etag"]
+    assert listing[-2] == example.api.listings.Entry.from_item(items[1])
+
+    assert list(example.api.listings.Listing.from_entries(listing)) == list(listing)
+    assert [converted["Key"] for converted in listing.items()] == [original["Key"] for original in items]
+
+@pytest.mark.description("Unit-Test that verifies the columnar listing is several times smaller than its dictionaries.")
+def test_listing_footprint():
+    items = [item(index) for index in range(10000)]
+
+    listing = example.api.listings.Listing.from_items(items)
+
+    dictionaries = sys.getsizeof(items) + sum(sys.getsizeof(value) + sum(sys.getsizeof(v) for v in value.values()) for value in items)
+
+    logger.info("Memory Footprint - Dictionaries: %d Byte(s), Listing: %d Byte(s)", dictionaries, listing.nbytes())
+
+    assert listing.nbytes() * 5 < dictionaries
+
+@pytest.mark.description("Unit-Test that verifies S3.listing streams a backend listing into a columnar listing.")
+def test_s3_listing(s3, bucket):
+    client = s3.client
+
+    for index in range(3):
+        client.put_object(Bucket=bucket, Key="logs/{}.txt".format(index), Body=b"0" * index)
+
+    listing = s3.listing(example.api.types.S3.List(key="logs/", bucket_name=bucket))
+
+    assert listing.keys == ["logs/0.txt", "logs/1.txt", "logs/2.txt"]
+    assert list(listing.sizes) == [0, 1, 2]
+
+@pytest.fixture()
+def index() -> example.api.listings.Index:
+    keys = {
+        "logs/2026/01/a.log": 10,
+        "logs/2026/01/b.log": 20,
+        "logs/2026/02/c.log": 30,
+        "logs/readme.txt": 5,
+        "data/x.parquet": 1000,
+        "data/y.parquet": 2000,
+        "root.txt": 1,
+    }
+
+    # --> deliberately unsorted, exercising the index's own ordering.
+    return example.api.listings.Index.from_items({"Key": key, "Size": size, "LastModified": 0.0} for key, size in keys.items())
+
+@pytest.mark.description("Unit-Test that verifies counts, totals and objects beneath a prefix.")
+def test_index_prefix(index: example.api.listings.Index):
+    assert len(index) == 7
+
+    assert index.count("logs/") == 4
+    assert index.total("logs/") == 65
+    assert index.total("logs/2026/01/") == 30
+    assert index.total() == 3066
+    assert index.count("missing/") == 0
+
+    assert [entry.key for entry in index.under("logs/2026/")] == ["logs/2026/01/a.log", "logs/2026/01/b.log", "logs/2026/02/c.log"]
+
+@pytest.mark.description("Unit-Test that verifies per-directory aggregates at each level beneath a prefix.")
+def test_index_levels(index: example.api.listings.Index):
+    assert list(index.levels()) == [
+        example.api.listings.Level("data/", 2, 3000),
+        example.api.listings.Level("logs/", 4, 65),
+        example.api.listings.Level("root.txt", 1, 1),
+    ]
+
+    assert list(index.levels("logs/")) == [
+        example.api.listings.Level("logs/2026/", 3, 60),
+        example.api.listings.Level("logs/readme.txt", 1, 5),
+    ]
+
+    assert [(depth, level.prefix) for depth, level in index.du(depth=3)] == [
+        (1, "data/"),
+        (1, "logs/"),
+        (2, "logs/2026/"),
+        (3, "logs/2026/01/"),
+        (3, "logs/2026/02/"),
+    ]
+
+@pytest.mark.description("Unit-Test that verifies the largest objects, both overall and beneath a prefix.")
+def test_index_largest(index: example.api.listings.Index):
+    assert [entry.key for entry in index.largest(2)] == ["data/y.parquet", "data/x.parquet"]
+    assert [entry.key for entry in index.largest(2, "logs/")] == ["logs/2026/02/c.log", "logs/2026/01/b.log"]
+    assert index.largest(0) == [] and index.largest(-1) == []
+
+    # --> a few of many objects are selected via a heap, without sorting the index by size.
+    many = example.api.listings.Index.from_items({"Key": "{:04d}".format(number), "Size": number % 97, "LastModified": 0.0} for number in range(1000))
+
+    assert [entry.key for entry in many.largest(3)] == ["0096", "0193", "0290"]
+    assert many._ordering is None
+
+    assert [entry.key for entry in many.largest(500)[:3]] == ["0096", "0193", "0290"]
+    assert many._ordering is not None
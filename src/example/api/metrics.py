@@ -0,0 +1,316 @@
+"""
+Instrumentation for `example.api` operations.
+
+Operations record latency histograms, request, error and retry counts, and bytes transferred into a pluggable
+`Sink`. Instrumentation is disabled by default; while disabled, `timer` returns a shared no-op context manager,
+and no botocore event handlers are registered, so the overhead amounts to a single global lookup per operation.
+
+    sink = example.api.metrics.Memory()
+    example.api.metrics.configure(sink)
+
+    ...
+
+    print(example.api.metrics.Prometheus(sink).render())
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import math
+import os
+import threading
+import time
+import typing
+
+logger = logging.getLogger(__name__)
+
+Labels = typing.Tuple[typing.Tuple[str, str], ...]
+
+buckets: typing.Tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0, math.inf)
+"""
+The default histogram bucket upper-bounds, in seconds.
+"""
+
+class Histogram:
+    """
+    A cumulative-bucket histogram, compatible with Prometheus' histogram semantics.
+    """
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: typing.Sequence[float] = buckets):
+        self.bounds = tuple(bounds)
+        self.counts = [0] * len(self.bounds)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> typing.List[typing.Tuple[float, int]]:
+        """
+        Returns each bucket's upper-bound alongside its cumulative count.
+        """
+
+        total, results = 0, []
+        for bound, count in zip(self.bounds, self.counts):
+            total += count
+            results.append((bound, total))
+
+        return results
+
+class Sink:
+    """
+    The metrics sink interface. Implementations must be thread-safe.
+    """
+
+    def observe(self, name: str, value: float, labels: Labels = ()) -> None:
+        """
+        Records a value into the named histogram.
+        """
+
+        raise NotImplementedError
+
+    def increment(self, name: str, value: float = 1, labels: Labels = ()) -> None:
+        """
+        Increments the named counter.
+        """
+
+        raise NotImplementedError
+
+class Memory(Sink):
+    """
+    An in-memory, thread-safe metrics sink.
+    """
+
+    def __init__(self, bounds: typing.Sequence[float] = buckets):
+        self.bounds = bounds
+
+        self.histograms: typing.Dict[str, typing.Dict[Labels, Histogram]] = {}
+        self.counters: typing.Dict[str, typing.Dict[Labels, float]] = {}
+
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, value: float, labels: Labels = ()) -> None:
+        with self._lock:
+            series = self.histograms.setdefault(name, {})
+
+            histogram = series.get(labels)
+            if histogram is None:
+                histogram = series[labels] = Histogram(self.bounds)
+
+            histogram.observe(value)
+
+    def increment(self, name: str, value: float = 1, labels: Labels = ()) -> None:
+        with self._lock:
+            series = self.counters.setdefault(name, {})
+            series[labels] = series.get(labels, 0) + value
+
+    def counter(self, name: str, **labels: str) -> float:
+        """
+        Returns a counter's current value for the given labels (zero if never incremented).
+        """
+
+        with self._lock:
+            return self.counters.get(name, {}).get(normalize(labels), 0)
+
+    def histogram(self, name: str, **labels: str) -> typing.Optional[Histogram]:
+        """
+        Returns the histogram for the given labels, if any values were observed.
+        """
+
+        with self._lock:
+            return self.histograms.get(name, {}).get(normalize(labels))
+
+    def reset(self) -> None:
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
+
+class Prometheus:
+    """
+    Renders an in-memory sink using the Prometheus text exposition format.
+
+    Parameters
+    ----------
+    sink : Memory
+        The sink to render.
+    """
+
+    def __init__(self, sink: Memory):
+        self.sink = sink
+
+    @staticmethod
+    def _labels(labels: Labels, extra: Labels = ()) -> str:
+        pairs = labels + extra
+        if not pairs:
+            return ""
+
+        return "{" + ",".join('{}="{}"'.format(key, str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")) for key, value in pairs) + "}"
+
+    def render(self) -> str:
+        lines: typing.List[str] = []
+
+        with self.sink._lock:
+            counters = {name: dict(series) for name, series in self.sink.counters.items()}
+            histograms = {name: {labels: (histogram.cumulative(), histogram.sum, histogram.count) for labels, histogram in series.items()} for name, series in self.sink.histograms.items()}
+
+        for name in sorted(counters):
+            lines.append("# TYPE {} counter".format(name))
+            for labels, value in sorted(counters[name].items()):
+                lines.append("{}{} {}".format(name, self._labels(labels), repr(float(value))))
+
+        for name in sorted(histograms):
+            lines.append("# TYPE {} histogram".format(name))
+            for labels, (cumulative, total, count) in sorted(histograms[name].items()):
+                for bound, value in cumulative:
+                    lines.append("{}_bucket{} {}".format(name, self._labels(labels, (("le", "+Inf" if math.isinf(bound) else repr(bound)),)), value))
+
+                lines.append("{}_sum{} {}".format(name, self._labels(labels), repr(total)))
+                lines.append("{}_count{} {}".format(name, self._labels(labels), count))
+
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: os.PathLike | str) -> None:
+        """
+        Atomically writes the rendered metrics to a file (e.g. for a node-exporter "textfile" collector).
+        """
+
+        temporary = "{}.{}.tmp".format(os.fspath(path), os.getpid())
+
+        with open(temporary, "w") as file:
+            file.write(self.render())
+
+        os.replace(temporary, path)
+
+sink: typing.Optional[Sink] = None
+"""
+The globally configured sink. `None` disables instrumentation.
+"""
+
+def configure(instance: typing.Optional[Sink]) -> None:
+    """
+    Sets (or, if `None`, clears) the global metrics sink.
+    """
+
+    global sink
+
+    sink = instance
+
+    logger.debug("Configured Metrics Sink: %s", type(instance).__name__ if instance is not None else None)
+
+def enabled() -> bool:
+    return sink is not None
+
+def normalize(labels: typing.Mapping[str, typing.Any]) -> Labels:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+class Timer:
+    """
+    Measures an operation's latency, and records its outcome, into the global sink upon exit.
+
+    Attributes
+    ----------
+    bytes : int
+        The number of bytes transferred by the operation, if applicable. Set by the instrumented operation.
+    direction : str
+        The transfer's direction ("download", "upload" or "copy"), labelling the bytes counter.
+    """
+
+    __slots__ = ("sink", "labels", "bytes", "direction", "start")
+
+    def __init__(self, instance: Sink, labels: Labels):
+        self.sink = instance
+        self.labels = labels
+        self.bytes = 0
+        self.direction = None
+        self.start = 0.0
+
+    def __enter__(self) -> Timer:
+        self.start = time.perf_counter()
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        duration = time.perf_counter() - self.start
+
+        self.sink.observe("example_aws_operation_duration_seconds", duration, self.labels)
+        self.sink.increment("example_aws_operations_total", 1, self.labels)
+
+        if exc_type is not None:
+            self.sink.increment("example_aws_operation_errors_total", 1, tuple(sorted(self.labels + (("exception", exc_type.__name__),))))
+
+        if self.bytes:
+            self.sink.increment("example_aws_transferred_bytes_total", self.bytes, tuple(sorted(self.labels + (("direction", self.direction or "unknown"),))))
+
+        return False
+
+class Disabled:
+    """
+    A shared, no-op stand-in for `Timer` used while instrumentation is disabled.
+    """
+
+    __slots__ = ()
+
+    bytes = 0
+    direction = None
+
+    def __setattr__(self, key, value):
+        ...
+
+    def __enter__(self) -> Disabled:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+disabled = Disabled()
+
+def timer(operation: str, **labels: str) -> Timer | Disabled:
+    """
+    Returns a context manager measuring the named operation.
+
+        with example.api.metrics.timer("s3.download", bucket=bucket_name) as measurement:
+            ...
+            measurement.bytes, measurement.direction = size, "download"
+    """
+
+    instance = sink
+    if instance is None:
+        return disabled
+
+    return Timer(instance, normalize({"operation": operation, **labels}))
+
+def instrument(client: typing.Any) -> typing.Any:
+    """
+    Registers botocore event handlers on a client to count API requests, errors and retries.
+
+    No handlers are registered while instrumentation is disabled.
+    """
+
+    if sink is None:
+        return client
+
+    def after(http_response=None, parsed=None, model=None, **kwargs):
+        instance = sink
+        if instance is None:
+            return
+
+        labels = normalize({"service": client.meta.service_model.service_name, "api": getattr(model, "name", "unknown")})
+
+        instance.increment("example_aws_requests_total", 1, labels)
+
+        retries = ((parsed or {}).get("ResponseMetadata") or {}).get("RetryAttempts", 0)
+        if retries:
+            instance.increment("example_aws_retries_total", retries, labels)
+
+        status = getattr(http_response, "status_code", None)
+        if status is not None and status >= 400:
+            instance.increment("example_aws_request_errors_total", 1, tuple(sorted(labels + (("status", str(status)),))))
+
+    client.meta.events.register("after-call", after, unique_id="example-api-metrics-after-call")
+
+    return client
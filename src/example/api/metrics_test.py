@@ -0,0 +1,87 @@
+import math
+import logging
+
+import pytest
+
+import example.api.types
+import example.api.metrics
+
+logger = logging.getLogger(__name__)
+
+@pytest.fixture()
+def sink():
+    instance = example.api.metrics.Memory()
+
+    example.api.metrics.configure(instance)
+
+    yield instance
+
+    example.api.metrics.configure(None)
+
+@pytest.mark.description("Unit-Test that verifies histogram bucketing and cumulative counts.")
+def test_histogram():
+    instance = example.api.metrics.Histogram((0.1, 1.0, math.inf))
+
+    for value in (0.05, 0.1, 0.5, 5.0):
+        instance.observe(value)
+
+    assert instance.cumulative() == [(0.1, 2), (1.0, 3), (math.inf, 4)]
+    assert instance.count == 4
+    assert instance.sum == pytest.approx(5.65)
+
+@pytest.mark.description("Unit-Test that verifies the timer is a shared no-op while instrumentation is disabled.")
+def test_timer_disabled():
+    example.api.metrics.configure(None)
+
+    with example.api.metrics.timer("s3.list") as measurement:
+        measurement.bytes = 1024
+
+    assert measurement is example.api.metrics.disabled
+    assert measurement.bytes == 0
+
+@pytest.mark.description("Unit-Test that verifies the timer records latency, counts, errors and bytes.")
+def test_timer(sink: example.api.metrics.Memory, bucket):
+    with example.api.metrics.timer("s3.download", bucket=bucket) as measurement:
+        measurement.bytes, measurement.direction = 2048, "download"
+
+    with pytest.raises(RuntimeError):
+        with example.api.metrics.timer("s3.download", bucket=bucket):
+            raise RuntimeError("Example Exception")
+
+    assert sink.counter("example_aws_operations_total", operation="s3.download", bucket=bucket) == 2
+    assert sink.counter("example_aws_operation_errors_total", operation="s3.download", bucket=bucket, exception="RuntimeError") == 1
+    assert sink.counter("example_aws_transferred_bytes_total", operation="s3.download", bucket=bucket, direction="download") == 2048
+    assert sink.histogram("example_aws_operation_duration_seconds", operation="s3.download", bucket=bucket).count == 2
+
+@pytest.mark.description("Unit-Test that verifies the Prometheus text exposition format.")
+def test_prometheus(sink: example.api.metrics.Memory):
+    sink.increment("example_total", 3, (("operation", "s3.list"),))
+    sink.observe("example_seconds", 0.2, (("operation", "s3.list"),))
+
+    content = example.api.metrics.Prometheus(sink).render()
+
+    logger.debug("Exposition: %s", content)
+
+    assert "# TYPE example_total counter" in content
+    assert 'example_total{operation="s3.list"} 3.0' in content
+    assert 'example_seconds_bucket{operation="s3.list",le="0.25"} 1' in content
+    assert 'example_seconds_bucket{operation="s3.list",le="+Inf"} 1' in content
+    assert 'example_seconds_count{operation="s3.list"} 1' in content
+
+@pytest.mark.description("Unit-Test that verifies S3 operations are instrumented end-to-end.")
+def test_s3_instrumentation(sink: example.api.metrics.Memory, s3, bucket, tmp_path):
+    source = tmp_path.joinpath("source.bin")
+    source.write_bytes(b"0" * 4096)
+
+    s3.upload(example.api.types.S3.Upload(key="object.bin", bucket_name=bucket, source=source))
+    s3.list(example.api.types.S3.List(key="", bucket_name=bucket))
+    s3.download(example.api.types.S3.Download(key="object.bin", bucket_name=bucket, directory=tmp_path.joinpath("downloads")))
+    s3.delete(example.api.types.S3.Delete(key="object.bin", bucket_name=bucket))
+
+    for operation in ("s3.upload", "s3.list", "s3.download", "s3.delete"):
+        assert sink.counter("example_aws_operations_total", operation=operation, bucket=bucket) == 1
+
+    assert sink.counter("example_aws_transferred_bytes_total", operation="s3.upload", bucket=bucket, direction="upload") == 4096
+    assert sink.counter("example_aws_transferred_bytes_total", operation="s3.download", bucket=bucket, direction="download") == 4096
+    assert sink.counter("example_aws_requests_total", service="s3", api="ListObjectsV2") == 1
+    assert sink.histogram("example_aws_client_construction_seconds", service="s3").count >= 4
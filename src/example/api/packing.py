@@ -0,0 +1,433 @@
+"""
+Small-file packing: many small files bundled into sharded tar archives, alongside a sidecar index of member offsets.
+
+Uploading many small files is bound by per-request latency, rather than bandwidth. `pack` streams a directory into tar
+archives ("shards") of a target size, uploading each shard as it's completed (concurrently with the packing of the
+next), and finally uploads a JSON index recording each member's shard, offset and length:
+
+    index = example.api.packing.pack(s3, example.api.types.S3.Pack(source=path, bucket_name="example-bucket", prefix="packs/site/"))
+
+An `Archive` reads the index, and fetches individual members via ranged GETs; `Archive.read_all` coalesces members that
+are adjacent within a shard into a single request:
+
+    archive = example.api.packing.Archive.open(s3, "example-bucket", "packs/site/")
+
+    contents = archive.read_all(["assets/app.js", "index.html"])
+
+Members are compressed individually, rather than as a whole archive, such that each remains independently addressable.
+A compressed member's tar entry is suffixed by its compression's extension (".gz" or ".zst"); the shards remain valid
+tar archives, extractable by standard tools. Each member's CRC32 is verified upon being read.
+
+zstd compression requires the optional `zstandard` package.
+"""
+
+import os
+import json
+import zlib
+import typing
+import logging
+import pathlib
+import tempfile
+
+import example.api.aws
+import example.api.types
+import example.api.metrics
+import example.api.pools
+import example.api.integrity
+
+logger = logging.getLogger(__name__)
+
+Compression = typing.Literal["gzip", "zstd"]
+"""
+The compression of each (individually compressed) member.
+"""
+
+compressions: typing.Tuple[str, ...] = typing.get_args(Compression)
+
+extensions = {"gzip": ".gz", "zstd": ".zst"}
+
+version = 1
+"""
+The index's format version.
+"""
+
+spool = 8 * 1024 * 1024
+"""
+The size (in bytes) beyond which staged members and completed shards are spooled from memory to temporary files.
+"""
+
+def index(prefix: str) -> str:
+    """
+    Returns the key of a pack's index.
+    """
+
+    return prefix + "index.json"
+
+def compressor(compression: typing.Optional[Compression]) -> typing.Any:
+    """
+    Returns a streaming compressor (exposing `compress` and `flush`), or None if uncompressed.
+    """
+
+    if compression is None:
+        return None
+
+    if compression == "gzip":
+        return zlib.compressobj(6, zlib.DEFLATED, 31)
+
+    try:
+        import zstandard
+    except ImportError:  # pragma: no cover - optional dependency
+        raise RuntimeError("zstd Compression Requires the Optional \"zstandard\" Package")
+
+    return zstandard.ZstdCompressor().compressobj()
+
+def decompress(compression: typing.Optional[Compression], data: typing.Any, size: int) -> typing.Any:
+    """
+    Decompresses a member's data, given its uncompressed size.
+
+    Raises
+    ------
+    zlib.error or ValueError
+        If the data is corrupt.
+    """
+
+    if compression is None:
+        return data
+
+    if compression == "gzip":
+        return zlib.decompress(data, 31)
+
+    import zstandard
+
+    try:
+        return zstandard.ZstdDecompressor().decompress(data, max_output_size=size)
+    except zstandard.ZstdError as e:
+        raise ValueError(str(e)) from e
+
+def stage(path: pathlib.Path, compression: typing.Optional[Compression]) -> typing.Tuple[typing.BinaryIO, int, int, int]:
+    """
+    Reads (and compresses) a file into a spooled temporary file, in memory unless large, such that the member's length
+    is known before its tar header is written.
+
+    Returns
+    -------
+    tuple of (typing.BinaryIO, int, int, int)
+        The staged member (positioned at its start), its length, and the file's uncompressed size and CRC32.
+    """
+
+    staged = tempfile.SpooledTemporaryFile(max_size=spool)
+
+    instance = compressor(compression)
+
+    size, crc = 0, 0
+
+    with open(path, "rb") as file:
+        while block := file.read(1024 * 1024):
+            size, crc = size + len(block), zlib.crc32(block, crc)
+
+            staged.write(block if instance is None else instance.compress(block))
+
+    if instance is not None:
+        staged.write(instance.flush())
+
+    length = staged.tell()
+
+    staged.seek(0)
+
+    return staged, length, size, crc
+
+def pack(s3, configuration: example.api.types.S3.Pack) -> dict:
+    """
+    Packs every file within a local directory into tar shards of (approximately) the target size, uploading each shard,
+    and then the pack's index, under the prefix.
+
+    Shards are uploaded concurrently with packing; at most `configuration.concurrency` completed shards are held
+    awaiting upload, each in memory only up to `spool` bytes (and otherwise spooled to a temporary file).
+
+    Parameters
+    ----------
+    s3 : example.api.aws.S3
+        The S3 instance whose client uploads the shards.
+    configuration : example.api.types.S3.Pack
+        The local directory, the destination prefix, the target shard size and the members' compression.
+
+    Returns
+    -------
+    dict
+        The uploaded index: its "shards" (each shard's key, size and number of members), and its "members" (each
+        member's shard, offset, length, uncompressed size and CRC32, by its relative path).
+    """
+
+    import tarfile
+
+    source = pathlib.Path(configuration.source)
+    if not source.is_dir():
+        raise RuntimeError("Source Does Not Exist or Isn't a Valid Directory.")
+
+    if configuration.compression is not None and configuration.compression not in compressions:
+        raise ValueError("Invalid Compression \"{}\" - Must be One of: {}".format(configuration.compression, ", ".join(compressions)))
+
+    bucket_name = configuration.bucket_name
+    prefix = configuration.prefix.removeprefix("/")
+
+    client = s3.client
+
+    paths = sorted(pathlib.Path(root, filename) for root, _, filenames in os.walk(source) for filename in filenames)
+
+    shards: typing.List[dict] = []
+    members: typing.Dict[str, list] = {}
+
+    config = example.api.aws.transfer(configuration.chunk_size, None)
+
+    def upload(buffer: typing.BinaryIO, key: str) -> None:
+        try:
+            client.upload_fileobj(buffer, bucket_name, key, ExtraArgs=configuration.extra_arguments, Config=config)
+        finally:
+            buffer.close()
+
+    def finish(archive: tarfile.TarFile, buffer: typing.BinaryIO) -> typing.Tuple[typing.BinaryIO, str]:
+        archive.close()
+
+        shards[-1]["size"] = buffer.tell()
+
+        buffer.seek(0)
+
+        logger.debug("Packed Shard \"%s\" - %d Member(s), %d Byte(s)", shards[-1]["key"], shards[-1]["members"], shards[-1]["size"])
+
+        return buffer, shards[-1]["key"]
+
+    def produce() -> typing.Iterator[typing.Tuple[typing.BinaryIO, str]]:
+        """
+        Packs the files into shards, yielding each completed shard's buffer and key.
+        """
+
+        archive, buffer = None, None
+
+        for path in paths:
+            name = path.relative_to(source).as_posix()
+
+            staged, length, size, crc = stage(path, configuration.compression)
+
+            with staged:
+                # --> a shard is completed once the next member would exceed the target size.
+                if archive is not None and shards[-1]["members"] and archive.offset + length > configuration.shard_size:
+                    yield finish(archive, buffer)
+
+                    archive = None
+
+                if archive is None:
+                    buffer = tempfile.SpooledTemporaryFile(max_size=spool)
+                    archive = tarfile.open(fileobj=buffer, mode="w", format=tarfile.PAX_FORMAT)
+
+                    shards.append({"key": "{}shard-{:05d}.tar".format(prefix, len(shards)), "size": 0, "members": 0})
+
+                status = path.stat()
+
+                information = tarfile.TarInfo(name + extensions.get(configuration.compression, ""))
+                information.size, information.mtime, information.mode = length, int(status.st_mtime), status.st_mode & 0o777
+
+                archive.addfile(information, staged)
+
+            # --> the member's data precedes the archive's (512-byte block aligned) offset.
+            offset = archive.offset - -(-length // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+
+            members[name] = [len(shards) - 1, offset, length, size, crc]
+            shards[-1]["members"] += 1
+
+        if archive is not None:
+            yield finish(archive, buffer)
+
+    with example.api.metrics.timer("s3.pack", bucket=bucket_name) as measurement:
+        # --> the window bounds the completed shards held awaiting upload; packing resumes as each upload completes.
+        for _ in example.api.pools.execute(upload, produce(), configuration.concurrency, window=configuration.concurrency, name="example-s3-pack"):
+            pass
+
+        document = {"version": version, "compression": configuration.compression, "shards": shards, "members": members}
+
+        client.put_object(Bucket=bucket_name, Key=index(prefix), Body=json.dumps(document, separators=(",", ":")).encode(), ContentType="application/json")
+
+        measurement.bytes, measurement.direction = sum(shard["size"] for shard in shards), "upload"
+
+    logger.info("Packed %d File(s) into %d Shard(s) under \"%s\"", len(members), len(shards), prefix)
+
+    return document
+
+class Archive:
+    """
+    A packed directory (see `pack`), whose members are fetched via ranged GETs.
+
+    Parameters
+    ----------
+    client : typing.Any
+        The (thread-safe) client performing the reads.
+    bucket_name : str
+        Name of the bucket containing the pack.
+    document : dict
+        The pack's index.
+    """
+
+    def __init__(self, client, bucket_name: str, document: dict):
+        if document.get("version") != version:
+            raise RuntimeError("Unsupported Pack Index Version: {}".format(document.get("version")))
+
+        self.client = client
+        self.bucket_name = bucket_name
+        self.document = document
+
+    @classmethod
+    def open(cls, s3, bucket_name: str, prefix: str) -> "Archive":
+        """
+        Reads a pack's index, returning its archive.
+        """
+
+        client = s3.client
+
+        with example.api.aws.disable_ssl_warnings():
+            document = json.loads(client.get_object(Bucket=bucket_name, Key=index(prefix.removeprefix("/")))["Body"].read())
+
+        return cls(client, bucket_name, document)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.document["members"]
+
+    def names(self) -> typing.List[str]:
+        """
+        Returns the members' relative paths, in packing order.
+        """
+
+        return list(self.document["members"])
+
+    def read(self, name: str) -> bytes:
+        """
+        Reads (and decompresses) a single member via a ranged GET.
+
+        Raises
+        ------
+        KeyError
+            If the pack has no such member.
+        example.api.integrity.IntegrityError
+            If the member's CRC32 doesn't match its index entry.
+        """
+
+        return self.read_all([name])[name]
+
+    def read_all(self, names: typing.Iterable[str], concurrency: int = 8, gap: int = 1024 * 1024, span: int = 64 * 1024 * 1024) -> typing.Dict[str, bytes]:
+        """
+        Reads (and decompresses) many members, via concurrent ranged GETs; see `iterate`.
+
+        Returns
+        -------
+        dict of str to bytes
+            Each member's contents, in the order of the given names.
+        """
+
+        names = list(dict.fromkeys(names))
+
+        contents = dict(self.iterate(names, concurrency=concurrency, gap=gap, span=span))
+
+        return {name: contents[name] for name in names}
+
+    def iterate(self, names: typing.Iterable[str], concurrency: int = 8, gap: int = 1024 * 1024, span: int = 64 * 1024 * 1024) -> typing.Iterator[typing.Tuple[str, bytes]]:
+        """
+        Reads (and decompresses) many members via concurrent ranged GETs, yielding each member (and its contents) as
+        its request completes, such that only the requests in flight are held in memory.
+
+        Members within a shard are sorted by offset, and those separated by at most `gap` bytes are coalesced into a
+        single ranged request of at most `span` bytes (i.e. the skipped bytes cost less than another request).
+
+        Raises
+        ------
+        KeyError
+            If the pack has no such member.
+        example.api.integrity.IntegrityError
+            If a member's CRC32 doesn't match its index entry.
+        """
+
+        entries = {name: self.document["members"][name] for name in dict.fromkeys(names)}
+
+        # --> coalesced requests: each a shard, a byte range, and the members within it.
+        requests: typing.List[typing.Tuple[int, int, int, typing.List[str]]] = []
+
+        for name in sorted(entries, key=lambda name: entries[name][:2]):
+            shard, offset, length, *_ = entries[name]
+
+            if requests:
+                previous, start, end, group = requests[-1]
+
+                if previous == shard and offset - end <= gap and offset + length - start <= span:
+                    requests[-1] = (shard, start, max(end, offset + length), group + [name])
+                    continue
+
+            requests.append((shard, offset, offset + length, [name]))
+
+        def function(shard: int, start: int, end: int, group: typing.List[str]) -> typing.Dict[str, bytes]:
+            key = self.document["shards"][shard]["key"]
+
+            with example.api.metrics.timer("s3.read", bucket=self.bucket_name) as measurement:
+                view = memoryview(bytearray(end - start))
+
+                if view:
+                    body = self.client.get_object(Bucket=self.bucket_name, Key=key, Range="bytes={}-{}".format(start, end - 1))["Body"]
+
+                    received = example.api.aws.readinto(body, view)
+                    if received != len(view):
+                        raise RuntimeError("Incomplete Ranged Read of \"{}\": Received {} of {} Byte(s)".format(key, received, len(view)))
+
+                measurement.bytes, measurement.direction = len(view), "download"
+
+            contents = {}
+            for name in group:
+                _, offset, length, size, crc = entries[name]
+
+                try:
+                    data = bytes(decompress(self.document["compression"], view[offset - start:offset - start + length], size))
+                except (zlib.error, ValueError) as e:
+                    raise example.api.integrity.IntegrityError("Decompression of Member \"{}\" of \"{}\" Failed: {}".format(name, key, e)) from e
+
+                if len(data) != size or zlib.crc32(data) != crc:
+                    raise example.api.integrity.IntegrityError("Integrity Verification of Member \"{}\" of \"{}\" Failed".format(name, key))
+
+                contents[name] = data
+
+            return contents
+
+        logger.debug("Reading %d Member(s) via %d Ranged Request(s)", len(entries), len(requests))
+
+        if len(requests) <= 1:
+            results = (function(*request) for request in requests)
+        else:
+            results = example.api.pools.execute(function, requests, concurrency, name="example-s3-read")
+
+        for contents in results:
+            yield from contents.items()
+
+    def extract(self, directory: os.PathLike | str, names: typing.Optional[typing.Iterable[str]] = None, concurrency: int = 8) -> typing.List[pathlib.Path]:
+        """
+        Extracts members (every member, by default) into a local directory, refusing paths outside of it.
+
+        Each (coalesced) request's members are written as the request completes, rather than once every member has
+        been read; see `iterate`.
+
+        Returns
+        -------
+        list of pathlib.Path
+            Each extracted file, in the order of the given names.
+        """
+
+        directory = pathlib.Path(directory).resolve()
+
+        names = list(dict.fromkeys(self.names() if names is None else names))
+
+        targets = {}
+        for name in names:
+            target = directory.joinpath(name).resolve()
+            if not target.is_relative_to(directory):
+                raise ValueError("Member Resolves Outside of the Directory: {}".format(name))
+
+            targets[name] = target
+
+        for name, data in self.iterate(names, concurrency=concurrency):
+            targets[name].parent.mkdir(parents=True, exist_ok=True)
+            targets[name].write_bytes(data)
+
+        return [targets[name] for name in names]
@@ -0,0 +1,116 @@
+import io
+import os
+import json
+import tarfile
+import logging
+
+import pytest
+
+import example.api.types
+import example.api.packing
+import example.api.integrity
+
+logger = logging.getLogger(__name__)
+
+def directory(path):
+    """
+    Populates a directory of small files, returning each file's contents by its relative path.
+    """
+
+    contents = {"index.html": b"<html></html>", "empty.txt": b""}
+    for number in range(12):
+        contents["assets/{:02d}.bin".format(number)] = os.urandom(3000 + number)
+
+    for name, data in contents.items():
+        path.joinpath(name).parent.mkdir(parents=True, exist_ok=True)
+        path.joinpath(name).write_bytes(data)
+
+    return contents
+
+@pytest.mark.description("Unit-Test that verifies a directory is packed into shards of the target size, readable as standard tar archives.")
+def test_pack(s3, bucket, tmp_path, monkeypatch):
+    contents = directory(tmp_path.joinpath("source"))
+
+    # --> staged members and completed shards beyond the threshold are spooled to temporary files.
+    monkeypatch.setattr(example.api.packing, "spool", 4096)
+
+    document = example.api.packing.pack(s3, example.api.types.S3.Pack(source=tmp_path.joinpath("source"), bucket_name=bucket, prefix="packs/site/", shard_size=16 * 1024, concurrency=2))
+
+    assert sorted(document["members"]) == sorted(contents)
+    assert len(document["shards"]) > 1
+    assert sum(shard["members"] for shard in document["shards"]) == len(contents)
+
+    client = s3.client
+
+    assert json.loads(client.get_object(Bucket=bucket, Key="packs/site/index.json")["Body"].read()) == document
+
+    for number, shard in enumerate(document["shards"]):
+        data = client.get_object(Bucket=bucket, Key=shard["key"])["Body"].read()
+
+        assert len(data) == shard["size"]
+
+        with tarfile.open(fileobj=io.BytesIO(data)) as archive:
+            for member in archive.getmembers():
+                _, offset, length, *_ = document["members"][member.name]
+
+                assert document["members"][member.name][0] == number
+                assert (member.offset_data, member.size) == (offset, length)
+                assert data[offset:offset + length] == contents[member.name]
+
+@pytest.mark.description("Unit-Test that verifies members are read via ranged requests, coalescing members adjacent within a shard.")
+def test_read(s3, bucket, wrap, tmp_path):
+    contents = directory(tmp_path.joinpath("source"))
+
+    example.api.packing.pack(s3, example.api.types.S3.Pack(source=tmp_path.joinpath("source"), bucket_name=bucket, prefix="packs/site/", shard_size=16 * 1024))
+
+    archive = example.api.packing.Archive.open(s3, bucket, "packs/site/")
+
+    assert "index.html" in archive and "missing.txt" not in archive
+
+    client = archive.client = wrap("get_object").client
+
+    assert archive.read("index.html") == contents["index.html"]
+    assert archive.read("empty.txt") == b""
+    assert client.calls == 1
+
+    client.requests.clear()
+
+    assert archive.read_all(contents) == contents
+    assert client.calls == len(archive.document["shards"])
+
+    client.requests.clear()
+
+    # --> absent coalescing, each (non-empty) member is a request of its own.
+    assert archive.read_all(contents, gap=0, span=1) == contents
+    assert client.calls == len(contents) - 1
+
+@pytest.mark.description("Unit-Test that verifies individually compressed members, their extraction, and the verification of their CRCs.")
+def test_compression(s3, bucket, wrap, tmp_path):
+    contents = directory(tmp_path.joinpath("source"))
+    contents["compressible.txt"] = b"a" * 100000
+    tmp_path.joinpath("source", "compressible.txt").write_bytes(contents["compressible.txt"])
+
+    document = example.api.packing.pack(s3, example.api.types.S3.Pack(source=tmp_path.joinpath("source"), bucket_name=bucket, prefix="packs/gzip/", compression="gzip"))
+
+    assert document["members"]["compressible.txt"][2] < 1000
+
+    archive = example.api.packing.Archive.open(s3, bucket, "packs/gzip/")
+
+    paths = archive.extract(tmp_path.joinpath("destination"), ["compressible.txt", "assets/03.bin"])
+
+    assert [path.read_bytes() for path in paths] == [contents["compressible.txt"], contents["assets/03.bin"]]
+
+    # --> members are yielded as each (coalesced) request completes, rather than once every member has been read.
+    iterator = archive.iterate(contents, gap=0, span=1)
+
+    name, data = next(iterator)
+    assert data == contents[name]
+    assert sorted([name] + [name for name, _ in iterator]) == sorted(contents)
+
+    archive.client = wrap("get_object", corrupt=1).client
+
+    with pytest.raises(example.api.integrity.IntegrityError):
+        archive.read("compressible.txt")
+
+    with pytest.raises(ValueError):
+        example.api.packing.pack(s3, example.api.types.S3.Pack(source=tmp_path.joinpath("source"), bucket_name=bucket, prefix="packs/invalid/", compression="lzma"))
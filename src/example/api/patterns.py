@@ -0,0 +1,278 @@
+"""
+Pattern-aware S3 listing.
+
+A glob pattern (relative to a listing's key prefix) is evaluated against the bucket's "directory" structure, rather
+than against a full listing of the prefix:
+
+1. The pattern's longest literal prefix is listed, rather than the listing's prefix.
+2. Each wildcard "directory" segment (e.g. "date=2026-*") is resolved by listing with a `Delimiter`, such that only
+   its common prefixes are received; non-matching directories are pruned before they're descended into.
+3. The final segment (or the remainder, from the first recursive "**" segment) is listed, and each key is matched
+   against the pattern's compiled expression during pagination.
+
+    example.api.types.S3.List(key="tables/events/", bucket_name="example-bucket", pattern="date=2026-*/*.parquet")
+
+Glob syntax: "*" matches within a single path segment, "**" matches across segments (including none), "?" matches a
+single character, and "[...]" (or "[!...]") matches a character class. Compiled regular expressions (`re.Pattern`)
+are also accepted; they're matched against the remainder of each key (after the listing's prefix), and only their
+leading literal characters are used to narrow the listing.
+"""
+
+import re
+import typing
+import logging
+import functools
+
+logger = logging.getLogger(__name__)
+
+Pages = typing.Callable[[str, typing.Optional[str]], typing.Iterable[typing.Mapping[str, typing.Any]]]
+"""
+A function returning the `list_objects_v2` pages of a prefix, optionally with a delimiter.
+"""
+
+wildcards = frozenset("*?[")
+
+def escape(text: str) -> str:
+    """
+    Escapes a literal string (e.g. a key prefix) for inclusion in a glob pattern.
+    """
+
+    return "".join("[{}]".format(character) if character in wildcards else character for character in text)
+
+def literal(glob: str) -> str:
+    """
+    Returns the longest literal prefix of a glob pattern (un-escaping any escaped characters).
+    """
+
+    return scan(glob)[0]
+
+def static(glob: str) -> bool:
+    """
+    Returns whether a glob pattern is entirely literal (i.e. contains no wildcards).
+    """
+
+    return scan(glob)[1] == len(glob)
+
+def scan(glob: str) -> typing.Tuple[str, int]:
+    """
+    Returns a glob pattern's longest literal prefix, and the index at which it ends.
+    """
+
+    characters, index = [], 0
+
+    while index < len(glob):
+        character = glob[index]
+
+        # --> a single-character class (e.g. an escaped wildcard: "[*]") is treated as a literal.
+        if character == "[" and index + 2 < len(glob) and glob[index + 2] == "]" and glob[index + 1] not in "!^":
+            characters.append(glob[index + 1])
+            index += 3
+            continue
+
+        if character in wildcards:
+            break
+
+        characters.append(character)
+        index += 1
+
+    return "".join(characters), index
+
+@functools.lru_cache(maxsize=256)
+def translate(glob: str) -> re.Pattern:
+    """
+    Compiles a glob pattern into a regular expression matching entire keys.
+    """
+
+    parts, index = [], 0
+
+    while index < len(glob):
+        character = glob[index]
+
+        if glob.startswith("**/", index):
+            parts.append("(?:.*/)?")
+            index += 3
+        elif glob.startswith("**", index):
+            parts.append(".*")
+            index += 2
+        elif character == "*":
+            parts.append("[^/]*")
+            index += 1
+        elif character == "?":
+            parts.append("[^/]")
+            index += 1
+        elif character == "[":
+            start = index + 1
+            if glob[start:start + 1] in ("!", "^"):
+                start += 1
+
+            # --> a closing bracket immediately following the opening bracket is a member of the class.
+            end = glob.find("]", start + 1)
+            if end < 0:
+                parts.append(re.escape(character))
+                index += 1
+                continue
+
+            body = glob[index + 1:end]
+            if body[:1] in ("!", "^"):
+                body = "^" + body[1:]
+
+            parts.append("[{}]".format(body.replace("\\", "\\\\")))
+            index = end + 1
+        else:
+            parts.append(re.escape(character))
+            index += 1
+
+    return re.compile("".join(parts), re.DOTALL)
+
+def segments(glob: str) -> typing.List[str]:
+    """
+    Splits a glob pattern into its "/"-delimited segments, ignoring delimiters within character classes.
+    """
+
+    results, current, bracket = [], [], False
+
+    for character in glob:
+        if character == "[":
+            bracket = True
+        elif character == "]":
+            bracket = False
+
+        if character == "/" and not bracket:
+            results.append("".join(current))
+            current = []
+        else:
+            current.append(character)
+
+    results.append("".join(current))
+
+    return results
+
+class Matcher:
+    """
+    Matches keys against a pattern relative to a key prefix.
+
+    Parameters
+    ----------
+    prefix : str
+        The listing's (literal) key prefix.
+    pattern : str | re.Pattern
+        A glob pattern, or a compiled regular expression, matched against the remainder of each key.
+    """
+
+    def __init__(self, prefix: str, pattern: typing.Union[str, re.Pattern]):
+        self.prefix = prefix
+        self.pattern = pattern
+
+        if isinstance(pattern, re.Pattern):
+            self.glob = None
+            self.expression = pattern
+            self.literal = prefix + leading(pattern.pattern, pattern.flags)
+        else:
+            self.glob = escape(prefix) + pattern
+            self.expression = translate(self.glob)
+            self.literal = literal(self.glob)
+
+    def __call__(self, key: str) -> bool:
+        if self.glob is not None:
+            return self.expression.fullmatch(key) is not None
+
+        return key.startswith(self.prefix) and self.expression.fullmatch(key, len(self.prefix)) is not None
+
+    def walk(self, pages: Pages) -> typing.Iterator[typing.Mapping[str, typing.Any]]:
+        """
+        Yields the listed objects matching the pattern, in key order, pruning non-matching directories.
+        """
+
+        if self.glob is None:
+            for page in pages(self.literal, None):
+                for item in page.get("Contents", ()):
+                    if self(item["Key"]):
+                        yield item
+
+            return
+
+        yield from self._walk(pages, segments(self.glob), "", 0)
+
+    def _walk(self, pages: Pages, parts: typing.List[str], directory: str, index: int) -> typing.Iterator[typing.Mapping[str, typing.Any]]:
+        segment = parts[index]
+        final = index == len(parts) - 1
+
+        if "**" in segment:
+            # --> recursive segments can't be pruned; the remainder is listed in full, and matched per-key.
+            for page in pages(directory + literal("/".join(parts[index:])), None):
+                for item in page.get("Contents", ()):
+                    if self(item["Key"]):
+                        yield item
+        elif final:
+            for page in pages(directory + literal(segment), "/"):
+                for item in page.get("Contents", ()):
+                    if self(item["Key"]):
+                        yield item
+        elif static(segment):
+            # --> literal directory segments are descended into without a listing.
+            yield from self._walk(pages, parts, directory + literal(segment) + "/", index + 1)
+        else:
+            expression = translate(segment)
+
+            for page in pages(directory + literal(segment), "/"):
+                for common in page.get("CommonPrefixes", ()):
+                    name = common["Prefix"][len(directory):-1]
+
+                    if expression.fullmatch(name) is None:
+                        logger.debug("Pruning Non-Matching Directory: %s", common["Prefix"])
+                        continue
+
+                    yield from self._walk(pages, parts, common["Prefix"], index + 1)
+
+def alternated(expression: str) -> bool:
+    """
+    Returns whether a regular expression's source contains a top-level (unescaped, ungrouped) alternation.
+    """
+
+    depth, escaped, bracket = 0, False, False
+
+    for index, character in enumerate(expression):
+        if escaped:
+            escaped = False
+        elif character == "\\":
+            escaped = True
+        elif bracket:
+            # --> a closing bracket immediately following the opening bracket (or its negation) is a member of the class.
+            if character == "]" and expression[index - 1] != "[" and expression[index - 2:index] != "[^":
+                bracket = False
+        elif character == "[":
+            bracket = True
+        elif character == "(":
+            depth += 1
+        elif character == ")":
+            depth = max(0, depth - 1)
+        elif character == "|" and depth == 0:
+            return True
+
+    return False
+
+def leading(expression: str, flags: int = 0) -> str:
+    """
+    Returns the leading literal characters of a regular expression's source.
+
+    No prefix is derived (i.e. an empty string is returned) if the expression could match keys not beginning with its
+    leading characters: if it contains a top-level alternation (e.g. "foo|bar"), any inline flag or extension group
+    syntax (e.g. "(?i)"), or is compiled case-insensitively or verbosely.
+    """
+
+    if flags & (re.IGNORECASE | re.VERBOSE) or "(?" in expression or alternated(expression):
+        return ""
+
+    characters = []
+
+    for character in expression:
+        if character in ".^$*+?{}[]\\|()":
+            # --> a quantifier applies to the preceding character, which is therefore not literal.
+            if character in "*?{" and characters:
+                characters.pop()
+
+            break
+
+        characters.append(character)
+
+    return "".join(characters)
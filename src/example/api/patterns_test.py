@@ -0,0 +1,151 @@
+import re
+import logging
+
+import pytest
+
+import example.api.types
+import example.api.caches
+import example.api.patterns
+
+logger = logging.getLogger(__name__)
+
+class Bucket:
+    """
+    An in-memory `list_objects_v2` paginator, recording each request and the number of entries returned.
+    """
+
+    def __init__(self, keys: list[str]):
+        self.keys = sorted(keys)
+        self.requests: list[tuple[str, str | None]] = []
+        self.received = 0
+
+    def __call__(self, prefix: str, delimiter: str | None = None):
+        self.requests.append((prefix, delimiter))
+
+        contents, prefixes = [], []
+        for key in self.keys:
+            if not key.startswith(prefix):
+                continue
+
+            remainder = key[len(prefix):]
+            if delimiter and delimiter in remainder:
+                common = prefix + remainder[:remainder.index(delimiter) + len(delimiter)]
+                if not prefixes or prefixes[-1]["Prefix"] != common:
+                    prefixes.append({"Prefix": common})
+            else:
+                contents.append({"Key": key})
+
+        self.received += len(contents) + len(prefixes)
+
+        return [{"Contents": contents, "CommonPrefixes": prefixes}]
+
+def partitioned() -> list[str]:
+    keys = []
+    for year in (2025, 2026):
+        for month in range(1, 13):
+            for index in range(3):
+                directory = "tables/events/date={}-{:02d}/".format(year, month)
+                keys += [directory + "part-{}.parquet".format(index), directory + "part-{}.json".format(index)]
+
+    return keys + ["tables/events/_SUCCESS", "tables/other/date=2026-01/part-0.parquet"]
+
+@pytest.mark.description("Unit-Test that verifies the derivation of a glob pattern's literal prefix.")
+def test_literal():
+    assert example.api.patterns.literal("tables/date=2026-*/*.parquet") == "tables/date=2026-"
+    assert example.api.patterns.literal("logs/[ab]/x") == "logs/"
+    assert example.api.patterns.literal("logs/file?.txt") == "logs/file"
+    assert example.api.patterns.literal(example.api.patterns.escape("odd*name/") + "*") == "odd*name/"
+
+    assert example.api.patterns.static("a/b.txt")
+    assert example.api.patterns.static(example.api.patterns.escape("a?b"))
+    assert not example.api.patterns.static("a*")
+
+@pytest.mark.description("Unit-Test that verifies a regular expression's literal prefix is only derived where every match begins with it.")
+def test_leading():
+    assert example.api.patterns.Matcher("logs/", re.compile(r"abc\d+")).literal == "logs/abc"
+    assert example.api.patterns.Matcher("logs/", re.compile(r"abc(x|y)")).literal == "logs/abc"
+    assert example.api.patterns.Matcher("logs/", re.compile(r"a[|]b")).literal == "logs/a"
+
+    # --> a top-level alternation: "bar..." keys don't begin with "foo".
+    matcher = example.api.patterns.Matcher("logs/", re.compile(r"foo|bar"))
+    assert matcher.literal == "logs/"
+    assert matcher("logs/bar")
+
+    # --> case-insensitive matching: "ABC" doesn't begin with "abc".
+    matcher = example.api.patterns.Matcher("logs/", re.compile(r"abc", re.IGNORECASE))
+    assert matcher.literal == "logs/"
+    assert matcher("logs/ABC")
+
+    assert example.api.patterns.Matcher("logs/", re.compile(r"(?i)abc")).literal == "logs/"
+    assert example.api.patterns.Matcher("logs/", re.compile(r"abc(?i:d)")).literal == "logs/"
+
+    keys = ["logs/ABC", "logs/bar", "logs/foo", "logs/other"]
+
+    assert [item["Key"] for item in example.api.patterns.Matcher("logs/", re.compile(r"foo|bar|abc", re.IGNORECASE)).walk(Bucket(keys))] == ["logs/ABC", "logs/bar", "logs/foo"]
+
+@pytest.mark.description("Unit-Test that verifies compiled glob semantics, including recursive and character class wildcards.")
+def test_translate():
+    expression = example.api.patterns.translate("logs/*.gz")
+    assert expression.fullmatch("logs/a.gz")
+    assert not expression.fullmatch("logs/nested/a.gz")
+
+    expression = example.api.patterns.translate("logs/**/*.gz")
+    assert expression.fullmatch("logs/a.gz")
+    assert expression.fullmatch("logs/x/y/a.gz")
+    assert not expression.fullmatch("other/a.gz")
+
+    assert example.api.patterns.translate("part-[!0].?z").fullmatch("part-1.gz")
+    assert not example.api.patterns.translate("part-[!0].?z").fullmatch("part-0.gz")
+    assert example.api.patterns.translate("[]]").fullmatch("]")
+
+    assert example.api.patterns.segments("a/[/]/c") == ["a", "[/]", "c"]
+
+@pytest.mark.description("Unit-Test that verifies non-matching directories are pruned before being listed.")
+def test_walk_pruning():
+    pages = Bucket(partitioned())
+
+    matcher = example.api.patterns.Matcher("tables/events/", "date=2026-*/*.parquet")
+    keys = [item["Key"] for item in matcher.walk(pages)]
+
+    assert keys == sorted(key for key in partitioned() if re.fullmatch(r"tables/events/date=2026-\d\d/part-\d\.parquet", key))
+
+    # --> a single delimited listing of "date=2026-", followed by one delimited listing per matching partition.
+    assert pages.requests[0] == ("tables/events/date=2026-", "/")
+    assert len(pages.requests) == 1 + 12
+    assert all(prefix.startswith("tables/events/date=2026-") for prefix, _ in pages.requests)
+
+    naive = Bucket(partitioned())
+    naive("tables/events/")
+
+    assert pages.received < naive.received
+
+@pytest.mark.description("Unit-Test that verifies recursive wildcards, and regular expressions, fall back to matching during pagination.")
+def test_walk_recursive():
+    pages = Bucket(partitioned())
+
+    keys = [item["Key"] for item in example.api.patterns.Matcher("tables/", "**/part-0.parquet").walk(pages)]
+
+    assert len(keys) == 24 + 1
+    assert pages.requests == [("tables/", None)]
+
+    pages = Bucket(partitioned())
+
+    keys = [item["Key"] for item in example.api.patterns.Matcher("tables/events/", re.compile(r"date=2025-1[0-2]/.*\.json")).walk(pages)]
+
+    assert len(keys) == 3 * 3
+    assert pages.requests == [("tables/events/date=2025-1", None)]
+
+@pytest.mark.description("Unit-Test that verifies pattern-aware listings against S3, and against the local listing cache.")
+def test_pattern_listing(s3, bucket, tmp_path):
+    client = s3.client
+
+    for key in ("logs/2025-12/a.gz", "logs/2026-01/b.gz", "logs/2026-01/c.txt", "logs/2026-02/nested/d.gz", "logs/2026-03/e.gz"):
+        client.put_object(Bucket=bucket, Key=key, Body=b"")
+
+    configuration = example.api.types.S3.List(key="logs/", bucket_name=bucket, pattern="2026-*/*.gz")
+
+    assert [item["Key"] for item in s3.iterate(configuration)] == ["logs/2026-01/b.gz", "logs/2026-03/e.gz"]
+
+    with example.api.caches.Listings(path=tmp_path.joinpath("listings.sqlite3"), ttl=60) as listings:
+        assert [item["Key"] for item in listings.list(s3, configuration)] == ["logs/2026-01/b.gz", "logs/2026-03/e.gz"]
+        assert len(listings.list(s3, example.api.types.S3.List(key="logs/", bucket_name=bucket))) == 5
@@ -0,0 +1,96 @@
+"""
+Bounded thread pools for concurrent S3 requests.
+
+`execute` applies a function to each item's arguments using a thread pool, yielding each result as it completes (or,
+if ordered, in the items' order). Upon any failure, or if the caller stops iterating (e.g. a keyboard interrupt), the
+items that haven't yet started are cancelled; those in flight are awaited.
+
+    for key, size in example.api.pools.execute(function, [(key,) for key in keys], 8, name="example-s3-copy"):
+        ...
+
+boto3 clients are thread-safe, and botocore releases the GIL while waiting on the network; a single client is shared by
+every thread.
+"""
+
+import typing
+import logging
+
+logger = logging.getLogger(__name__)
+
+def execute(
+    function: typing.Callable[..., typing.Any], items: typing.Iterable[typing.Tuple], concurrency: int,
+    ordered: bool = False, window: typing.Optional[int] = None, name: str = "example-s3",
+) -> typing.Iterator[typing.Any]:
+    """
+    Applies a function to each item's arguments using a thread pool, yielding results in completion order.
+
+    Parameters
+    ----------
+    function : typing.Callable
+        The function, called as `function(*item)`.
+    items : typing.Iterable of tuple
+        Each call's arguments. Items are consumed as they're submitted; with a `window`, they may be produced lazily
+        (e.g. by a generator), alongside the calls in flight.
+    concurrency : int
+        The maximum number of concurrent calls.
+    ordered : bool
+        Whether results are yielded in the items' order, rather than in completion order.
+    window : int, optional
+        The maximum number of items submitted, but whose results haven't yet been yielded (None for no limit).
+    name : str
+        The prefix of the pool's thread names.
+
+    Yields
+    ------
+    typing.Any
+        Each call's result.
+    """
+
+    import collections
+    import concurrent.futures
+
+    if isinstance(items, typing.Sized):
+        concurrency = min(concurrency, len(items))
+
+    executor = concurrent.futures.ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix=name)
+
+    try:
+        if window is None:
+            futures = [executor.submit(function, *item) for item in items]
+
+            for future in futures if ordered else concurrent.futures.as_completed(futures):
+                yield future.result()
+
+            return
+
+        # --> at most `window` items are held submitted; each further item is only consumed once a result is yielded.
+        pending: typing.Deque[concurrent.futures.Future] = collections.deque()
+
+        for item in items:
+            while len(pending) >= max(1, window):
+                yield from results(pending, ordered)
+
+            pending.append(executor.submit(function, *item))
+
+        while pending:
+            yield from results(pending, ordered)
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+def results(pending: typing.Deque, ordered: bool) -> typing.Iterator[typing.Any]:
+    """
+    Removes the next (or, if not ordered, any completed) future(s) from the pending futures, yielding their results.
+    """
+
+    import concurrent.futures
+
+    if ordered:
+        yield pending.popleft().result()
+        return
+
+    done, _ = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+
+    for future in done:
+        pending.remove(future)
+
+        yield future.result()
@@ -0,0 +1,61 @@
+import time
+import logging
+import threading
+
+import pytest
+
+import example.api.pools
+
+logger = logging.getLogger(__name__)
+
+@pytest.mark.description("Unit-Test that verifies results are yielded in completion order, or in the items' order if ordered.")
+def test_execute():
+    def function(number: int, delay: float) -> int:
+        time.sleep(delay)
+
+        return number
+
+    items = [(0, 0.2), (1, 0), (2, 0.1)]
+
+    assert list(example.api.pools.execute(function, items, 3)) == [1, 2, 0]
+    assert list(example.api.pools.execute(function, items, 3, ordered=True)) == [0, 1, 2]
+    assert list(example.api.pools.execute(function, items, 3, window=1)) == [0, 1, 2]
+    assert list(example.api.pools.execute(function, [], 3)) == []
+
+    names = set(example.api.pools.execute(lambda: threading.current_thread().name, [()], 1, name="example-s3-test"))
+    assert all(name.startswith("example-s3-test") for name in names)
+
+@pytest.mark.description("Unit-Test that verifies a window bounds the items consumed ahead of the yielded results.")
+def test_execute_window():
+    consumed = []
+
+    def items():
+        for number in range(6):
+            consumed.append(number)
+
+            yield (number,)
+
+    results = example.api.pools.execute(lambda number: number, items(), 4, ordered=True, window=2)
+
+    assert next(results) == 0
+    assert len(consumed) <= 3
+    assert list(results) == [1, 2, 3, 4, 5]
+
+@pytest.mark.description("Unit-Test that verifies a failure is raised, cancelling the items that haven't yet started.")
+def test_execute_failure():
+    started = []
+
+    def function(number: int) -> int:
+        started.append(number)
+
+        if number == 0:
+            raise RuntimeError("Failure")
+
+        time.sleep(0.05)
+
+        return number
+
+    with pytest.raises(RuntimeError, match="Failure"):
+        list(example.api.pools.execute(function, [(number,) for number in range(100)], 2, ordered=True))
+
+    assert len(started) < 100
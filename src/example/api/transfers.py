@@ -0,0 +1,542 @@
+"""
+Resumable, multipart S3 transfers.
+
+Large uploads and downloads are divided into fixed-size parts, each of which is recorded in an on-disk checkpoint (an
+append-only JSON Lines journal) once transferred. An interrupted transfer, retried with the same configuration,
+verifies its checkpoint and transfers only the missing parts:
+
+- Uploads journal their multipart upload's ID, and each completed part's number and ETag, in the temporary directory.
+  Upon resumption, the source file must be unchanged (by size and modification time), and only the parts that S3
+  lists with the journaled ETags are kept.
+- Downloads are written into a preallocated "<target>.partial" file, journaling each completed part alongside it.
+  Upon resumption, the object's ETag must be unchanged; otherwise, the download restarts.
+
+Downloads (resumable or not; see `download`) are performed as concurrent ranged requests, each written directly at its
+offset within the file.
+
+With `configuration.verify`, each part's digest is computed as it's transferred (and journaled alongside it), and the
+object is verified from its parts' digests once complete; see `example.api.integrity`.
+
+    s3.upload(example.api.types.S3.Upload(key="model.bin", bucket_name="example-bucket", source=path, resume=True))
+
+Multipart uploads that are interrupted and never resumed are retained (and billed) by S3 until they're aborted; see
+`abort`.
+"""
+
+import os
+import json
+import time
+import typing
+import logging
+import pathlib
+import tempfile
+import threading
+import dataclasses
+
+import example.api.types
+import example.api.pools
+import example.api.metrics
+import example.api.integrity
+
+logger = logging.getLogger(__name__)
+
+minimum = 5 * 1024 * 1024
+"""
+The minimum size of a multipart upload's parts (other than the last), in bytes.
+"""
+
+class Journal:
+    """
+    An append-only JSON Lines checkpoint: a header line describing the transfer, followed by one line per completed part.
+
+    Each line is flushed and synced as it's written, such that a checkpoint never records a part that wasn't
+    transferred. A truncated final line (i.e. an interrupted write) is ignored when loaded.
+    """
+
+    def __init__(self, path: os.PathLike | str):
+        self.path = pathlib.Path(path)
+
+        self._file: typing.Optional[typing.TextIO] = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "Journal":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def load(self) -> typing.Tuple[typing.Optional[dict], typing.List[dict]]:
+        """
+        Returns the checkpoint's header (None if there's no checkpoint) and its completed parts.
+        """
+
+        try:
+            lines = self.path.read_text().splitlines()
+        except FileNotFoundError:
+            return None, []
+
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                break
+
+        if not records:
+            return None, []
+
+        return records[0], records[1:]
+
+    def start(self, header: dict, entries: typing.Iterable[dict] = ()) -> None:
+        """
+        (Re)writes the checkpoint with the given header and already-completed parts, discarding any other content.
+        """
+
+        self.close()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._file = open(self.path, "w")
+
+        for entry in (header, *entries):
+            self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+        self._sync()
+
+    def record(self, entry: dict) -> None:
+        """
+        Appends a completed part to the checkpoint.
+        """
+
+        with self._lock:
+            self._file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            self._sync()
+
+    def remove(self) -> None:
+        self.close()
+
+        self.path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _sync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+def checkpoints() -> pathlib.Path:
+    """
+    Returns the default directory of upload checkpoints.
+    """
+
+    return pathlib.Path(tempfile.gettempdir(), "example-s3-transfers")
+
+def partition(size: int, chunk: int) -> typing.List[typing.Tuple[int, int, int]]:
+    """
+    Divides an object into parts, returning each part's (1-based) number, offset and length.
+    """
+
+    return [(number, offset, min(chunk, size - offset)) for number, offset in enumerate(range(0, size, chunk), start=1)]
+
+def chunking(size: int, chunk_size: typing.Optional[int]) -> int:
+    """
+    Returns the part size for an object: the requested (or 8 MiB) chunk size, raised to S3's 5 MiB minimum, and such
+    that the object consists of at most 10,000 parts.
+    """
+
+    return max(chunk_size or 8 * 1024 * 1024, minimum, -(-size // 10000))
+
+def sizing(configuration: example.api.types.S3.Upload, size: int) -> typing.Optional[int]:
+    """
+    Returns the part size with which `S3.upload` uploads a file of the given size (None for a single-part upload); i.e.
+    the part size of the resulting object's ETag.
+    """
+
+    if configuration.resume or configuration.verify:
+        chunk = chunking(size, configuration.chunk_size)
+
+        # --> resumable uploads of files no larger than a part are delegated to (non-resumable) `S3.upload`.
+        if configuration.resume and size > chunk:
+            return chunk
+
+        if configuration.verify:
+            return chunk if size >= chunk else None
+
+    # --> boto3's `upload_file`, whose threshold and (S3-limit adjusted) part size default to 8 MiB.
+    threshold = configuration.chunk_size or 8 * 1024 * 1024
+    if size < threshold:
+        return None
+
+    from s3transfer.utils import ChunksizeAdjuster
+
+    return ChunksizeAdjuster().adjust_chunksize(threshold, size)
+
+def upload(s3, configuration: example.api.types.S3.Upload, directory: typing.Optional[os.PathLike | str] = None) -> typing.Tuple[str, int]:
+    """
+    Uploads a file as a resumable multipart upload, continuing a previously interrupted upload of the same file.
+
+    Files no larger than a single part are uploaded via `S3.upload`, non-resumably.
+
+    Parameters
+    ----------
+    s3 : example.api.aws.S3
+        The S3 instance whose client performs the upload.
+    configuration : example.api.types.S3.Upload
+        The upload's source, destination, chunk size and concurrency.
+    directory : os.PathLike | str, optional
+        The directory of upload checkpoints. Defaults to `checkpoints()`.
+
+    Returns
+    -------
+    tuple of (str, int)
+        The destination key, and the size of the uploaded file in bytes.
+
+    Raises
+    ------
+    example.api.integrity.IntegrityError
+        With `configuration.verify`, if a part's (or the object's) ETag doesn't match the MD5 of the bytes read.
+    """
+
+    source = pathlib.Path(configuration.source)
+    if not source.is_file():
+        raise RuntimeError("Source Does Not Exist or Isn't a Valid File.")
+
+    status = source.stat()
+    size = status.st_size
+
+    chunk = chunking(size, configuration.chunk_size)
+    if size <= chunk:
+        return s3.upload(dataclasses.replace(configuration, resume=False, skip_unchanged=False))
+
+    import base64
+    import hashlib
+    import functools
+
+    key = configuration.key.removeprefix("/")
+    bucket_name = configuration.bucket_name
+
+    client = s3.client
+
+    identifier = hashlib.sha256("\0".join((bucket_name, key, os.fspath(source.resolve()))).encode()).hexdigest()
+
+    header = {"bucket": bucket_name, "key": key, "size": size, "modified": status.st_mtime_ns, "chunk": chunk}
+
+    with example.api.metrics.timer("s3.upload", bucket=bucket_name) as measurement, Journal(pathlib.Path(directory or checkpoints(), identifier + ".jsonl")) as journal:
+        previous, entries = journal.load()
+
+        upload, completed = None, {}
+
+        if previous is not None and all(previous.get(name) == value for name, value in header.items()):
+            completed = verify(client, bucket_name, key, previous["upload"], {entry["part"]: entry["etag"] for entry in entries}, chunk, size)
+
+            if completed is not None:
+                upload = previous["upload"]
+
+                logger.info("Resuming Multipart Upload of \"%s\" - %d of %d Part(s) Completed", key, len(completed), len(partition(size, chunk)))
+            else:
+                completed = {}
+        elif previous is not None:
+            logger.info("Source Changed Since Checkpoint - Aborting Previous Multipart Upload of \"%s\"", key)
+
+            discard(client, bucket_name, key, previous["upload"])
+
+        if upload is None:
+            upload = client.create_multipart_upload(Bucket=bucket_name, Key=key, **(configuration.extra_arguments or {}))["UploadId"]
+
+        journal.start({**header, "upload": upload}, ({"part": number, "etag": etag} for number, etag in sorted(completed.items())))
+
+        missing = [part for part in partition(size, chunk) if part[0] not in completed]
+
+        def function(number: int, offset: int, length: int) -> typing.Tuple[int, str, int]:
+            with open(source, "rb") as file:
+                file.seek(offset)
+                data = file.read(length)
+
+            options = {}
+            if configuration.verify:
+                # --> S3 rejects a part whose received bytes don't match the MD5 of the bytes read.
+                digest = hashlib.md5(data, usedforsecurity=False).digest()
+
+                options.update(ContentMD5=base64.b64encode(digest).decode())
+
+            response = client.upload_part(Bucket=bucket_name, Key=key, UploadId=upload, PartNumber=number, Body=data, **options)
+
+            # --> a part's ETag is its MD5, unless the object is KMS (or customer-key) encrypted.
+            if configuration.verify and "etag" in example.api.integrity.expected(response):
+                example.api.integrity.check({"etag": digest.hex()}, response, "{} (Part {})".format(key, number))
+
+            journal.record({"part": number, "etag": response["ETag"]})
+
+            return number, response["ETag"], length
+
+        transferred = 0
+
+        for number, etag, length in example.api.pools.execute(functools.partial(example.api.integrity.retry, function), missing, configuration.concurrency or 8, name="example-s3-transfer"):
+            completed[number] = etag
+            transferred += length
+
+        response = client.complete_multipart_upload(Bucket=bucket_name, Key=key, UploadId=upload, MultipartUpload={"Parts": [{"PartNumber": number, "ETag": etag} for number, etag in sorted(completed.items())]})
+
+        journal.remove()
+
+        if configuration.verify and "etag" in example.api.integrity.expected(response):
+            # --> the (verified) parts' ETags are their MD5s, from which the object's ETag is derived.
+            example.api.integrity.check({"etag": example.api.integrity.multipart([bytes.fromhex(etag.strip("\"")) for _, etag in sorted(completed.items())])}, response, key)
+
+        measurement.bytes, measurement.direction = transferred, "upload"
+
+    return key, size
+
+def verify(client, bucket_name: str, key: str, upload: str, journaled: typing.Dict[int, str], chunk: int, size: int) -> typing.Optional[typing.Dict[int, str]]:
+    """
+    Returns the journaled parts that S3 lists for a multipart upload (with matching ETags and sizes), or None if the
+    upload no longer exists (e.g. it was completed, or aborted).
+    """
+
+    from botocore.exceptions import ClientError
+
+    lengths = {number: length for number, _, length in partition(size, chunk)}
+
+    completed = {}
+
+    try:
+        for page in client.get_paginator("list_parts").paginate(Bucket=bucket_name, Key=key, UploadId=upload):
+            for part in page.get("Parts", ()):
+                number = part["PartNumber"]
+
+                if journaled.get(number) == part["ETag"] and lengths.get(number) == part["Size"]:
+                    completed[number] = part["ETag"]
+    except ClientError as e:
+        if e.response["Error"]["Code"] in ("NoSuchUpload", "404"):
+            logger.info("Checkpointed Multipart Upload No Longer Exists - Restarting Upload of \"%s\"", key)
+
+            return None
+
+        raise
+
+    return completed
+
+def discard(client, bucket_name: str, key: str, upload: str) -> None:
+    """
+    Aborts a multipart upload, ignoring failures (e.g. the upload no longer exists).
+    """
+
+    from botocore.exceptions import ClientError
+
+    try:
+        client.abort_multipart_upload(Bucket=bucket_name, Key=key, UploadId=upload)
+    except ClientError as e:
+        logger.debug("Unable to Abort Multipart Upload %s of \"%s\": %s", upload, key, e)
+
+def reserve(descriptor: int, directory: str, size: int) -> None:
+    """
+    Preallocates a file of the given size, after verifying that its filesystem has room for the file's unallocated
+    remainder. A download into a full filesystem therefore fails before any request is made, rather than part-way
+    through, and parts written out of order don't fragment (or sparsely extend) the file.
+    """
+
+    import errno
+    import shutil
+
+    allocated = getattr(os.fstat(descriptor), "st_blocks", 0) * 512
+    available = shutil.disk_usage(directory).free
+
+    if available < size - allocated:
+        raise RuntimeError("Insufficient Free Space in \"{}\": {} Byte(s) Required, {} Byte(s) Available".format(directory, size - allocated, available))
+
+    if size == 0:
+        return
+
+    try:
+        os.posix_fallocate(descriptor, 0, size)
+    except AttributeError:  # --> e.g. macOS, or Windows.
+        os.ftruncate(descriptor, size)
+    except OSError as e:
+        if e.errno not in (errno.EINVAL, errno.EOPNOTSUPP, errno.ENOSYS):
+            raise
+
+        # --> the filesystem doesn't support preallocation; the file is extended (sparsely) instead.
+        os.ftruncate(descriptor, size)
+
+def download(s3, configuration: example.api.types.S3.Download) -> pathlib.Path:
+    """
+    Downloads an object as concurrent ranged requests, each streamed directly to its offset (via `os.pwrite`) within a
+    preallocated "<target>.partial" file, which is renamed into place once complete.
+
+    Unlike `download_fileobj`, no part is buffered in full, or reassembled in order. With `configuration.resume`, each
+    completed part is checkpointed, and a previously interrupted download of the same object (by ETag) is continued.
+
+    Parameters
+    ----------
+    s3 : example.api.aws.S3
+        The S3 instance whose client performs the download.
+    configuration : example.api.types.S3.Download
+        The object, the local directory, and the download's chunk size and concurrency.
+
+    Returns
+    -------
+    pathlib.Path
+        Local filesystem path to the downloaded file.
+
+    Raises
+    ------
+    RuntimeError
+        If the directory's filesystem lacks the free space for the object, or a range was incompletely received.
+    example.api.integrity.IntegrityError
+        With `configuration.verify`, if the received bytes don't match the object's ETag (or checksum); the partial file
+        is removed, rather than retained for resumption.
+    """
+
+    key = configuration.key.removeprefix("/")
+    bucket_name = configuration.bucket_name
+
+    client = s3.client
+
+    if configuration.directory is None:
+        directory = tempfile.mkdtemp(prefix="{}-".format("aws-s3-bucket-objects"))
+    else:
+        directory = os.fspath(configuration.directory)
+
+        os.makedirs(directory, exist_ok=True)
+
+    target = os.path.join(directory, os.path.basename(key))
+    partial = target + ".partial"
+
+    resumable = configuration.resume
+
+    with example.api.metrics.timer("s3.download", bucket=bucket_name) as measurement, Journal(partial + ".jsonl") as journal:
+        response = client.head_object(Bucket=bucket_name, Key=key, **({"ChecksumMode": "ENABLED"} if configuration.verify else {}))
+
+        size, etag = response["ContentLength"], response["ETag"]
+
+        chunk = max(configuration.chunk_size or 8 * 1024 * 1024, -(-size // 10000))
+
+        method = None
+        if configuration.verify:
+            method, chunk = example.api.integrity.plan(client, bucket_name, key, response, size, chunk)
+
+        header = {"bucket": bucket_name, "key": key, "etag": etag, "size": size, "chunk": chunk, "verify": method}
+
+        # --> each completed part's digest (None, unless verifying).
+        completed: typing.Dict[int, typing.Any] = {}
+
+        if resumable:
+            previous, entries = journal.load()
+
+            if previous == header and os.path.isfile(partial) and os.path.getsize(partial) == size:
+                completed = {entry["part"]: entry.get("digest") for entry in entries}
+
+                logger.info("Resuming Download of \"%s\" - %d of %d Part(s) Completed", key, len(completed), len(partition(size, chunk)))
+
+        if not completed:
+            open(partial, "wb").close()
+
+        missing = [part for part in partition(size, chunk) if part[0] not in completed]
+
+        descriptor = os.open(partial, os.O_RDWR)
+
+        try:
+            reserve(descriptor, directory, size)
+
+            if resumable:
+                journal.start(header, (entry(number, digest) for number, digest in sorted(completed.items())))
+
+            def function(number: int, offset: int, length: int) -> typing.Tuple[int, int, typing.Any]:
+                # --> conditioned on the object's ETag, such that parts of a since-overwritten object are never mixed.
+                body = client.get_object(Bucket=bucket_name, Key=key, Range="bytes={}-{}".format(offset, offset + length - 1), IfMatch=etag)["Body"]
+
+                digest = example.api.integrity.Digest(method) if method else None
+
+                position = offset
+                for block in body.iter_chunks(chunk_size=1024 * 1024):
+                    if digest is not None:
+                        digest.update(block)
+
+                    view = memoryview(block)
+
+                    while view:
+                        written = os.pwrite(descriptor, view, position)
+
+                        view, position = view[written:], position + written
+
+                if position - offset != length:
+                    raise RuntimeError("Incomplete Ranged Download of \"{}\": Received {} of {} Byte(s)".format(key, position - offset, length))
+
+                value = example.api.integrity.serialize(method, digest) if digest is not None else None
+
+                if resumable:
+                    # --> the part must be durable before it's checkpointed.
+                    getattr(os, "fdatasync", os.fsync)(descriptor)
+
+                    journal.record(entry(number, value))
+
+                return number, length, value
+
+            transferred = 0
+
+            for number, length, value in example.api.pools.execute(function, missing, configuration.concurrency or 8, name="example-s3-transfer"):
+                completed[number] = value
+                transferred += length
+
+            measurement.bytes, measurement.direction = transferred, "download"
+
+            if method is not None:
+                ranges = [(length, completed[number]) for number, _, length in partition(size, chunk)]
+
+                example.api.integrity.check({method: example.api.integrity.assemble(method, ranges, example.api.integrity.parts(etag) is not None)}, response, key)
+        except example.api.integrity.IntegrityError:
+            # --> a corrupt partial file is never resumed.
+            os.unlink(partial)
+
+            journal.remove()
+
+            raise
+        except BaseException:
+            # --> only checkpointed (resumable) partial files are retained.
+            if not resumable:
+                os.unlink(partial)
+
+            raise
+        finally:
+            os.close(descriptor)
+
+        os.replace(partial, target)
+
+        journal.remove()
+
+    return pathlib.Path(target)
+
+def entry(number: int, digest: typing.Any) -> dict:
+    """
+    Returns a downloaded part's checkpoint entry.
+    """
+
+    return {"part": number} if digest is None else {"part": number, "digest": digest}
+
+def abort(s3, bucket_name: str, prefix: str = "", age: float = 24 * 60 * 60) -> typing.Iterator[typing.Tuple[str, str]]:
+    """
+    Aborts the multipart uploads under a prefix that were initiated more than `age` seconds ago (i.e. abandoned
+    uploads), releasing their parts' storage.
+
+    Yields
+    ------
+    tuple of (str, str)
+        Each aborted upload's key and upload ID.
+    """
+
+    client = s3.client
+
+    cutoff = time.time() - age
+
+    for page in client.get_paginator("list_multipart_uploads").paginate(Bucket=bucket_name, Prefix=prefix.removeprefix("/")):
+        for upload in page.get("Uploads", ()):
+            if upload["Initiated"].timestamp() > cutoff:
+                continue
+
+            logger.debug("Aborting Abandoned Multipart Upload %s of \"%s\"", upload["UploadId"], upload["Key"])
+
+            client.abort_multipart_upload(Bucket=bucket_name, Key=upload["Key"], UploadId=upload["UploadId"])
+
+            yield upload["Key"], upload["UploadId"]
@@ -0,0 +1,146 @@
+import os
+import logging
+
+import pytest
+
+import example.api.types
+import example.api.transfers
+
+logger = logging.getLogger(__name__)
+
+MiB = 1024 * 1024
+
+@pytest.mark.description("Unit-Test that verifies checkpoints round-trip, ignoring a truncated final line.")
+def test_journal(tmp_path):
+    path = tmp_path.joinpath("checkpoint.jsonl")
+
+    with example.api.transfers.Journal(path) as journal:
+        assert journal.load() == (None, [])
+
+        journal.start({"size": 10}, [{"part": 1}])
+        journal.record({"part": 2})
+
+    with open(path, "a") as file:
+        file.write("{\"part\":")
+
+    assert example.api.transfers.Journal(path).load() == ({"size": 10}, [{"part": 1}, {"part": 2}])
+
+@pytest.mark.description("Unit-Test that verifies the part size respects S3's minimum part size and maximum part count.")
+def test_chunking():
+    assert example.api.transfers.chunking(100 * MiB, None) == 8 * MiB
+    assert example.api.transfers.chunking(100 * MiB, 1) == 5 * MiB
+    assert example.api.transfers.chunking(10000 * 10 * MiB, 8 * MiB) == 10 * MiB
+
+    assert example.api.transfers.partition(12, 5) == [(1, 0, 5), (2, 5, 5), (3, 10, 2)]
+
+@pytest.mark.description("Unit-Test that verifies an interrupted upload resumes, uploading only its missing parts.")
+def test_upload_resume(s3, bucket, wrap, tmp_path):
+    source = tmp_path.joinpath("source.bin")
+    source.write_bytes(os.urandom(12 * MiB))
+
+    configuration = example.api.types.S3.Upload(key="resumable.bin", bucket_name=bucket, source=source, chunk_size=5 * MiB, concurrency=1, progress=False, resume=True)
+
+    with pytest.raises(RuntimeError, match="Injected Failure"):
+        example.api.transfers.upload(wrap("upload_part", failure=2), configuration, directory=tmp_path.joinpath("checkpoints"))
+
+    assert len(list(tmp_path.joinpath("checkpoints").iterdir())) == 1
+
+    instance = wrap("upload_part")
+
+    key, size = example.api.transfers.upload(instance, configuration, directory=tmp_path.joinpath("checkpoints"))
+
+    assert (key, size) == ("resumable.bin", 12 * MiB)
+    assert instance.client.calls == 1
+
+    assert s3.client.get_object(Bucket=bucket, Key=key)["Body"].read() == source.read_bytes()
+    assert list(tmp_path.joinpath("checkpoints").iterdir()) == []
+
+@pytest.mark.description("Unit-Test that verifies an interrupted download resumes, unless the object has since changed.")
+def test_download_resume(s3, bucket, wrap, tmp_path):
+    body = os.urandom(12 * MiB)
+
+    s3.client.put_object(Bucket=bucket, Key="data/resumable.bin", Body=body)
+
+    directory = tmp_path.joinpath("downloads")
+
+    configuration = example.api.types.S3.Download(key="data/resumable.bin", bucket_name=bucket, directory=directory, chunk_size=5 * MiB, concurrency=1, resume=True)
+
+    with pytest.raises(RuntimeError, match="Injected Failure"):
+        example.api.transfers.download(wrap("get_object", failure=1), configuration)
+
+    assert directory.joinpath("resumable.bin.partial").exists()
+
+    instance = wrap("get_object")
+
+    path = example.api.transfers.download(instance, configuration)
+
+    assert instance.client.calls == 2
+    assert path.read_bytes() == body
+    assert sorted(os.listdir(directory)) == ["resumable.bin"]
+
+    # --> an object overwritten since the interruption is downloaded in full.
+    with pytest.raises(RuntimeError, match="Injected Failure"):
+        example.api.transfers.download(wrap("get_object", failure=1), configuration)
+
+    body = os.urandom(12 * MiB)
+
+    s3.client.put_object(Bucket=bucket, Key="data/resumable.bin", Body=body)
+
+    instance = wrap("get_object")
+
+    assert example.api.transfers.download(instance, configuration).read_bytes() == body
+    assert instance.client.calls == 3
+
+@pytest.mark.description("Unit-Test that verifies ranged downloads write each range at its offset within a preallocated file.")
+def test_download_ranged(s3, bucket, wrap, tmp_path):
+    body = os.urandom(12 * MiB + 3)
+
+    s3.client.put_object(Bucket=bucket, Key="data/ranged.bin", Body=body)
+
+    instance = wrap("get_object")
+
+    configuration = example.api.types.S3.Download(key="data/ranged.bin", bucket_name=bucket, directory=tmp_path, chunk_size=2 * MiB, concurrency=4, ranged=True)
+
+    path = example.api.transfers.download(instance, configuration)
+
+    assert instance.client.calls == 7
+    assert path.read_bytes() == body
+    assert sorted(os.listdir(tmp_path)) == ["ranged.bin"]
+
+    s3.client.put_object(Bucket=bucket, Key="data/empty.bin", Body=b"")
+
+    assert s3.download(example.api.types.S3.Download(key="data/empty.bin", bucket_name=bucket, directory=tmp_path, ranged=True)).read_bytes() == b""
+
+@pytest.mark.description("Unit-Test that verifies the file is preallocated, and that downloads fail upfront without sufficient free space.")
+def test_reserve(s3, bucket, wrap, tmp_path, monkeypatch):
+    import shutil
+    import collections
+
+    path = tmp_path.joinpath("preallocated.bin")
+
+    with open(path, "wb") as file:
+        example.api.transfers.reserve(file.fileno(), str(tmp_path), 3 * MiB)
+
+    assert path.stat().st_size == 3 * MiB
+
+    s3.client.put_object(Bucket=bucket, Key="data/large.bin", Body=b"0" * MiB)
+
+    usage = collections.namedtuple("usage", ("total", "used", "free"))
+    monkeypatch.setattr(shutil, "disk_usage", lambda _: usage(MiB, MiB - 1024, 1024))
+
+    instance = wrap("get_object")
+
+    with pytest.raises(RuntimeError, match="Insufficient Free Space"):
+        example.api.transfers.download(instance, example.api.types.S3.Download(key="data/large.bin", bucket_name=bucket, directory=tmp_path.joinpath("full"), ranged=True))
+
+    assert instance.client.calls == 0
+    assert os.listdir(tmp_path.joinpath("full")) == []
+
+@pytest.mark.description("Unit-Test that verifies abandoned multipart uploads are aborted.")
+def test_abort(s3, bucket):
+    upload = s3.client.create_multipart_upload(Bucket=bucket, Key="abandoned.bin")["UploadId"]
+
+    assert list(example.api.transfers.abort(s3, bucket, age=float("inf"))) == []
+    assert list(example.api.transfers.abort(s3, bucket, age=0)) == [("abandoned.bin", upload)]
+
+    assert s3.client.list_multipart_uploads(Bucket=bucket).get("Uploads", []) == []
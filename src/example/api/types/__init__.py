@@ -1,6 +1,12 @@
+import re
+import typing
 import dataclasses
 import pathlib
 
+if typing.TYPE_CHECKING:
+    import example.api.caches
+    import example.api.packing
+
 @dataclasses.dataclass
 class S3:
     """
@@ -26,7 +32,27 @@ class S3:
         bucket_name : str
             Name of the storage bucket from which the resource is to be downloaded.
         directory : pathlib.Path
-            Path to the local directory where the downloaded resources will be saved.
+            Path to the local directory where the downloaded resources will be saved. A pooled
+            `example.utilities.workspaces.Workspace` may be provided in place of a path to avoid
+            creating a new temporary directory per download.
+        chunk_size : int, optional
+            The multipart (ranged) download chunk size, in bytes. Defaults to boto3's default.
+        concurrency : int, optional
+            The maximum number of threads downloading the object's parts. Defaults to boto3's default.
+        progress : bool, optional
+            Whether to display a progress bar. Defaults to displaying one only for capable terminals outside of CI.
+        cache : example.api.caches.Objects, optional
+            A shared object cache. If provided, the object is only downloaded if it isn't already cached (by its
+            ETag), and is then delivered into the directory as a hard link, reflink or copy.
+        ranged : bool
+            Whether to download via concurrent ranged requests, each written directly at its offset within a
+            preallocated file (see `example.api.transfers.download`), rather than via boto3's sequential file object.
+        resume : bool
+            Whether to download via a resumable, checkpointed (and ranged) transfer, continuing any previously
+            interrupted download of the same object.
+        verify : bool
+            Whether to verify the downloaded bytes against the object's ETag or full-object checksum, computing the
+            digest as the bytes are received (see `example.api.integrity`). A mismatch is retried once before failing.
 
         Notes
         -----
@@ -37,6 +63,16 @@ class S3:
         bucket_name: str
         directory: pathlib.Path
 
+        chunk_size: typing.Optional[int] = None
+        concurrency: typing.Optional[int] = None
+        progress: typing.Optional[bool] = None
+
+        cache: typing.Optional["example.api.caches.Objects"] = None
+
+        ranged: bool = False
+        resume: bool = False
+        verify: bool = False
+
     @dataclasses.dataclass
     class Upload:
         """
@@ -55,6 +91,21 @@ class S3:
             Name of the bucket where the file will be uploaded.
         source : pathlib.Path
             Local path to the file that needs to be uploaded.
+        chunk_size : int, optional
+            The multipart upload chunk size (and threshold), in bytes. Defaults to boto3's default.
+        concurrency : int, optional
+            The maximum number of threads uploading the file's parts. Defaults to boto3's default.
+        progress : bool, optional
+            Whether to display a progress bar. Defaults to displaying one only for capable terminals outside of CI.
+        resume : bool
+            Whether to upload via a resumable, checkpointed multipart upload (see `example.api.transfers`),
+            continuing any previously interrupted upload of the same file.
+        verify : bool
+            Whether to verify the uploaded object's ETag (or full-object checksum) against the digests computed as the
+            file is read for upload (see `example.api.integrity`). A mismatch is retried once before failing.
+        skip_unchanged : bool
+            Whether to skip the upload if the remote object is identical: of the same size, and with the ETag that the
+            file would be uploaded with (see `example.api.aws.S3.unchanged`).
 
         Notes
         -----
@@ -68,6 +119,158 @@ class S3:
 
         extra_arguments: dict[str, any] = None
 
+        chunk_size: typing.Optional[int] = None
+        concurrency: typing.Optional[int] = None
+        progress: typing.Optional[bool] = None
+
+        resume: bool = False
+        verify: bool = False
+        skip_unchanged: bool = False
+
+    @dataclasses.dataclass
+    class Copy:
+        """
+        Represents a server-side s3 copy configuration; the object's bytes never transit the local host.
+
+        Objects up to `chunk_size` are copied via a single `copy_object` request; larger objects are copied via
+        concurrent `upload_part_copy` requests, each copying a byte range of the source object.
+
+        Attributes
+        ----------
+        source_bucket : str
+            Name of the bucket containing the source object.
+        source_key : str
+            The source object's key.
+        bucket_name : str
+            Name of the destination bucket.
+        key : str
+            The destination object's key.
+        chunk_size : int, optional
+            The multipart copy part size (and threshold), in bytes. Defaults to 64 MiB.
+        concurrency : int, optional
+            The maximum number of concurrent part copies. Defaults to 8.
+        extra_arguments : dict, optional
+            Additional destination arguments (e.g. "StorageClass", "ServerSideEncryption" or "Metadata"). Both single
+            request and multipart copies inherit the source's metadata, overridden by these arguments.
+        """
+
+        source_bucket: str
+        source_key: str
+        bucket_name: str
+        key: str
+
+        chunk_size: typing.Optional[int] = None
+        concurrency: typing.Optional[int] = None
+
+        extra_arguments: typing.Optional[dict[str, typing.Any]] = None
+
+    @dataclasses.dataclass
+    class Replicate:
+        """
+        Represents a bulk, server-side s3 copy of every object under a prefix.
+
+        Attributes
+        ----------
+        source_bucket : str
+            Name of the bucket containing the source objects.
+        source_prefix : str
+            The key prefix to copy; a non-empty prefix is "/"-terminated (i.e. "build/1" copies "build/1/", but not
+            "build/10/").
+        bucket_name : str
+            Name of the destination bucket.
+        prefix : str
+            The destination key prefix (likewise "/"-terminated), replacing `source_prefix` in each copied key.
+        pattern : str | re.Pattern, optional
+            Only copy keys matching the pattern (see `List.pattern`).
+        concurrency : int
+            The total number of concurrent copy requests, divided between objects in flight and their parts.
+        chunk_size : int, optional
+            The multipart copy part size (and threshold), in bytes.
+        extra_arguments : dict, optional
+            Additional destination arguments applied to every copied object.
+        """
+
+        source_bucket: str
+        source_prefix: str
+        bucket_name: str
+        prefix: str
+
+        pattern: typing.Optional[typing.Union[str, re.Pattern]] = None
+
+        concurrency: int = 8
+        chunk_size: typing.Optional[int] = None
+
+        extra_arguments: typing.Optional[dict[str, typing.Any]] = None
+
+    @dataclasses.dataclass
+    class Publish:
+        """
+        Represents an idempotent, bulk s3 upload of every file within a local directory, skipping unchanged files.
+
+        Attributes
+        ----------
+        source : pathlib.Path
+            The local directory to upload, recursively.
+        bucket_name : str
+            Name of the destination bucket.
+        prefix : str
+            The destination key prefix, prepended to each file's (POSIX) path relative to the directory.
+        concurrency : int
+            The total number of concurrent transfers (and hashing threads), divided between files and their parts.
+        chunk_size : int, optional
+            The multipart upload chunk size (and threshold), in bytes.
+        extra_arguments : dict, optional
+            Additional arguments applied to every uploaded object.
+        """
+
+        source: pathlib.Path
+        bucket_name: str
+        prefix: str
+
+        concurrency: int = 8
+        chunk_size: typing.Optional[int] = None
+
+        extra_arguments: typing.Optional[dict[str, typing.Any]] = None
+
+    @dataclasses.dataclass
+    class Pack:
+        """
+        Represents the packing of a local directory's (small) files into sharded tar archives, alongside an index of
+        their offsets (see `example.api.packing`).
+
+        Attributes
+        ----------
+        source : pathlib.Path
+            The local directory to pack, recursively.
+        bucket_name : str
+            Name of the destination bucket.
+        prefix : str
+            The key prefix of the pack's shards ("<prefix>shard-00000.tar", ...) and index ("<prefix>index.json").
+        shard_size : int
+            The target size of each shard, in bytes. Defaults to 64 MiB.
+        compression : str, optional
+            The compression of each member: "gzip" or "zstd" (which requires the optional `zstandard` package).
+            Defaults to uncompressed.
+        concurrency : int
+            The maximum number of shards uploaded concurrently (and held awaiting upload).
+        chunk_size : int, optional
+            The multipart upload chunk size (and threshold) of each shard, in bytes.
+        extra_arguments : dict, optional
+            Additional arguments applied to each shard's upload.
+        """
+
+        source: pathlib.Path
+        bucket_name: str
+        prefix: str
+
+        shard_size: int = 64 * 1024 * 1024
+        compression: typing.Optional["example.api.packing.Compression"] = None
+
+        concurrency: int = 4
+        chunk_size: typing.Optional[int] = None
+
+        extra_arguments: typing.Optional[dict[str, typing.Any]] = None
+
     @dataclasses.dataclass
     class Delete:
         key: str
@@ -75,5 +278,100 @@ class S3:
 
     @dataclasses.dataclass
     class List:
+        """
+        Represents an s3 listing configuration.
+
+        Attributes
+        ----------
+        key : str
+            The key prefix to list.
+        bucket_name : str
+            Name of the bucket to list.
+        start_after : str, optional
+            Only list keys sorting after this key (e.g. the last key of a previous listing).
+        pattern : str | re.Pattern, optional
+            A glob pattern (e.g. "date=2026-*/*.parquet"), or compiled regular expression, matched against the
+            remainder of each key after `key`. See `example.api.patterns`.
+        """
+
         key: str
         bucket_name: str
+
+        start_after: typing.Optional[str] = None
+        pattern: typing.Optional[typing.Union[str, re.Pattern]] = None
+
+    @dataclasses.dataclass
+    class Purge:
+        """
+        Represents a batched s3 deletion of many objects.
+
+        Attributes
+        ----------
+        bucket_name : str
+            Name of the bucket containing the objects.
+        keys : typing.Iterable[str]
+            The keys to delete. May be a lazy iterable (e.g. a listing), consumed in batches of 1000.
+        """
+
+        bucket_name: str
+        keys: typing.Iterable[str]
+
+    @dataclasses.dataclass
+    class Read:
+        """
+        Represents an in-memory read of an object.
+
+        Attributes
+        ----------
+        key : str
+            The object's key.
+        bucket_name : str
+            Name of the bucket containing the object.
+        """
+
+        key: str
+        bucket_name: str
+
+    @dataclasses.dataclass
+    class ReadAll:
+        """
+        Represents concurrent in-memory reads of many (small) objects.
+
+        Attributes
+        ----------
+        bucket_name : str
+            Name of the bucket containing the objects.
+        keys : typing.Iterable[str]
+            The objects' keys.
+        concurrency : int, optional
+            The maximum number of concurrent requests. Defaults to the client's connection pool size
+            (`example.api.aws.Settings.connections`).
+        """
+
+        bucket_name: str
+        keys: typing.Iterable[str]
+
+        concurrency: typing.Optional[int] = None
+
+    @dataclasses.dataclass
+    class Write:
+        """
+        Represents an in-memory write of a bytes-like object (e.g. `bytes`, `bytearray` or a `memoryview`) to an object.
+
+        Attributes
+        ----------
+        key : str
+            The destination key.
+        bucket_name : str
+            Name of the destination bucket.
+        data : typing.Any
+            The bytes-like object written; it isn't copied.
+        extra_arguments : dict, optional
+            Additional arguments to the PutObject request (e.g. "ContentType").
+        """
+
+        key: str
+        bucket_name: str
+        data: typing.Any
+
+        extra_arguments: typing.Optional[dict[str, typing.Any]] = None
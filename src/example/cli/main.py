@@ -3,45 +3,118 @@ An example entrypoint.
 """
 
 import re
+import time
+import typing
 import logging
-import argparse
+
+import typer
+
+import example.cli.s3
+import example.logging.queues
+import example.cli.profiling
 
 handler = logging.StreamHandler()
 
 logger = logging.getLogger(__name__)
 
 class Formatter(logging.Formatter):
-    expression = r"(?<!\w)'([^\s']+)'(?!\w)"
+    expression = re.compile(r"(?<!\w)'([^\s']+)'(?!\w)")
     substitution = r'"\1"'
 
+    def __init__(self, *args, cache: bool = True, **kwargs):
+        """
+        Parameters
+        ----------
+        cache : bool
+            Whether to reuse the formatted timestamp (excluding milliseconds) for records created within the same second.
+        """
+
+        super().__init__(*args, **kwargs)
+
+        self.cache = cache
+
+        # --> a single (key, value) tuple, replaced atomically, such that sharing the formatter across threads is safe.
+        self._timestamp: tuple = (None, None)
+
+    def formatTime(self, record, datefmt=None) -> str:
+        if not self.cache:
+            return super().formatTime(record, datefmt)
+
+        key = (int(record.created), datefmt)
+
+        cached, v = self._timestamp
+        if cached != key:
+            v = time.strftime(datefmt or self.default_time_format, self.converter(record.created))
+
+            self._timestamp = (key, v)
+
+        if datefmt is None and self.default_msec_format:
+            v = self.default_msec_format % (v, record.msecs)
+
+        return v
+
     def format(self, record) -> str:
         # Modify the record or format the message as needed.
         v = super().format(record)  # .replace("'", "%s" % '"')
 
-        return re.sub(self.expression, self.substitution, v)
+        # --> avoid scanning messages that cannot match.
+        if "'" not in v:
+            return v
+
+        return self.expression.sub(self.substitution, v)
 
 formatter = Formatter("[%(levelname)s] (%(asctime)s) (%(name)s) %(message)s")
 
 handler.setFormatter(formatter)
 
-def executable():
-    logging.basicConfig(level=logging.DEBUG, datefmt="%Y-%m-%dT%H:%M:%SZ")
-    logger.addHandler(handler)
-    logger.propagate = False
+Level = typing.Literal["DEBUG", "INFO", "ERROR"]
+
+application = typer.Typer(name="example-script-name", help="Python Example Template", no_args_is_help=True, pretty_exceptions_enable=False)
+
+application.add_typer(example.cli.s3.application, name="s3")
 
-    # Create an argument parser object.
-    parser = argparse.ArgumentParser(description="Python Example Template")
+@application.callback()
+def options(
+    context: typer.Context,
+    verbose: typing.Annotated[bool, typer.Option("--verbose", help="toggle verbose output", rich_help_panel="logging")] = False,
+    log_level: typing.Annotated[Level, typer.Option("--log-level", metavar="LEVEL", help="the global logging level to display", rich_help_panel="logging")] = "INFO",
+    log_queue_size: typing.Annotated[int, typer.Option("--log-queue-size", min=1, metavar="SIZE", help="the maximum number of log records buffered before the overflow policy applies", rich_help_panel="logging")] = 10000,
+    log_queue_policy: typing.Annotated[example.logging.queues.Policy, typer.Option("--log-queue-policy", metavar="POLICY", help="the behavior when the log buffer is full", rich_help_panel="logging")] = "drop",
+    profile: typing.Annotated[typing.Optional[str], typer.Option("--profile", metavar="PATH", help="profile the command with cProfile, writing sorted statistics to the given file", rich_help_panel="profiling")] = None,
+    profile_sort: typing.Annotated[example.cli.profiling.Sort, typer.Option("--profile-sort", metavar="KEY", help="the profile statistics' sort key", rich_help_panel="profiling")] = "cumulative",
+    trace_memory: typing.Annotated[bool, typer.Option("--trace-memory", help="trace memory allocations, reporting the top allocation sites at exit", rich_help_panel="profiling")] = False,
+    timings: typing.Annotated[bool, typer.Option("--timings", help="report per-phase wall-clock and CPU durations at exit", rich_help_panel="profiling")] = False,
+):
+    """
+    Configures logging and profiling for the invoked subcommand.
+    """
 
-    parser_group_1 = parser.add_argument_group("logging")
-    parser_group_1.add_argument("--verbose", type=bool, help="toggle verbose output", metavar="")
-    parser_group_1.add_argument("--log-level", type=str, choices=["DEBUG", "INFO", "ERROR"], metavar="LEVEL", help="the global logging level to display", required=False, default="INFO")
+    # --> resources registered on the context are exited, in reverse order, once the subcommand completes.
+    if timings:
+        wall, cpu = (context.obj or {}).get("started", (time.perf_counter(), time.process_time()))
 
-    # Parse arguments.
-    namespace = parser.parse_args()
+        context.with_resource(example.cli.profiling.timed()).record("arguments", time.perf_counter() - wall, time.process_time() - cpu)
+    # --> the memory trace is entered last (and therefore exits first) to exclude the profiler's own allocations.
+    if profile:
+        context.with_resource(example.cli.profiling.profile(profile, sort=profile_sort))
+    if trace_memory:
+        context.with_resource(example.cli.profiling.trace())
 
-    arguments = vars(namespace)
+    # --> records are only enqueued on the calling thread; formatting and writes occur on the pipeline's listener thread.
+    with example.cli.profiling.phase("logging"):
+        pipeline = context.with_resource(example.logging.queues.Pipeline(handler, capacity=log_queue_size, policy=log_queue_policy))
+
+        # --> exited before the pipeline stops, such that later records (e.g. at exit) aren't enqueued onto an unread queue.
+        context.with_resource(example.logging.queues.installed(pipeline.handler, logging.DEBUG if verbose else log_level))
+
+    logger.debug("Arguments: %r", context.params)
+
+    context.with_resource(example.cli.profiling.phase("execution"))
+
+def executable():
+    started = time.perf_counter(), time.process_time()
 
-    logger.debug("Arguments: %r", arguments)
+    application(obj={"started": started})
 
 if __name__ == "__main__":
     executable()
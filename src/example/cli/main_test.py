@@ -0,0 +1,32 @@
+import logging
+
+import pytest
+
+import example.cli.main
+
+logger = logging.getLogger(__name__)
+
+def record(msg: str, *args) -> logging.LogRecord:
+    return logging.makeLogRecord({"name": __name__, "levelno": logging.INFO, "levelname": "INFO", "msg": msg, "args": args, "created": 1760000000.25, "msecs": 250.0})
+
+@pytest.mark.description("Unit-Test that verifies the formatter converts single-quoted tokens to double-quotes.")
+def test_formatter_substitution():
+    instance = example.cli.main.Formatter("%(message)s")
+
+    assert instance.format(record("Arguments: %r", {"key": "value"})) == 'Arguments: {"key": "value"}'
+    assert instance.format(record("Don't Modify Contractions")) == "Don't Modify Contractions"
+    assert instance.format(record("No Quotes")) == "No Quotes"
+
+@pytest.mark.description("Unit-Test that verifies the formatter's cached timestamps match the standard-library's output.")
+@pytest.mark.parametrize("datefmt", [None, "%Y-%m-%dT%H:%M:%SZ"])
+def test_formatter_timestamp_cache(datefmt):
+    cached = example.cli.main.Formatter("%(asctime)s", datefmt=datefmt)
+    uncached = logging.Formatter("%(asctime)s", datefmt=datefmt)
+
+    for _ in range(2):
+        assert cached.format(record("Message")) == uncached.format(record("Message"))
+
+    later = record("Message")
+    later.created, later.msecs = 1760000001.5, 500.0
+
+    assert cached.format(later) == uncached.format(later)
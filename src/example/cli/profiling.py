@@ -0,0 +1,179 @@
+"""
+In-place profiling for CLI command(s).
+
+Provides context managers for CPU profiling (`cProfile`), memory allocation tracing (`tracemalloc`), and
+per-phase wall-clock and CPU timings. Commands can mark their own phases via `phase`, which is a no-op unless
+timings were enabled on the entry point (e.g. via `--timings`).
+
+    with example.cli.profiling.phase("download"):
+        ...
+"""
+
+import io
+import os
+import sys
+import time
+import typing
+import logging
+import contextlib
+
+# --> cProfile, pstats and tracemalloc are imported within the functions requiring them, such that commands run
+#     without profiling don't incur their import cost(s).
+
+logger = logging.getLogger(__name__)
+
+Sort = typing.Literal["cumulative", "tottime", "calls", "ncalls", "filename", "name"]
+"""
+The supported `pstats` sort key(s).
+"""
+
+sorting: typing.Tuple[str, ...] = typing.get_args(Sort)
+
+@contextlib.contextmanager
+def profile(path: os.PathLike | str, sort: Sort = "cumulative", limit: typing.Optional[int] = None) -> typing.Iterator["cProfile.Profile"]:
+    """
+    Profiles the enclosed block with `cProfile`, writing sorted statistics to a file upon exit.
+
+    The human-readable report is written to `path`; the raw statistics (loadable via `pstats`, `snakeviz`, etc.)
+    are written alongside it with an additional ".pstats" suffix.
+
+    Parameters
+    ----------
+    path : os.PathLike | str
+        The report's file path.
+    sort : Sort
+        The `pstats` sort key.
+    limit : int, optional
+        The maximum number of functions included in the report. Defaults to all.
+    """
+
+    if sort not in sorting:
+        raise ValueError("Invalid Profile Sort Key: {}. Valid Key(s): {}".format(sort, ", ".join(sorting)))
+
+    import pstats
+    import cProfile
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+
+        with open(path, "w") as file:
+            statistics = pstats.Stats(profiler, stream=file)
+            statistics.sort_stats(sort).print_stats(*([limit] if limit is not None else []))
+
+        profiler.dump_stats("{}.pstats".format(os.fspath(path)))
+
+        logger.debug("Wrote Profile Statistics: %s", os.fspath(path))
+
+@contextlib.contextmanager
+def trace(limit: int = 25, frames: int = 1, stream: typing.Optional[typing.TextIO] = None) -> typing.Iterator[None]:
+    """
+    Traces memory allocations within the enclosed block, writing the top allocation sites upon exit.
+
+    Parameters
+    ----------
+    limit : int
+        The number of allocation sites reported.
+    frames : int
+        The number of stack frames recorded per allocation.
+    stream : typing.TextIO, optional
+        The report's destination. Defaults to standard-error.
+    """
+
+    import tracemalloc
+
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start(frames)
+
+    try:
+        yield None
+    finally:
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+
+        if started:
+            tracemalloc.stop()
+
+        snapshot = snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ))
+
+        buffer = io.StringIO()
+        buffer.write("Memory Allocations - Current: {:.1f} KiB, Peak: {:.1f} KiB\n".format(current / 1024, peak / 1024))
+        buffer.write("Top {} Allocation Site(s):\n".format(limit))
+
+        for index, statistic in enumerate(snapshot.statistics("traceback" if frames > 1 else "lineno")[:limit], start=1):
+            buffer.write("  {:>3}. {:.1f} KiB in {} Block(s): {}\n".format(index, statistic.size / 1024, statistic.count, statistic.traceback.format()[-1].strip() if frames > 1 else str(statistic.traceback[0])))
+
+        (stream or sys.stderr).write(buffer.getvalue())
+
+class Timings:
+    """
+    Records per-phase wall-clock and CPU durations.
+    """
+
+    def __init__(self):
+        self.phases: typing.List[typing.Tuple[str, float, float]] = []
+
+    def record(self, name: str, wall: float, cpu: float) -> None:
+        self.phases.append((name, wall, cpu))
+
+    @contextlib.contextmanager
+    def phase(self, name: str) -> typing.Iterator[None]:
+        wall, cpu = time.perf_counter(), time.process_time()
+
+        try:
+            yield None
+        finally:
+            self.record(name, time.perf_counter() - wall, time.process_time() - cpu)
+
+    def summary(self) -> str:
+        width = max([len("Phase")] + [len(name) for name, _, _ in self.phases])
+
+        lines = ["{:<{width}}  {:>12}  {:>12}".format("Phase", "Wall (ms)", "CPU (ms)", width=width)]
+        for name, wall, cpu in self.phases:
+            lines.append("{:<{width}}  {:>12.3f}  {:>12.3f}".format(name, wall * 1000, cpu * 1000, width=width))
+
+        lines.append("{:<{width}}  {:>12.3f}  {:>12.3f}".format("Total", sum(wall for _, wall, _ in self.phases) * 1000, sum(cpu for _, _, cpu in self.phases) * 1000, width=width))
+
+        return "\n".join(lines) + "\n"
+
+timings: typing.Optional[Timings] = None
+"""
+The active timings, if enabled on the entry point.
+"""
+
+@contextlib.contextmanager
+def timed(stream: typing.Optional[typing.TextIO] = None) -> typing.Iterator[Timings]:
+    """
+    Enables (global) per-phase timings within the enclosed block, writing a summary upon exit.
+    """
+
+    global timings
+
+    instance = timings = Timings()
+
+    try:
+        yield instance
+    finally:
+        timings = None
+
+        (stream or sys.stderr).write(instance.summary())
+
+def phase(name: str) -> typing.ContextManager:
+    """
+    Marks the enclosed block as a named phase when timings are enabled; otherwise, a no-op.
+    """
+
+    instance = timings
+    if instance is None:
+        return contextlib.nullcontext()
+
+    return instance.phase(name)
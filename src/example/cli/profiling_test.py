@@ -0,0 +1,66 @@
+import io
+import pstats
+import logging
+
+import pytest
+
+import example.cli.profiling
+
+logger = logging.getLogger(__name__)
+
+def workload() -> list[bytes]:
+    return [bytes(1024) for _ in range(256)]
+
+@pytest.mark.description("Unit-Test that verifies cProfile statistics are written, sorted, to the given file.")
+def test_profile(tmp_path):
+    target = tmp_path.joinpath("profile.txt")
+
+    with example.cli.profiling.profile(target, sort="tottime"):
+        workload()
+
+    content = target.read_text()
+
+    assert "Ordered by: internal time" in content
+    assert "workload" in content
+
+    assert pstats.Stats(str(target) + ".pstats").total_calls > 0
+
+@pytest.mark.description("Unit-Test that verifies an unsupported sort key is rejected.")
+def test_profile_invalid_sort(tmp_path):
+    with pytest.raises(ValueError):
+        with example.cli.profiling.profile(tmp_path.joinpath("profile.txt"), sort="invalid"):
+            ...
+
+@pytest.mark.description("Unit-Test that verifies the top allocation sites are reported upon exit.")
+def test_trace():
+    stream = io.StringIO()
+
+    with example.cli.profiling.trace(limit=5, stream=stream):
+        retained = workload()
+
+    content = stream.getvalue()
+
+    logger.debug("Report: %s", content)
+
+    assert len(retained) == 256
+    assert "Top 5 Allocation Site(s)" in content
+    assert "profiling_test.py" in content
+
+@pytest.mark.description("Unit-Test that verifies per-phase timings are only recorded while enabled.")
+def test_timings():
+    with example.cli.profiling.phase("disabled"):
+        ...
+
+    stream = io.StringIO()
+
+    with example.cli.profiling.timed(stream=stream) as timings:
+        with example.cli.profiling.phase("workload"):
+            workload()
+
+    assert [name for name, _, _ in timings.phases] == ["workload"]
+    assert example.cli.profiling.timings is None
+
+    summary = stream.getvalue()
+
+    assert "workload" in summary
+    assert "Total" in summary
@@ -0,0 +1,673 @@
+"""
+Bulk S3 command(s): `ls`, `du`, `get`, `put`, `rm`, `sync`, and the small-file `pack` and `unpack`.
+
+Objects are transferred concurrently; the `--concurrency` budget is split between the number of objects in flight and
+each object's multipart (part-level) threads, such that the total number of transfer threads remains bounded. Results
+are streamed to standard-output as each object completes, either as human-readable lines or, via `--json`, as JSON
+Lines; logging is written to standard-error.
+
+    $ example-script-name s3 sync ./artifacts s3://example-bucket/artifacts/ --concurrency 32 --json
+"""
+
+import os
+import re
+import sys
+import typing
+import logging
+import pathlib
+import datetime
+
+import typer
+
+import example.api.aws
+import example.api.pools
+import example.api.packing
+import example.api.listings
+import example.api.transfers
+import example.api.types
+import example.cli.profiling
+import example.logging.structured
+
+logger = logging.getLogger(__name__)
+
+application = typer.Typer(name="s3", help="Bulk Amazon S3 operations.", no_args_is_help=True)
+
+Record = typing.Dict[str, typing.Any]
+
+units = {"": 1, "B": 1, "K": 1000, "KB": 1000, "KIB": 1024, "M": 1000 ** 2, "MB": 1000 ** 2, "MIB": 1024 ** 2, "G": 1000 ** 3, "GB": 1000 ** 3, "GIB": 1024 ** 3}
+
+def size(value: str) -> int:
+    """
+    Parses a human-readable byte size (e.g. "8MiB", "16MB", "1048576") into a number of bytes.
+    """
+
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([A-Za-z]*)\s*", value)
+    if match is None or match.group(2).upper() not in units:
+        raise typer.BadParameter("Invalid Size: {}. Expected a Number of Bytes, Optionally Suffixed by a Unit (e.g. 8MiB)".format(value))
+
+    return int(float(match.group(1)) * units[match.group(2).upper()])
+
+def location(value: str) -> typing.Tuple[str, str]:
+    """
+    Splits an "s3://bucket/key" URI into its bucket and key.
+    """
+
+    if not value.startswith("s3://") or not value.removeprefix("s3://").split("/", 1)[0]:
+        raise typer.BadParameter("Invalid S3 URI: {}. Expected s3://bucket[/key]".format(value))
+
+    bucket, _, key = value.removeprefix("s3://").partition("/")
+
+    return bucket, key
+
+def split(concurrency: int, count: int) -> typing.Tuple[int, int]:
+    """
+    Splits a concurrency budget into the number of concurrent objects, and each object's concurrent parts.
+    """
+
+    workers = max(1, min(concurrency, count))
+
+    return workers, max(1, concurrency // workers)
+
+def contained(directory: pathlib.Path, relative: str) -> pathlib.Path:
+    """
+    Returns the local path of a key relative to a directory, refusing keys that would escape the directory.
+    """
+
+    root = directory.resolve()
+    target = root.joinpath(relative).resolve()
+
+    if target != root and root not in target.parents:
+        raise ValueError("Key Resolves Outside of the Destination Directory: {}".format(relative))
+
+    return target
+
+def emit(record: Record, structured: bool) -> None:
+    """
+    Writes a single result record to standard-output (or, for human-readable errors, standard-error).
+    """
+
+    if structured:
+        sys.stdout.write(example.logging.structured.dumps(record) + "\n")
+    elif "error" in record:
+        sys.stderr.write("error: s3://{}/{}: {}\n".format(record.get("bucket"), record.get("key"), record["error"]))
+    elif record.get("operation") == "ls":
+        sys.stdout.write("{}  {:>14}  {}\n".format(datetime.datetime.fromtimestamp(record["modified"], tz=datetime.timezone.utc).strftime("%Y-%m-%d %H:%M:%S"), record["size"], record["key"]))
+    elif record.get("operation") == "du":
+        sys.stdout.write("{:>14}  {:>10}  {}{}\n".format(record["size"], record["count"], "  " * (record["depth"] - 1), record["prefix"]))
+    elif record.get("operation") == "rm":
+        sys.stdout.write("rm: s3://{}/{}\n".format(record["bucket"], record["key"]))
+    elif record.get("operation") == "abort":
+        sys.stdout.write("abort: s3://{}/{} (upload {})\n".format(record["bucket"], record["key"], record["upload"]))
+    elif record.get("operation") == "cp":
+        sys.stdout.write("cp: {} -> s3://{}/{}\n".format(record["source"], record["bucket"], record["key"]))
+    elif record.get("operation") == "pack":
+        sys.stdout.write("pack: s3://{}/{} ({} member(s), {} byte(s))\n".format(record["bucket"], record["key"], record["members"], record["size"]))
+    elif record.get("operation") == "unpack":
+        sys.stdout.write("unpack: s3://{}/{}{} -> {}\n".format(record["bucket"], record["prefix"], record["member"], record["path"]))
+    elif record.get("operation") == "get":
+        sys.stdout.write("get: s3://{}/{} -> {}\n".format(record["bucket"], record["key"], record["path"]))
+    elif record.get("skipped"):
+        sys.stdout.write("skip: {} = s3://{}/{} (unchanged)\n".format(record["path"], record["bucket"], record["key"]))
+    else:
+        sys.stdout.write("put: {} -> s3://{}/{}\n".format(record["path"], record["bucket"], record["key"]))
+
+    sys.stdout.flush()
+
+def parallel(function: typing.Callable[[typing.Any], Record], items: typing.Sequence[typing.Any], workers: int) -> typing.Iterator[Record]:
+    """
+    Applies a function to each item using a thread pool, yielding results in completion order.
+    """
+
+    if workers <= 1:
+        yield from map(function, items)
+        return
+
+    # --> on interruption (e.g. a keyboard interrupt), the transfers that haven't yet started are cancelled.
+    yield from example.api.pools.execute(function, [(item,) for item in items], workers)
+
+def report(records: typing.Iterable[Record], structured: bool) -> None:
+    """
+    Emits each record, exiting with a non-zero status if any operation failed.
+    """
+
+    total, failures = 0, 0
+    for record in records:
+        total += 1
+        if "error" in record:
+            failures += 1
+
+        emit(record, structured)
+
+    logger.debug("Completed %d Operation(s) - Failure(s): %d", total, failures)
+
+    if failures:
+        raise typer.Exit(code=1)
+
+def client(concurrency: int) -> example.api.aws.S3:
+    """
+    Returns an S3 instance whose (single, shared) client's connection pool accommodates the given concurrency.
+    """
+
+    return example.api.aws.S3(settings=example.api.aws.Settings(connections=max(10, concurrency)), reuse=True)
+
+def download(s3: example.api.aws.S3, bucket: str, key: str, directory: pathlib.Path, chunk_size: int, concurrency: int, modified: typing.Optional[float] = None, resume: bool = False, ranged: bool = False, verify: bool = False) -> Record:
+    record: Record = {"operation": "get", "bucket": bucket, "key": key}
+
+    try:
+        target = s3.download(example.api.types.S3.Download(key=key, bucket_name=bucket, directory=directory, chunk_size=chunk_size, concurrency=concurrency, progress=False, ranged=ranged, resume=resume, verify=verify))
+
+        # --> preserve the object's modification time, such that subsequent syncs can skip the unchanged file.
+        if modified is not None:
+            os.utime(target, (modified, modified))
+
+        record.update(path=str(target), size=target.stat().st_size)
+    except Exception as e:
+        logger.debug("Unable to Download s3://%s/%s: %s", bucket, key, e)
+
+        record.update(error=str(e))
+
+    return record
+
+def upload(s3: example.api.aws.S3, bucket: str, key: str, source: pathlib.Path, chunk_size: int, concurrency: int, resume: bool = False, verify: bool = False, skip_unchanged: bool = False, remote: typing.Optional[dict] = None) -> Record:
+    record: Record = {"operation": "put", "bucket": bucket, "key": key, "path": str(source)}
+
+    try:
+        configuration = example.api.types.S3.Upload(key=key, bucket_name=bucket, source=source, chunk_size=chunk_size, concurrency=concurrency, progress=False, resume=resume, verify=verify)
+
+        # --> compared here (rather than via `configuration.skip_unchanged`), such that skipped files are reported.
+        if skip_unchanged and s3.unchanged(configuration, remote):
+            record.update(size=source.stat().st_size, skipped=True)
+
+            return record
+
+        _, total = s3.upload(configuration)
+
+        record.update(size=total)
+    except Exception as e:
+        logger.debug("Unable to Upload %s to s3://%s/%s: %s", source, bucket, key, e)
+
+        record.update(error=str(e))
+
+    return record
+
+def files(sources: typing.Iterable[pathlib.Path], recursive: bool) -> typing.Iterator[typing.Tuple[pathlib.Path, str]]:
+    """
+    Yields each local source file alongside its path relative to the given source (its basename, for files).
+    """
+
+    for source in sources:
+        if source.is_file():
+            yield source, source.name
+        elif source.is_dir():
+            if not recursive:
+                raise typer.BadParameter("Source is a Directory (use --recursive): {}".format(source))
+
+            for root, _, filenames in os.walk(source):
+                for filename in sorted(filenames):
+                    path = pathlib.Path(root, filename)
+
+                    yield path, path.relative_to(source).as_posix()
+        else:
+            raise typer.BadParameter("Source Does Not Exist: {}".format(source))
+
+Concurrency = typing.Annotated[int, typer.Option("--concurrency", "-c", min=1, help="the maximum number of concurrent transfer threads")]
+ChunkSize = typing.Annotated[str, typer.Option("--chunk-size", help="the multipart chunk size (e.g. 8MiB)")]
+Structured = typing.Annotated[bool, typer.Option("--json", help="stream results as JSON Lines")]
+Recursive = typing.Annotated[bool, typer.Option("--recursive", "-r", help="treat key(s) as prefixes, and local directories recursively")]
+Resume = typing.Annotated[bool, typer.Option("--resume", help="checkpoint multipart transfers, continuing any previously interrupted transfer of the same object(s)")]
+Verify = typing.Annotated[bool, typer.Option("--verify", help="verify each object's ETag (or checksum) against digests computed as its bytes are transferred")]
+Pattern = typing.Annotated[typing.Optional[str], typer.Option("--pattern", "-p", help="only include keys matching a glob pattern relative to the prefix (e.g. \"date=2026-*/*.parquet\")")]
+
+@application.command("ls")
+def ls(
+    uri: typing.Annotated[str, typer.Argument(help="the s3://bucket/prefix to list")],
+    cache_ttl: typing.Annotated[typing.Optional[float], typer.Option("--cache-ttl", min=0, metavar="SECONDS", help="serve the listing from the local listing cache, refreshing it once older than the given number of seconds")] = None,
+    pattern: Pattern = None,
+    structured: Structured = False,
+):
+    """
+    List the objects under a prefix, streaming each page as it's received.
+    """
+
+    # --> deferred, such that other commands don't incur sqlite3's import cost.
+    import example.api.caches
+
+    bucket, prefix = location(uri)
+
+    s3 = client(1)
+
+    configuration = example.api.types.S3.List(key=prefix, bucket_name=bucket, pattern=pattern)
+
+    with example.cli.profiling.phase("list"):
+        if cache_ttl is None:
+            items = s3.iterate(configuration)
+        else:
+            with example.api.caches.Listings(ttl=cache_ttl) as listings:
+                items = listings.list(s3, configuration)
+
+        for item in items:
+            emit({"operation": "ls", "bucket": bucket, "key": item["Key"], "size": item["Size"], "modified": item["LastModified"], "etag": item.get("ETag", "").strip("\"")}, structured)
+
+@application.command("du")
+def du(
+    uri: typing.Annotated[str, typer.Argument(help="the s3://bucket/prefix to summarize")],
+    depth: typing.Annotated[int, typer.Option("--depth", "-d", min=1, help="the number of directory levels reported")] = 1,
+    delimiter: typing.Annotated[str, typer.Option("--delimiter", help="the directory delimiter")] = "/",
+    largest: typing.Annotated[int, typer.Option("--largest", "-n", min=0, help="additionally report the given number of largest objects")] = 0,
+    structured: Structured = False,
+):
+    """
+    Summarize the object count and total size of each directory beneath a prefix.
+    """
+
+    bucket, prefix = location(uri)
+
+    s3 = client(1)
+
+    with example.cli.profiling.phase("list"):
+        listing = s3.listing(example.api.types.S3.List(key=prefix, bucket_name=bucket))
+
+    with example.cli.profiling.phase("index"):
+        index = example.api.listings.Index(listing)
+
+    with example.cli.profiling.phase("aggregate"):
+        for level, aggregate in index.du(prefix, depth=depth, delimiter=delimiter):
+            emit({"operation": "du", "bucket": bucket, "prefix": aggregate.prefix, "depth": level, "count": aggregate.count, "size": aggregate.size}, structured)
+
+        emit({"operation": "du", "bucket": bucket, "prefix": prefix or "(total)", "depth": 1, "count": len(index), "size": index.total()}, structured)
+
+        if largest:
+            for entry in index.largest(largest):
+                emit({"operation": "ls", "bucket": bucket, "key": entry.key, "size": entry.size, "modified": entry.modified, "etag": entry.etag}, structured)
+
+@application.command("cat")
+def cat(
+    uris: typing.Annotated[typing.List[str], typer.Argument(help="the s3://bucket/key(s) to write to standard-output")],
+    concurrency: Concurrency = 8,
+):
+    """
+    Write one or more objects' contents to standard-output, reading the objects concurrently into memory.
+    """
+
+    s3 = client(concurrency)
+
+    locations = [location(uri) for uri in uris]
+
+    buckets: typing.Dict[str, typing.List[str]] = {}
+    for bucket, key in locations:
+        buckets.setdefault(bucket, []).append(key)
+
+    from botocore.exceptions import BotoCoreError, ClientError
+
+    contents: typing.Dict[str, typing.Dict[str, memoryview]] = {}
+
+    with example.cli.profiling.phase("read"):
+        for bucket, keys in buckets.items():
+            try:
+                contents[bucket] = s3.read_all(example.api.types.S3.ReadAll(bucket_name=bucket, keys=keys, concurrency=concurrency))
+            except (BotoCoreError, ClientError, RuntimeError) as e:
+                logger.debug("Unable to Read Object(s) from s3://%s", bucket, exc_info=True)
+
+                # --> nothing is written to standard-output unless every object was read.
+                sys.stderr.write("error: s3://{}: {}\n".format(bucket, e))
+
+                raise typer.Exit(code=1)
+
+    with example.cli.profiling.phase("write"):
+        for bucket, key in locations:
+            sys.stdout.buffer.write(contents[bucket][key])
+
+        sys.stdout.flush()
+
+@application.command("get")
+def get(
+    uris: typing.Annotated[typing.List[str], typer.Argument(help="the s3://bucket/key(s) to download")],
+    directory: typing.Annotated[pathlib.Path, typer.Option("--directory", "-d", help="the local destination directory")] = pathlib.Path("."),
+    recursive: Recursive = False,
+    pattern: Pattern = None,
+    concurrency: Concurrency = 8,
+    chunk_size: ChunkSize = "8MiB",
+    resume: Resume = False,
+    ranged: typing.Annotated[bool, typer.Option("--ranged", help="download each object as concurrent ranged requests written directly into a preallocated file")] = False,
+    verify: Verify = False,
+    structured: Structured = False,
+):
+    """
+    Download one or more objects (or, recursively, prefixes) into a local directory.
+    """
+
+    if pattern is not None and not recursive:
+        raise typer.BadParameter("A Pattern Requires --recursive")
+
+    chunk = size(chunk_size)
+
+    s3 = client(concurrency)
+
+    with example.cli.profiling.phase("list"):
+        items: typing.List[typing.Tuple[str, str, pathlib.Path]] = []
+        for uri in uris:
+            bucket, key = location(uri)
+
+            if not recursive:
+                items.append((bucket, key, directory))
+                continue
+
+            # --> e.g. "data" downloads the keys under "data/", but not those under "database/".
+            key = example.api.aws.terminate(key)
+
+            for item in s3.iterate(example.api.types.S3.List(key=key, bucket_name=bucket, pattern=pattern)):
+                if item["Key"].endswith("/"):
+                    continue
+
+                relative = item["Key"].removeprefix(key)
+
+                items.append((bucket, item["Key"], directory.joinpath(relative).parent))
+
+    workers, parts = split(concurrency, len(items))
+
+    def function(item: typing.Tuple[str, str, pathlib.Path]) -> Record:
+        bucket, key, target = item
+
+        try:
+            contained(directory, os.path.relpath(target.joinpath(os.path.basename(key)), directory))
+        except ValueError as e:
+            return {"operation": "get", "bucket": bucket, "key": key, "error": str(e)}
+
+        return download(s3, bucket, key, target, chunk, parts, resume=resume, ranged=ranged, verify=verify)
+
+    with example.cli.profiling.phase("transfer"):
+        report(parallel(function, items, workers), structured)
+
+@application.command("put")
+def put(
+    sources: typing.Annotated[typing.List[pathlib.Path], typer.Argument(help="the local file(s) or directories to upload")],
+    uri: typing.Annotated[str, typer.Argument(help="the destination s3://bucket/key, or s3://bucket/prefix/ for multiple sources")],
+    recursive: Recursive = False,
+    concurrency: Concurrency = 8,
+    chunk_size: ChunkSize = "8MiB",
+    resume: Resume = False,
+    verify: Verify = False,
+    skip_unchanged: typing.Annotated[bool, typer.Option("--skip-unchanged", help="skip files whose objects are identical, by size and locally computed ETag")] = False,
+    structured: Structured = False,
+):
+    """
+    Upload one or more local files (or, recursively, directories) to a key or prefix.
+    """
+
+    chunk = size(chunk_size)
+
+    bucket, destination = location(uri)
+
+    items = list(files(sources, recursive))
+
+    # --> a single file uploaded to a key (rather than a "/"-terminated prefix) is uploaded to that exact key.
+    prefix = len(items) != 1 or recursive or destination == "" or destination.endswith("/")
+
+    workers, parts = split(concurrency, len(items))
+
+    s3 = client(concurrency)
+
+    def function(item: typing.Tuple[pathlib.Path, str]) -> Record:
+        source, relative = item
+
+        return upload(s3, bucket, destination + relative if prefix else destination, source, chunk, parts, resume=resume, verify=verify, skip_unchanged=skip_unchanged)
+
+    with example.cli.profiling.phase("transfer"):
+        report(parallel(function, items, workers), structured)
+
+@application.command("cp")
+def cp(
+    source: typing.Annotated[str, typer.Argument(help="the source s3://bucket/key, or s3://bucket/prefix with --recursive")],
+    destination: typing.Annotated[str, typer.Argument(help="the destination s3://bucket/key, or s3://bucket/prefix/")],
+    recursive: Recursive = False,
+    pattern: Pattern = None,
+    concurrency: Concurrency = 8,
+    chunk_size: ChunkSize = "64MiB",
+    structured: Structured = False,
+):
+    """
+    Copy an object (or, recursively, a prefix) server-side, between or within buckets, without downloading it.
+    """
+
+    if pattern is not None and not recursive:
+        raise typer.BadParameter("A Pattern Requires --recursive")
+
+    chunk = size(chunk_size)
+
+    source_bucket, source_key = location(source)
+    bucket, key = location(destination)
+
+    s3 = client(concurrency)
+
+    def records() -> typing.Iterator[Record]:
+        if recursive:
+            configuration = example.api.types.S3.Replicate(source_bucket=source_bucket, source_prefix=source_key, bucket_name=bucket, prefix=key, pattern=pattern, concurrency=concurrency, chunk_size=chunk)
+
+            for copied, target, error in s3.replicate(configuration):
+                yield {"operation": "cp", "source": "s3://{}/{}".format(source_bucket, copied), "bucket": bucket, "key": target, **({"error": error} if error is not None else {})}
+
+            return
+
+        # --> a "/"-terminated (or empty) destination is a prefix, to which the source's basename is appended.
+        target = key + os.path.basename(source_key) if key == "" or key.endswith("/") else key
+
+        record: Record = {"operation": "cp", "source": source, "bucket": bucket, "key": target}
+
+        try:
+            _, total = s3.copy(example.api.types.S3.Copy(source_bucket=source_bucket, source_key=source_key, bucket_name=bucket, key=target, chunk_size=chunk, concurrency=concurrency))
+
+            record.update(size=total)
+        except Exception as e:
+            logger.debug("Unable to Copy %s to s3://%s/%s: %s", source, bucket, target, e)
+
+            record.update(error=str(e))
+
+        yield record
+
+    with example.cli.profiling.phase("copy"):
+        report(records(), structured)
+
+@application.command("rm")
+def rm(
+    uris: typing.Annotated[typing.List[str], typer.Argument(help="the s3://bucket/key(s) to delete")],
+    recursive: Recursive = False,
+    pattern: Pattern = None,
+    structured: Structured = False,
+):
+    """
+    Delete one or more objects (or, recursively, every object under the prefixes) using batched delete requests.
+    """
+
+    if pattern is not None and not recursive:
+        raise typer.BadParameter("A Pattern Requires --recursive")
+
+    locations = [location(uri) for uri in uris]
+
+    # --> validated before any deletion; a bucket's (empty) key is never deleted as though it were an object.
+    for bucket, key in locations:
+        if not key and not recursive:
+            raise typer.BadParameter("Object Key Required (use --recursive to delete every object): s3://{}".format(bucket))
+
+    s3 = client(1)
+
+    def records() -> typing.Iterator[Record]:
+        for bucket, key in locations:
+            # --> e.g. "build/1" deletes the keys under "build/1/", but not those under "build/10/".
+            keys = (item["Key"] for item in s3.iterate(example.api.types.S3.List(key=example.api.aws.terminate(key), bucket_name=bucket, pattern=pattern))) if recursive else [key]
+
+            for deleted, error in s3.purge(example.api.types.S3.Purge(bucket_name=bucket, keys=keys)):
+                yield {"operation": "rm", "bucket": bucket, "key": deleted, **({"error": error} if error is not None else {})}
+
+    with example.cli.profiling.phase("delete"):
+        report(records(), structured)
+
+@application.command("abort")
+def abort(
+    uri: typing.Annotated[str, typer.Argument(help="the s3://bucket/prefix whose abandoned multipart uploads are aborted")],
+    older_than: typing.Annotated[float, typer.Option("--older-than", min=0, metavar="SECONDS", help="only abort uploads initiated more than the given number of seconds ago")] = 24 * 60 * 60,
+    structured: Structured = False,
+):
+    """
+    Abort abandoned (e.g. interrupted, and never resumed) multipart uploads, releasing their parts' storage.
+    """
+
+    bucket, prefix = location(uri)
+
+    s3 = client(1)
+
+    def records() -> typing.Iterator[Record]:
+        for key, upload in example.api.transfers.abort(s3, bucket, prefix, age=older_than):
+            yield {"operation": "abort", "bucket": bucket, "key": key, "upload": upload}
+
+    with example.cli.profiling.phase("abort"):
+        report(records(), structured)
+
+@application.command("sync")
+def sync(
+    source: typing.Annotated[str, typer.Argument(help="the local directory or s3://bucket/prefix to synchronize from")],
+    destination: typing.Annotated[str, typer.Argument(help="the s3://bucket/prefix or local directory to synchronize to")],
+    concurrency: Concurrency = 8,
+    chunk_size: ChunkSize = "8MiB",
+    structured: Structured = False,
+):
+    """
+    Synchronize a local directory with a prefix, transferring only new or changed (by size or modification time) files.
+
+    Uploads of files modified since their object, but of the same size, are skipped if their ETags are unchanged.
+    """
+
+    chunk = size(chunk_size)
+
+    if source.startswith("s3://") == destination.startswith("s3://"):
+        raise typer.BadParameter("Exactly One of the Source or Destination Must be an s3:// URI")
+
+    s3 = client(concurrency)
+
+    uploading = destination.startswith("s3://")
+
+    bucket, prefix = location(destination if uploading else source)
+    prefix = example.api.aws.terminate(prefix)
+
+    directory = pathlib.Path(source if uploading else destination)
+
+    with example.cli.profiling.phase("list"):
+        remote = {item["Key"].removeprefix(prefix): item for item in s3.iterate(example.api.types.S3.List(key=prefix, bucket_name=bucket)) if not item["Key"].endswith("/")}
+
+    with example.cli.profiling.phase("compare"):
+        items, considered = [], 0
+
+        if uploading:
+            for path, relative in files([directory], recursive=True):
+                considered += 1
+
+                status = path.stat()
+
+                entry = remote.get(relative)
+                # --> "LastModified" has a resolution of one second; compare whole seconds to avoid re-uploading unchanged files.
+                if entry is None or entry["Size"] != status.st_size:
+                    items.append((path, relative, None))
+                elif int(status.st_mtime) > entry["LastModified"]:
+                    # --> e.g. a rebuilt (or re-checked out) file, whose content may be unchanged; compared by ETag.
+                    items.append((path, relative, entry))
+        else:
+            for relative, entry in remote.items():
+                considered += 1
+
+                try:
+                    target = contained(directory, relative)
+                except ValueError as e:
+                    logger.warning("Skipping Object s3://%s/%s%s: %s", bucket, prefix, relative, e)
+                    continue
+
+                try:
+                    status = target.stat()
+                except FileNotFoundError:
+                    status = None
+
+                if status is None or status.st_size != entry["Size"] or entry["LastModified"] > status.st_mtime:
+                    items.append((relative, entry))
+
+    logger.info("Synchronizing %d New or Changed File(s) - Skipping %d", len(items), considered - len(items))
+
+    workers, parts = split(concurrency, len(items))
+
+    def function(item) -> Record:
+        if uploading:
+            path, relative, entry = item
+
+            return upload(s3, bucket, prefix + relative, path, chunk, parts, skip_unchanged=entry is not None, remote=entry)
+
+        relative, entry = item
+
+        return download(s3, bucket, entry["Key"], directory.joinpath(relative).parent, chunk, parts, modified=entry["LastModified"])
+
+    with example.cli.profiling.phase("transfer"):
+        report(parallel(function, items, workers), structured)
+
+@application.command("pack")
+def pack(
+    source: typing.Annotated[pathlib.Path, typer.Argument(help="the local directory of (small) files to pack")],
+    uri: typing.Annotated[str, typer.Argument(help="the destination s3://bucket/prefix/ of the pack's shards and index")],
+    shard_size: typing.Annotated[str, typer.Option("--shard-size", help="the target size of each shard (e.g. 64MiB)")] = "64MiB",
+    compression: typing.Annotated[typing.Optional[str], typer.Option("--compression", help="compress each member individually: \"gzip\", or \"zstd\" (requires the optional zstandard package)")] = None,
+    concurrency: Concurrency = 4,
+    chunk_size: ChunkSize = "8MiB",
+    structured: Structured = False,
+):
+    """
+    Pack a directory's files into sharded tar archives, with an index of member offsets for ranged reads (see unpack).
+    """
+
+    if compression is not None and compression not in example.api.packing.compressions:
+        raise typer.BadParameter("Invalid Compression: {}. Expected One of: {}".format(compression, ", ".join(example.api.packing.compressions)))
+
+    bucket, prefix = location(uri)
+    if prefix and not prefix.endswith("/"):
+        prefix += "/"
+
+    s3 = client(concurrency)
+
+    configuration = example.api.types.S3.Pack(source=source, bucket_name=bucket, prefix=prefix, shard_size=size(shard_size), compression=compression, concurrency=concurrency, chunk_size=size(chunk_size))
+
+    with example.cli.profiling.phase("pack"):
+        try:
+            document = example.api.packing.pack(s3, configuration)
+        except Exception as e:
+            logger.debug("Pack Failure", exc_info=True)
+
+            report([{"operation": "pack", "bucket": bucket, "key": example.api.packing.index(prefix), "error": str(e)}], structured)
+            return
+
+    report(({"operation": "pack", "bucket": bucket, "key": shard["key"], "members": shard["members"], "size": shard["size"]} for shard in document["shards"]), structured)
+
+@application.command("unpack")
+def unpack(
+    uri: typing.Annotated[str, typer.Argument(help="the s3://bucket/prefix/ of a pack")],
+    members: typing.Annotated[typing.Optional[typing.List[str]], typer.Argument(help="the member(s) to extract (default: every member)")] = None,
+    directory: typing.Annotated[pathlib.Path, typer.Option("--directory", "-d", help="the local destination directory")] = pathlib.Path("."),
+    concurrency: Concurrency = 8,
+    structured: Structured = False,
+):
+    """
+    Extract a pack's members (or only the given members) via ranged reads of its shards, without downloading them whole.
+    """
+
+    bucket, prefix = location(uri)
+    if prefix and not prefix.endswith("/"):
+        prefix += "/"
+
+    s3 = client(concurrency)
+
+    with example.cli.profiling.phase("index"):
+        archive = example.api.packing.Archive.open(s3, bucket, prefix)
+
+    names = list(dict.fromkeys(members or archive.names()))
+
+    missing = [name for name in names if name not in archive]
+    if missing:
+        raise typer.BadParameter("No Such Member(s): {}".format(", ".join(missing)))
+
+    with example.cli.profiling.phase("transfer"):
+        paths = archive.extract(directory, names, concurrency=concurrency)
+
+    report(({"operation": "unpack", "bucket": bucket, "prefix": prefix, "member": name, "path": str(path)} for name, path in zip(names, paths)), structured)
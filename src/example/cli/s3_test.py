@@ -0,0 +1,323 @@
+import os
+import json
+import logging
+
+import pytest
+
+import typer.testing
+
+import example.cli.s3
+import example.cli.main
+import example.logging.queues
+
+logger = logging.getLogger(__name__)
+
+@pytest.fixture()
+def invoke():
+    """
+    Invokes the CLI application in-process, restoring the root logger's configuration afterward.
+    """
+
+    runner = typer.testing.CliRunner()
+
+    handlers, level = logging.root.handlers[:], logging.root.level
+
+    def function(*arguments: str) -> typer.testing.Result:
+        result = runner.invoke(example.cli.main.application, list(arguments), obj={})
+
+        logger.debug("Output: %s", result.output)
+
+        return result
+
+    yield function
+
+    logging.root.handlers[:] = handlers
+    logging.root.setLevel(level)
+
+def records(output: str) -> list[dict]:
+    return [json.loads(line) for line in output.splitlines() if line.startswith("{")]
+
+@pytest.mark.description("Unit-Test that verifies the root logger's queue handler is removed once a command completes.")
+def test_logging_restored(s3, bucket, invoke):
+    handlers = logging.root.handlers[:]
+
+    assert invoke("s3", "ls", "s3://{}/".format(bucket)).exit_code == 0
+
+    assert logging.root.handlers == handlers
+    assert not any(isinstance(handler, example.logging.queues.Handler) for handler in logging.root.handlers)
+
+@pytest.mark.description("Unit-Test that verifies human-readable byte sizes are parsed.")
+def test_size():
+    assert example.cli.s3.size("1048576") == 1024 ** 2
+    assert example.cli.s3.size("8MiB") == 8 * 1024 ** 2
+    assert example.cli.s3.size("1.5 GB") == 1500 * 1000 ** 2
+
+    with pytest.raises(typer.BadParameter):
+        example.cli.s3.size("8 parsecs")
+
+@pytest.mark.description("Unit-Test that verifies the concurrency budget is split between objects and their parts.")
+def test_split():
+    assert example.cli.s3.split(8, 1) == (1, 8)
+    assert example.cli.s3.split(8, 2) == (2, 4)
+    assert example.cli.s3.split(8, 100) == (8, 1)
+    assert example.cli.s3.split(8, 0) == (1, 8)
+
+@pytest.mark.description("Unit-Test that verifies keys resolving outside of a destination directory are refused.")
+def test_contained(tmp_path):
+    assert example.cli.s3.contained(tmp_path, "a/b.txt") == tmp_path.resolve().joinpath("a", "b.txt")
+
+    with pytest.raises(ValueError):
+        example.cli.s3.contained(tmp_path, "../escape.txt")
+
+@pytest.mark.description("Unit-Test that verifies the put, ls, get and rm subcommands end-to-end.")
+def test_commands(s3, bucket, invoke, tmp_path):
+    source = tmp_path.joinpath("source")
+    source.joinpath("nested").mkdir(parents=True)
+    source.joinpath("a.txt").write_text("a")
+    source.joinpath("nested", "b.txt").write_text("bb")
+
+    result = invoke("s3", "put", str(source), "s3://{}/prefix/".format(bucket), "--recursive", "--json", "--concurrency", "4")
+    assert result.exit_code == 0, result.output
+    assert sorted(record["key"] for record in records(result.output)) == ["prefix/a.txt", "prefix/nested/b.txt"]
+
+    result = invoke("s3", "ls", "s3://{}/prefix/".format(bucket), "--json")
+    assert result.exit_code == 0, result.output
+    assert {record["key"]: record["size"] for record in records(result.output)} == {"prefix/a.txt": 1, "prefix/nested/b.txt": 2}
+
+    destination = tmp_path.joinpath("destination")
+
+    result = invoke("s3", "get", "s3://{}/prefix/".format(bucket), "--recursive", "--directory", str(destination), "--json")
+    assert result.exit_code == 0, result.output
+    assert destination.joinpath("a.txt").read_text() == "a"
+    assert destination.joinpath("nested", "b.txt").read_text() == "bb"
+
+    result = invoke("s3", "rm", "s3://{}/prefix/".format(bucket), "--recursive")
+    assert result.exit_code == 0, result.output
+    assert "rm: s3://{}/prefix/a.txt".format(bucket) in result.output
+
+    assert s3.list(example.api.types.S3.List(key="prefix/", bucket_name=bucket)) == []
+
+    # --> a bucket without a key is rejected (rather than deleting the key ""), unless recursive; nothing is deleted.
+    s3.client.put_object(Bucket=bucket, Key="kept.txt", Body=b"kept")
+
+    result = invoke("s3", "rm", "s3://{}/kept.txt".format(bucket), "s3://{}".format(bucket))
+    assert result.exit_code == 2
+    assert "Object Key Required" in result.output
+
+    assert [item["Key"] for item in s3.list(example.api.types.S3.List(key="", bucket_name=bucket))] == ["kept.txt"]
+
+@pytest.mark.description("Unit-Test that verifies recursive get and rm prefixes don't match sibling prefixes (e.g. \"data\" and \"database\").")
+def test_recursive_prefixes(s3, bucket, invoke, tmp_path):
+    client = s3.client
+
+    for key in ("data/x.txt", "database/y.txt", "build/1/a.txt", "build/10/b.txt"):
+        client.put_object(Bucket=bucket, Key=key, Body=key.encode())
+
+    destination = tmp_path.joinpath("destination")
+
+    result = invoke("s3", "get", "s3://{}/data".format(bucket), "--recursive", "--directory", str(destination), "--json")
+    assert result.exit_code == 0, result.output
+    assert [record["key"] for record in records(result.output)] == ["data/x.txt"]
+
+    assert sorted(path.relative_to(destination).as_posix() for path in destination.rglob("*") if path.is_file()) == ["x.txt"]
+
+    result = invoke("s3", "rm", "s3://{}/build/1".format(bucket), "--recursive", "--json")
+    assert result.exit_code == 0, result.output
+    assert [record["key"] for record in records(result.output)] == ["build/1/a.txt"]
+
+    assert [item["Key"] for item in s3.list(example.api.types.S3.List(key="", bucket_name=bucket))] == ["build/10/b.txt", "data/x.txt", "database/y.txt"]
+
+@pytest.mark.description("Unit-Test that verifies the du subcommand's per-directory aggregates.")
+def test_du(s3, bucket, invoke):
+    client = s3.client
+
+    for key, size in (("logs/2026/a.log", 10), ("logs/2026/b.log", 20), ("logs/readme.txt", 5), ("data/x.parquet", 100)):
+        client.put_object(Bucket=bucket, Key=key, Body=b"0" * size)
+
+    result = invoke("s3", "du", "s3://{}/".format(bucket), "--depth", "2", "--largest", "1", "--json")
+    assert result.exit_code == 0, result.output
+
+    rows = records(result.output)
+
+    assert [(row["prefix"], row["count"], row["size"]) for row in rows if row["operation"] == "du"] == [
+        ("data/", 1, 100),
+        ("logs/", 3, 35),
+        ("logs/2026/", 2, 30),
+        ("(total)", 4, 135),
+    ]
+    assert [row["key"] for row in rows if row["operation"] == "ls"] == ["data/x.parquet"]
+
+@pytest.mark.description("Unit-Test that verifies pattern-filtered listings and deletions.")
+def test_pattern(s3, bucket, invoke):
+    client = s3.client
+
+    for key in ("events/date=2025-12/a.parquet", "events/date=2026-01/b.parquet", "events/date=2026-01/b.json"):
+        client.put_object(Bucket=bucket, Key=key, Body=b"")
+
+    result = invoke("s3", "ls", "s3://{}/events/".format(bucket), "--pattern", "date=2026-*/*.parquet", "--json")
+    assert result.exit_code == 0, result.output
+    assert [row["key"] for row in records(result.output)] == ["events/date=2026-01/b.parquet"]
+
+    assert invoke("s3", "rm", "s3://{}/events/".format(bucket), "--pattern", "*/*.json").exit_code != 0
+
+    result = invoke("s3", "rm", "s3://{}/events/".format(bucket), "--recursive", "--pattern", "*/*.json", "--json")
+    assert result.exit_code == 0, result.output
+    assert [item["Key"] for item in s3.list(example.api.types.S3.List(key="events/", bucket_name=bucket))] == ["events/date=2025-12/a.parquet", "events/date=2026-01/b.parquet"]
+
+@pytest.mark.description("Unit-Test that verifies failed transfers are reported, and result in a non-zero exit status.")
+def test_failure(s3, bucket, invoke, tmp_path):
+    result = invoke("s3", "get", "s3://{}/missing.txt".format(bucket), "--directory", str(tmp_path), "--json")
+
+    assert result.exit_code == 1
+    assert "error" in records(result.output)[0]
+
+@pytest.mark.description("Unit-Test that verifies sync only transfers new or changed files, in either direction.")
+def test_sync(s3, bucket, invoke, tmp_path):
+    source = tmp_path.joinpath("source")
+    source.mkdir()
+    source.joinpath("a.txt").write_text("a")
+    source.joinpath("b.txt").write_text("b")
+
+    result = invoke("s3", "sync", str(source), "s3://{}/sync".format(bucket), "--json")
+    assert result.exit_code == 0, result.output
+    assert len(records(result.output)) == 2
+
+    result = invoke("s3", "sync", str(source), "s3://{}/sync".format(bucket), "--json")
+    assert result.exit_code == 0, result.output
+    assert records(result.output) == []
+
+    source.joinpath("b.txt").write_text("changed")
+
+    result = invoke("s3", "sync", str(source), "s3://{}/sync/".format(bucket), "--json")
+    assert [record["key"] for record in records(result.output)] == ["sync/b.txt"]
+
+    destination = tmp_path.joinpath("destination")
+
+    result = invoke("s3", "sync", "s3://{}/sync".format(bucket), str(destination), "--json")
+    assert result.exit_code == 0, result.output
+    assert len(records(result.output)) == 2
+    assert destination.joinpath("b.txt").read_text() == "changed"
+
+    result = invoke("s3", "sync", "s3://{}/sync".format(bucket), str(destination), "--json")
+    assert records(result.output) == []
+
+@pytest.mark.description("Unit-Test that verifies the global options wrap the subcommand's execution.")
+def test_timings(s3, bucket, invoke, tmp_path):
+    result = invoke("--timings", "--log-level", "ERROR", "s3", "ls", "s3://{}".format(bucket))
+
+    assert result.exit_code == 0, result.output
+    assert "Total" in result.output
+
+@pytest.mark.description("Unit-Test that verifies server-side copies of an object, and of a prefix.")
+def test_cp(s3, bucket, invoke):
+    client = s3.client
+
+    for key in ("artifacts/a.whl", "artifacts/b.whl"):
+        client.put_object(Bucket=bucket, Key=key, Body=key.encode())
+
+    result = invoke("s3", "cp", "s3://{}/artifacts/a.whl".format(bucket), "s3://{}/promoted/".format(bucket), "--json")
+    assert result.exit_code == 0, result.output
+    assert [(row["key"], row["size"]) for row in records(result.output)] == [("promoted/a.whl", len(b"artifacts/a.whl"))]
+
+    result = invoke("s3", "cp", "s3://{}/artifacts/".format(bucket), "s3://{}/release/".format(bucket), "--recursive", "--json")
+    assert result.exit_code == 0, result.output
+    assert sorted(row["key"] for row in records(result.output)) == ["release/a.whl", "release/b.whl"]
+
+    result = invoke("s3", "cp", "s3://{}/artifacts/missing.whl".format(bucket), "s3://{}/promoted/".format(bucket))
+    assert result.exit_code == 1
+
+@pytest.mark.description("Unit-Test that verifies resumable transfers, and the aborting of abandoned multipart uploads.")
+def test_resume(s3, bucket, invoke, tmp_path):
+    source = tmp_path.joinpath("large.bin")
+    source.write_bytes(os.urandom(6 * 1024 * 1024))
+
+    result = invoke("s3", "put", str(source), "s3://{}/large.bin".format(bucket), "--resume", "--chunk-size", "5MiB", "--json")
+    assert result.exit_code == 0, result.output
+
+    result = invoke("s3", "get", "s3://{}/large.bin".format(bucket), "--directory", str(tmp_path.joinpath("destination")), "--resume", "--json")
+    assert result.exit_code == 0, result.output
+    assert tmp_path.joinpath("destination", "large.bin").read_bytes() == source.read_bytes()
+
+    upload = s3.client.create_multipart_upload(Bucket=bucket, Key="abandoned.bin")["UploadId"]
+
+    result = invoke("s3", "abort", "s3://{}/".format(bucket), "--older-than", "0", "--json")
+    assert result.exit_code == 0, result.output
+    assert [(row["key"], row["upload"]) for row in records(result.output)] == [("abandoned.bin", upload)]
+
+@pytest.mark.description("Unit-Test that verifies objects are written to standard-output in the given order.")
+def test_cat(s3, bucket, invoke):
+    client = s3.client
+
+    for key in ("manifests/a.json", "manifests/b.json"):
+        client.put_object(Bucket=bucket, Key=key, Body=key.encode())
+
+    result = invoke("s3", "cat", "s3://{}/manifests/b.json".format(bucket), "s3://{}/manifests/a.json".format(bucket))
+
+    assert result.exit_code == 0, result.output
+    assert result.stdout_bytes == b"manifests/b.jsonmanifests/a.json"
+
+    result = invoke("s3", "cat", "s3://{}/manifests/a.json".format(bucket), "s3://{}/manifests/missing.json".format(bucket))
+
+    assert result.exit_code == 1
+    assert result.stdout_bytes == b""
+    assert "error: s3://{}".format(bucket) in result.stderr
+
+@pytest.mark.description("Unit-Test that verifies uploads and downloads verified against their objects' ETags and checksums.")
+def test_verify(s3, bucket, invoke, tmp_path):
+    source = tmp_path.joinpath("verified.bin")
+    source.write_bytes(os.urandom(6 * 1024 * 1024))
+
+    result = invoke("s3", "put", str(source), "s3://{}/verified.bin".format(bucket), "--verify", "--chunk-size", "5MiB", "--json")
+    assert result.exit_code == 0, result.output
+
+    for options in ((), ("--ranged",)):
+        destination = tmp_path.joinpath("destination", *options)
+
+        result = invoke("s3", "get", "s3://{}/verified.bin".format(bucket), "--directory", str(destination), "--verify", "--json", *options)
+        assert result.exit_code == 0, result.output
+        assert destination.joinpath("verified.bin").read_bytes() == source.read_bytes()
+
+@pytest.mark.description("Unit-Test that verifies unchanged files are skipped by ETag, including files touched since their upload.")
+def test_skip_unchanged(s3, bucket, invoke, tmp_path):
+    source = tmp_path.joinpath("source")
+    source.mkdir()
+    source.joinpath("a.txt").write_text("a")
+
+    for skipped in (None, True):
+        result = invoke("s3", "put", str(source.joinpath("a.txt")), "s3://{}/published/".format(bucket), "--skip-unchanged", "--json")
+        assert result.exit_code == 0, result.output
+        assert [record.get("skipped") for record in records(result.output)] == [skipped]
+
+    result = invoke("s3", "sync", str(source), "s3://{}/published".format(bucket), "--json")
+    assert records(result.output) == []
+
+    # --> a file touched (e.g. rebuilt) since its upload, but otherwise unchanged, isn't uploaded.
+    modified = source.joinpath("a.txt").stat().st_mtime + 60
+    os.utime(source.joinpath("a.txt"), (modified, modified))
+
+    result = invoke("s3", "sync", str(source), "s3://{}/published".format(bucket))
+    assert result.exit_code == 0, result.output
+    assert "skip: {}".format(source.joinpath("a.txt")) in result.output
+
+@pytest.mark.description("Unit-Test that verifies a directory packed into shards, and the extraction of selected members.")
+def test_pack(s3, bucket, invoke, tmp_path):
+    source = tmp_path.joinpath("source")
+    source.joinpath("nested").mkdir(parents=True)
+    source.joinpath("a.bin").write_bytes(os.urandom(3000))
+    source.joinpath("nested", "b.txt").write_text("bb")
+
+    result = invoke("s3", "pack", str(source), "s3://{}/packs/site".format(bucket), "--shard-size", "2KiB", "--compression", "gzip", "--json")
+    assert result.exit_code == 0, result.output
+    assert [(record["key"], record["members"]) for record in records(result.output)] == [("packs/site/shard-00000.tar", 1), ("packs/site/shard-00001.tar", 1)]
+
+    assert invoke("s3", "pack", str(source), "s3://{}/packs/invalid/".format(bucket), "--compression", "lzma").exit_code != 0
+
+    destination = tmp_path.joinpath("destination")
+
+    result = invoke("s3", "unpack", "s3://{}/packs/site/".format(bucket), "nested/b.txt", "--directory", str(destination))
+    assert result.exit_code == 0, result.output
+    assert "unpack: s3://{}/packs/site/nested/b.txt".format(bucket) in result.output
+    assert destination.joinpath("nested", "b.txt").read_text() == "bb"
+    assert not destination.joinpath("a.bin").exists()
+
+    assert invoke("s3", "unpack", "s3://{}/packs/site/".format(bucket), "missing.txt", "--directory", str(destination)).exit_code != 0
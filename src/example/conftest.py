@@ -0,0 +1,44 @@
+"""
+Fixture(s) shared by the package's test modules (e.g. both the API's and the CLI's).
+"""
+
+import pytest
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+@pytest.fixture()
+def bucket() -> str:
+    """
+    The name of the bucket created by the "s3" fixture.
+    """
+
+    return "example-bucket"
+
+@pytest.fixture()
+def s3(monkeypatch: pytest.MonkeyPatch, tmp_path, bucket: str):
+    """
+    Provides an `example.api.aws.S3` instance backed by an in-process, mocked S3 service (moto), with an empty bucket.
+    """
+
+    moto = pytest.importorskip("moto")
+
+    import example.api.aws
+
+    for variable in ("AWS_PROFILE", "AWS_ENDPOINT_URL", "AWS_ENDPOINT_URL_S3"):
+        monkeypatch.delenv(variable, raising=False)
+
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.setenv("AWS_SESSION_TOKEN", "testing")
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-2")
+    monkeypatch.setenv("AWS_CONFIG_FILE", str(tmp_path.joinpath("config")))
+    monkeypatch.setenv("AWS_SHARED_CREDENTIALS_FILE", str(tmp_path.joinpath("credentials")))
+
+    with moto.mock_aws():
+        instance = example.api.aws.S3()
+
+        instance.client.create_bucket(Bucket=bucket, CreateBucketConfiguration={"LocationConstraint": "us-east-2"})
+
+        yield instance
@@ -0,0 +1,74 @@
+"""
+Import regression test(s), guarding the package's (and CLI's) cold-start by asserting that heavy dependencies are
+imported lazily.
+
+Import times are precisely measured (against tight, per-module budgets) by the import-time benchmarks
+("benchmarks/imports_benchmark.py"). Here, the cold start is only asserted against a generous ceiling - an order of
+magnitude above the benchmarks' budgets - such that a regression (e.g. an eagerly imported SDK) fails the default
+suite, while shared runners' timing noise doesn't.
+"""
+
+import os
+import sys
+import json
+import pathlib
+import subprocess
+
+import pytest
+import logging
+
+import example
+
+logger = logging.getLogger(__name__)
+
+modules = ["example", "example.api", "example.api.aws", "example.utilities", "example.cli.main"]
+
+heavy = ["boto3", "botocore", "tqdm", "urllib3", "packaging"]
+
+ceiling = 1000
+"""
+The cold-start ceiling, in milliseconds, of each module's cumulative import time (the best of several starts).
+"""
+
+def execute(statement: str, *options: str) -> subprocess.CompletedProcess:
+    environment = os.environ.copy()
+    environment["PYTHONPATH"] = os.pathsep.join([str(pathlib.Path(example.__file__).parent.parent), environment.get("PYTHONPATH", "")])
+
+    return subprocess.run([sys.executable, *options, "-c", statement], env=environment, capture_output=True, text=True, check=True)
+
+@pytest.mark.description("Unit-Test that verifies importing the package's modules doesn't import heavy third-party dependencies.")
+@pytest.mark.parametrize("module", modules)
+def test_lazy_imports(module: str):
+    process = execute("import sys, json, {0}; print(json.dumps(sorted(sys.modules)))".format(module))
+
+    loaded = set(json.loads(process.stdout))
+
+    assert loaded.isdisjoint(heavy), "Unexpected Module(s) Imported by {}: {}".format(module, sorted(loaded.intersection(heavy)))
+
+@pytest.mark.description("Unit-Test that verifies the package's and CLI's cold-start import times are within a (generous) budget.")
+@pytest.mark.parametrize("module", ["example", "example.cli.main"])
+def test_import_time_budget(module: str):
+    timings = []
+
+    for _ in range(3):
+        process = execute("import {0}".format(module), "-X", "importtime")
+
+        # --> "import time: <self [us]> | <cumulative [us]> | <module>", excluding the interpreter's own start-up.
+        timings.extend(int(line.split("|")[1]) / 1000 for line in process.stderr.splitlines() if line.startswith("import time:") and line.split("|")[-1].strip() == module)
+
+    assert timings, "Module Not Imported: {}".format(module)
+    assert min(timings) <= ceiling, "Cold-Start Import of {} Exceeds its Budget: {:.1f} > {} ms".format(module, min(timings), ceiling)
+
+@pytest.mark.description("Unit-Test that verifies the models don't import the API layer (nor its caches' sqlite3) until required.")
+def test_models_layering():
+    process = execute("import sys, json, example.models.base; print(json.dumps(sorted(sys.modules)))")
+
+    loaded = set(json.loads(process.stdout))
+
+    assert loaded.isdisjoint(["example.api.aws", "example.api.caches", "sqlite3"])
+
+@pytest.mark.description("Unit-Test that verifies lazily loaded attribute(s) resolve upon access.")
+def test_lazy_attributes():
+    process = execute("import example; print(str(example.Version)); print(example.api.types.__name__)")
+
+    assert process.stdout.splitlines()[-1] == "example.api.types"
@@ -1,19 +1,75 @@
 """
 The versioning module provides a dataclass for working with the auto-generated `__version__.py` file.
+
+Version strings are parsed once and cached at the module level. Plain release strings (e.g. "1.2.3") are parsed
+via a lightweight expression; `packaging` is only imported for pre-release, post-release, development, or local
+version strings.
 """
-import typing
+from __future__ import annotations
 
-import packaging
-import packaging.version
+import re
+import typing
 
 import logging
 
+import functools
 import dataclasses
 
-
 logger = logging.getLogger(__name__)
 
-@dataclasses.dataclass
+expression = re.compile(r"v?(\d+)(?:\.(\d+))?(?:\.(\d+))?")
+"""
+The fast-path expression matching plain release version strings (e.g. "1.2.3", "v1.2", "1").
+"""
+
+@functools.lru_cache(maxsize=256)
+def parse(string: str) -> typing.Tuple[typing.Tuple[int, int, int], bool]:
+    """
+    Parses a version string into its (major, minor, micro) release tuple.
+
+    Parameters
+    ----------
+    string : str
+        The version string.
+
+    Returns
+    -------
+    tuple of (tuple of (int, int, int), bool)
+        The release tuple, and whether the string is a plain release version (i.e. the fast-path applied).
+
+    Raises
+    ------
+    packaging.version.InvalidVersion
+        If the string isn't a valid PEP 440 version.
+    """
+
+    match = expression.fullmatch(string.strip())
+    if match is not None:
+        return (int(match.group(1)), int(match.group(2) or 0), int(match.group(3) or 0)), True
+
+    import packaging.version
+
+    v = packaging.version.parse(string)
+
+    return (v.major, v.minor, v.micro), False
+
+@functools.lru_cache(maxsize=1)
+def installed() -> typing.Optional[str]:
+    """
+    Returns the package's literal version string from the auto-generated `__version__.py` file, if available.
+    """
+
+    try:
+        import example.internal.__version__
+
+        return example.internal.__version__.version
+    except ModuleNotFoundError as e:
+        logger.warning("Unable to import version information from __version__.py: %s", str(e))
+
+    return None
+
+@functools.total_ordering
+@dataclasses.dataclass(eq=False, frozen=True)
 class Version:
     """
     Represents a version with major, minor, and micro components.
@@ -22,30 +78,106 @@ class Version:
     (if available) and provide utilities to work with version data, such as
     accessing the version in tuple form or converting it to a string.
 
+    Instances are comparable with other instances, release tuples, and version
+    strings. Plain release versions are compared by their tuples; otherwise,
+    comparisons defer to `packaging.version` semantics. Instances are immutable
+    (and hashable); values that aren't versions (e.g. "main") compare unequal,
+    and aren't orderable.
+
     :ivar tuple: A tuple representing the version in the form (major, minor,
         micro). Defaults to (0, 0, 0) if no external version is found.
     :type tuple: tuple[int, int, int]
 
-    :ivar literal: The literal version string imported from an external module.
-        This may not be available if the module is not found.
+    :ivar literal: The literal version string, either as provided or as imported
+        from an external module. None if unavailable.
     :type literal: str
     """
 
-    tuple: typing.Tuple[int, int, int] = (0, 0, 0)
+    tuple: typing.Optional[typing.Tuple[int, int, int]] = None
+    literal: typing.Optional[str] = None
+
+    simple: bool = dataclasses.field(default=True, init=False, repr=False)
 
     def __post_init__(self):
-        try:
-            import example.internal.__version__
+        # --> the (frozen) fields are resolved once, upon construction.
+        assign = functools.partial(object.__setattr__, self)
+
+        # --> default to the package's own (cached) version.
+        if self.tuple is None and self.literal is None:
+            assign("literal", installed())
+
+        if self.literal is not None:
+            release, simple = parse(self.literal)
+
+            assign("tuple", release)
+            assign("simple", simple)
+        elif self.tuple is None:
+            assign("tuple", (0, 0, 0))
+
+    @classmethod
+    def parse(cls, string: str) -> Version:
+        """
+        Creates a version from a literal version string.
+        """
+
+        return cls(literal=string)
+
+    @staticmethod
+    def coerce(other: typing.Any) -> typing.Optional[Version]:
+        """
+        Coerces a comparable value (a `Version`, release tuple, or version string) into a `Version`.
+
+        Returns None if the value isn't a version (including strings that aren't valid PEP 440 versions).
+        """
+
+        if isinstance(other, Version):
+            return other
+        elif isinstance(other, str):
+            try:
+                return Version(literal=other)
+            except ValueError:
+                # --> packaging.version.InvalidVersion is a ValueError.
+                return None
+        elif isinstance(other, (tuple, list)) and len(other) <= 3 and all(isinstance(v, int) for v in other):
+            return Version(tuple=(tuple(other) + (0, 0, 0))[:3])
 
-            string = example.internal.__version__.version
+        return None
 
-            self.literal = string
+    def _packaging(self):
+        import packaging.version
 
-            v = packaging.version.parse(string)
+        return packaging.version.parse(self.literal if self.literal is not None else str(self))
 
-            self.tuple = (v.major, v.minor, v.micro)
-        except ModuleNotFoundError as e:
-            logger.warning("Unable to import version information from __version__.py: %s", str(e))
+    def __eq__(self, other) -> bool:
+        other = Version.coerce(other)
+        if other is None:
+            return NotImplemented
+
+        if self.simple and other.simple:
+            return self.tuple == other.tuple
+
+        return self._packaging() == other._packaging()
+
+    def __lt__(self, other) -> bool:
+        other = Version.coerce(other)
+        if other is None:
+            return NotImplemented
+
+        if self.simple and other.simple:
+            return self.tuple < other.tuple
+
+        return self._packaging() < other._packaging()
+
+    def __hash__(self) -> int:
+        return hash(self.tuple)
 
     def __str__(self):
         return "%d.%d.%d" % self.tuple
+
+@functools.lru_cache(maxsize=1)
+def current() -> Version:
+    """
+    Returns the package's version, constructed once and cached at the module level.
+    """
+
+    return Version()
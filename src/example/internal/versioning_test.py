@@ -1,3 +1,6 @@
+import sys
+import dataclasses
+
 import pytest
 import logging
 
@@ -17,3 +20,59 @@ def test_versioning_tuple():
 
 def test_versioning_string_dunder_method():
     assert len(str(example.internal.versioning.Version()).split(".")) == 3
+
+def test_versioning_fast_path(monkeypatch: pytest.MonkeyPatch):
+    example.internal.versioning.parse.cache_clear()
+
+    # --> plain release strings must not require packaging.
+    monkeypatch.setitem(sys.modules, "packaging.version", None)
+
+    instance = example.internal.versioning.Version.parse("1.2.3")
+
+    assert instance.tuple == (1, 2, 3)
+    assert instance.simple is True
+
+    assert example.internal.versioning.Version.parse("v4.5").tuple == (4, 5, 0)
+
+def test_versioning_pre_release():
+    instance = example.internal.versioning.Version.parse("1.2.3rc1")
+
+    assert instance.tuple == (1, 2, 3)
+    assert instance.simple is False
+
+    assert instance < "1.2.3"
+    assert instance > "1.2.2"
+
+def test_versioning_comparisons():
+    instance = example.internal.versioning.Version(tuple=(1, 2, 3))
+
+    assert instance == "1.2.3"
+    assert instance == (1, 2, 3)
+    assert instance == example.internal.versioning.Version.parse("1.2.3")
+    assert instance != "1.2.4"
+
+    assert instance < (1, 10, 0)
+    assert instance >= "1.2"
+    assert instance <= (1, 2, 3)
+
+    assert hash(instance) == hash(example.internal.versioning.Version.parse("1.2.3"))
+
+    assert sorted(["1.10.0", "1.2.0", "1.9.1"], key=example.internal.versioning.Version.parse) == ["1.2.0", "1.9.1", "1.10.0"]
+
+def test_versioning_non_versions():
+    instance = example.internal.versioning.Version.parse("1.2.3")
+
+    assert instance != "main"
+    assert not instance == "foo"
+    assert instance in ["main", "1.2.3"]
+
+    with pytest.raises(TypeError):
+        instance < "main"
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        instance.tuple = (2, 0, 0)
+
+    assert {instance: True}[example.internal.versioning.Version(tuple=(1, 2, 3))]
+
+def test_versioning_current():
+    assert example.internal.versioning.current() is example.internal.versioning.current()
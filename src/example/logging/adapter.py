@@ -1,9 +1,23 @@
 import logging
 
+class Prefixed:
+    """
+    A message wrapper deferring the "[name] message" string construction until the record is formatted.
+    """
+
+    __slots__ = ("name", "msg")
+
+    def __init__(self, name, msg):
+        self.name = name
+        self.msg = msg
+
+    def __str__(self) -> str:
+        return "[{}] {}".format(self.name, self.msg)
+
 class Adapter(logging.LoggerAdapter):
     def process(self, msg, kwargs):
-        name = kwargs.get("name", None)
+        name = kwargs.pop("name", None)
         if name is not None:
-            return "[{}] {}".format(name, msg), kwargs
+            return Prefixed(name, msg), kwargs
 
         return msg, kwargs
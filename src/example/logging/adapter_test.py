@@ -0,0 +1,21 @@
+import logging
+
+import pytest
+
+import example.logging.adapter
+
+logger = logging.getLogger(__name__)
+
+def test_adapter_prefix(caplog: pytest.LogCaptureFixture):
+    instance = example.logging.adapter.Adapter(logger)
+
+    with caplog.at_level(logging.INFO, logger=__name__):
+        instance.info("Message %d", 1, name="prefix")
+        instance.info("Message %d", 2)
+
+    assert caplog.messages[-2:] == ["[prefix] Message 1", "Message 2"]
+
+def test_adapter_deferred_prefix():
+    v = example.logging.adapter.Prefixed("prefix", "Message")
+
+    assert str(v) == "[prefix] Message"
@@ -0,0 +1,245 @@
+"""
+Non-blocking, queue-based logging.
+
+A `Pipeline` decouples producers (any thread emitting a log record) from the handlers performing formatting
+and I/O: producers only enqueue records onto a bounded queue, while a single background listener thread formats
+and writes them. When the queue is full, the configured policy determines whether records are dropped, the
+oldest records are discarded, or the producer applies backpressure (blocks, optionally with a timeout).
+
+    pipeline = Pipeline(logging.StreamHandler(), capacity=10000, policy="drop")
+    pipeline.start()
+
+    logging.basicConfig(level=logging.INFO, handlers=[pipeline.handler])
+
+A stopped pipeline's handler enqueues records that are never read; `installed` scopes the handler to the pipeline's
+lifetime, restoring the logger's previous handlers before the pipeline is stopped.
+
+    with Pipeline(logging.StreamHandler()) as pipeline, installed(pipeline.handler, logging.INFO):
+        ...
+"""
+
+import atexit
+import logging
+import contextlib
+import logging.handlers
+import queue
+import threading
+import typing
+
+logger = logging.getLogger(__name__)
+
+Policy = typing.Literal["drop", "drop-oldest", "block"]
+"""
+The behavior applied when enqueuing onto a full queue:
+
+- "drop": the new record is discarded.
+- "drop-oldest": the oldest queued record is discarded in favor of the new record.
+- "block": the producer blocks until space is available (or until the handler's timeout elapses, after which the record is discarded).
+"""
+
+policies: typing.Tuple[str, ...] = typing.get_args(Policy)
+
+class Handler(logging.handlers.QueueHandler):
+    """
+    A queue handler applying an overflow policy to a bounded queue, while deferring all formatting to the listener.
+
+    Attributes
+    ----------
+    dropped : int
+        The total number of records discarded due to a full queue.
+    """
+
+    def __init__(self, instance: queue.Queue, policy: Policy = "drop", timeout: typing.Optional[float] = None):
+        if policy not in policies:
+            raise ValueError("Invalid Queue Policy: {}. Valid Policies: {}".format(policy, ", ".join(policies)))
+
+        super().__init__(instance)
+
+        self.policy = policy
+        self.timeout = timeout
+        self.dropped = 0
+
+        self._counter = threading.Lock()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Snapshots the record's message and exception text without applying the formatter.
+
+        Interpolating the message (and rendering any traceback) ensures mutable arguments and exception state can't
+        change after the call returns; all remaining formatting is performed by the listener's handler(s).
+        """
+
+        message = record.getMessage()
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+
+        record = logging.makeLogRecord(record.__dict__)
+
+        record.msg = message
+        record.message = message
+        record.args = None
+        record.exc_info = None
+
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.policy == "block":
+            try:
+                self.queue.put(record, block=True, timeout=self.timeout)
+            except queue.Full:
+                self._drop()
+
+            return
+
+        while True:
+            try:
+                self.queue.put_nowait(record)
+
+                return
+            except queue.Full:
+                self._drop()
+
+                if self.policy == "drop":
+                    return
+
+            # --> "drop-oldest": discard the queue's oldest record, then retry.
+            try:
+                self.queue.get_nowait()
+            except queue.Empty:
+                ...
+
+    def _drop(self) -> None:
+        with self._counter:
+            self.dropped += 1
+
+class Listener(logging.handlers.QueueListener):
+    """
+    A queue listener whose stop sentinel is enqueued with backpressure, ensuring it can't be lost to a full queue.
+    """
+
+    def enqueue_sentinel(self) -> None:
+        self.queue.put(self._sentinel, block=True)
+
+@contextlib.contextmanager
+def installed(handler: logging.Handler, level: int | str, instance: typing.Optional[logging.Logger] = None) -> typing.Iterator[logging.Handler]:
+    """
+    Replaces a logger's (by default, the root logger's) handlers and level, restoring the previous handlers (which,
+    unlike with `logging.basicConfig(force=True)`, aren't closed) and level upon exit.
+
+    Parameters
+    ----------
+    handler : logging.Handler
+        The logger's sole handler while installed (e.g. a `Pipeline`'s handler).
+    level : int | str
+        The logger's level while installed.
+    instance : logging.Logger, optional
+        The logger; defaults to the root logger.
+    """
+
+    instance = instance if instance is not None else logging.getLogger()
+
+    handlers, previous = instance.handlers[:], instance.level
+
+    for existing in handlers:
+        instance.removeHandler(existing)
+
+    instance.addHandler(handler)
+    instance.setLevel(level)
+
+    try:
+        yield handler
+    finally:
+        instance.removeHandler(handler)
+
+        for existing in handlers:
+            instance.addHandler(existing)
+
+        instance.setLevel(previous)
+
+class Pipeline:
+    """
+    Routes log records through a bounded queue to one or more handlers on a background thread.
+
+    Parameters
+    ----------
+    *handlers : logging.Handler
+        The handler(s) performing formatting and I/O on the listener's thread.
+    capacity : int
+        The maximum number of queued records.
+    policy : Policy
+        The overflow policy applied when the queue is full.
+    timeout : float, optional
+        The maximum number of seconds a producer blocks under the "block" policy. Blocks indefinitely if None.
+    """
+
+    def __init__(self, *handlers: logging.Handler, capacity: int = 10000, policy: Policy = "drop", timeout: typing.Optional[float] = None):
+        if capacity <= 0:
+            raise ValueError("Queue Capacity Must be a Positive Integer: {}".format(capacity))
+
+        self.queue: queue.Queue = queue.Queue(maxsize=capacity)
+        self.handlers = handlers
+        self.handler = Handler(self.queue, policy=policy, timeout=timeout)
+        self.listener = Listener(self.queue, *handlers, respect_handler_level=True)
+
+        self._running = False
+
+    @property
+    def dropped(self) -> int:
+        """
+        The total number of records discarded due to a full queue.
+        """
+
+        return self.handler.dropped
+
+    def start(self) -> None:
+        """
+        Starts the listener thread, and registers `stop` to run at interpreter exit.
+        """
+
+        if self._running:
+            return
+
+        self.listener.start()
+        self._running = True
+
+        atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """
+        Flushes all queued records through the handler(s), then stops the listener thread.
+        """
+
+        if not self._running:
+            return
+
+        self._running = False
+
+        atexit.unregister(self.stop)
+
+        self.listener.stop()
+
+        if self.dropped > 0:
+            record = logging.makeLogRecord({
+                "name": logger.name,
+                "levelno": logging.WARNING,
+                "levelname": logging.getLevelName(logging.WARNING),
+                "msg": "Dropped %d Log Record(s) Due to a Full Queue",
+                "args": (self.dropped,),
+            })
+
+            for handler in self.handlers:
+                handler.handle(record)
+
+        for handler in self.handlers:
+            handler.flush()
+
+    def __enter__(self) -> "Pipeline":
+        self.start()
+
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+        return False
@@ -0,0 +1,123 @@
+import queue
+import logging
+import threading
+
+import pytest
+
+import example.logging.queues
+
+logger = logging.getLogger(__name__)
+
+class Collector(logging.Handler):
+    def __init__(self, gate: threading.Event | None = None):
+        super().__init__()
+
+        self.gate = gate
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.gate is not None:
+            self.gate.wait(timeout=5)
+
+        self.records.append(record)
+
+def producer(name: str, handler: logging.Handler) -> logging.Logger:
+    instance = logging.getLogger(name)
+    instance.handlers = [handler]
+    instance.propagate = False
+    instance.setLevel(logging.DEBUG)
+
+    return instance
+
+@pytest.mark.description("Unit-Test that verifies all queued records are flushed to the handler(s) when the pipeline stops.")
+def test_pipeline_flush(request: pytest.FixtureRequest):
+    collector = Collector()
+
+    with example.logging.queues.Pipeline(collector, capacity=1000) as pipeline:
+        instance = producer(request.node.name, pipeline.handler)
+
+        for index in range(500):
+            instance.info("Record %d", index)
+
+    assert [record.getMessage() for record in collector.records] == ["Record %d" % index for index in range(500)]
+
+@pytest.mark.description("Unit-Test that verifies an installed handler replaces, and is then replaced by, the logger's previous handlers.")
+def test_installed(request: pytest.FixtureRequest):
+    collector = Collector()
+
+    instance = producer(request.node.name, collector)
+
+    with example.logging.queues.Pipeline(Collector()) as pipeline:
+        with example.logging.queues.installed(pipeline.handler, logging.WARNING, instance):
+            assert instance.handlers == [pipeline.handler]
+            assert instance.level == logging.WARNING
+
+        # --> records emitted once the pipeline's handler is uninstalled reach the previous (open) handler.
+        instance.info("Record")
+
+    assert instance.handlers == [collector]
+    assert instance.level == logging.DEBUG
+    assert [record.getMessage() for record in collector.records] == ["Record"]
+
+@pytest.mark.description("Unit-Test that verifies the drop policy never blocks the producer, and counts dropped records.")
+def test_pipeline_drop_policy(request: pytest.FixtureRequest):
+    gate = threading.Event()
+    collector = Collector(gate)
+
+    pipeline = example.logging.queues.Pipeline(collector, capacity=2, policy="drop")
+    pipeline.start()
+
+    instance = producer(request.node.name, pipeline.handler)
+
+    for index in range(20):
+        instance.info("Record %d", index)
+
+    assert pipeline.dropped > 0
+
+    gate.set()
+    pipeline.stop()
+
+    assert len([record for record in collector.records if record.name == request.node.name]) == 20 - pipeline.dropped
+
+@pytest.mark.description("Unit-Test that verifies the drop-oldest policy retains the newest records.")
+def test_handler_drop_oldest_policy():
+    instance = queue.Queue(maxsize=2)
+    handler = example.logging.queues.Handler(instance, policy="drop-oldest")
+
+    for index in range(5):
+        handler.handle(logging.makeLogRecord({"msg": "Record %d", "args": (index,)}))
+
+    assert handler.dropped == 3
+    assert [instance.get_nowait().getMessage() for _ in range(2)] == ["Record 3", "Record 4"]
+
+@pytest.mark.description("Unit-Test that verifies the block policy applies backpressure until its timeout elapses.")
+def test_handler_block_policy():
+    instance = queue.Queue(maxsize=1)
+    handler = example.logging.queues.Handler(instance, policy="block", timeout=0.01)
+
+    handler.handle(logging.makeLogRecord({"msg": "First"}))
+    handler.handle(logging.makeLogRecord({"msg": "Second"}))
+
+    assert handler.dropped == 1
+    assert instance.get_nowait().getMessage() == "First"
+
+@pytest.mark.description("Unit-Test that verifies records are snapshotted, rather than formatted, on the producer's thread.")
+def test_handler_prepare():
+    instance = queue.Queue()
+    handler = example.logging.queues.Handler(instance)
+    handler.setFormatter(logging.Formatter("[PREFIX] %(message)s"))
+
+    arguments = ["mutable"]
+
+    handler.handle(logging.makeLogRecord({"msg": "Value: %s", "args": (arguments,)}))
+
+    arguments.append("changed")
+
+    record = instance.get_nowait()
+
+    assert record.getMessage() == "Value: ['mutable']"
+    assert record.args is None
+
+def test_handler_invalid_policy():
+    with pytest.raises(ValueError):
+        example.logging.queues.Handler(queue.Queue(), policy="invalid")
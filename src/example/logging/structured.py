@@ -0,0 +1,120 @@
+"""
+Structured (JSON Lines) logging.
+
+The `Context` adapter carries contextual fields as a mapping that's attached to a record by reference (a single
+`record.context` attribute), rather than being copied or rendered into the message. Fields are only merged and
+serialized by the `Formatter` when a record is actually emitted; records filtered out by level cost no more than
+the logger's `isEnabledFor` check.
+
+    handler.setFormatter(Formatter())
+
+    log = Context(logging.getLogger(__name__), {"service": "s3"}).bind(bucket="example-bucket")
+    log.info("Downloaded Object", extra={"key": "object.bin", "size": 1024})
+
+Serialization uses `orjson` when it's installed (see the "structured-logging" optional dependency group), and
+otherwise a reusable, compact `json.JSONEncoder`.
+"""
+
+import collections
+import datetime
+import json
+import logging
+import typing
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+_encoder = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False, default=str)
+
+def dumps(payload: typing.Mapping[str, typing.Any]) -> str:
+    """
+    Serializes a mapping into a compact, single-line JSON string.
+    """
+
+    if orjson is not None:
+        return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+    return _encoder.encode(payload)
+
+class Formatter(logging.Formatter):
+    """
+    Formats records as single-line JSON objects.
+
+    Each object contains the record's "timestamp" (ISO-8601, UTC), "level", "logger" and "message", followed by the
+    record's context fields (see `Context`), any static fields provided at construction, and, if applicable, the
+    formatted "exception" and "stack" text.
+
+    Parameters
+    ----------
+    fields : typing.Mapping[str, typing.Any], optional
+        Static fields included in every formatted record (e.g. a service name or host).
+    """
+
+    def __init__(self, fields: typing.Optional[typing.Mapping[str, typing.Any]] = None):
+        super().__init__()
+
+        self.fields = dict(fields or {})
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "timestamp": datetime.datetime.fromtimestamp(record.created, tz=datetime.timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+
+        context = getattr(record, "context", None)
+        if context:
+            for key, value in context.items():
+                payload.setdefault(key, value)
+
+        for key, value in self.fields.items():
+            payload.setdefault(key, value)
+
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+
+        if record.exc_text:
+            payload["exception"] = record.exc_text
+
+        if record.stack_info:
+            payload["stack"] = self.formatStack(record.stack_info)
+
+        return dumps(payload)
+
+class Context(logging.LoggerAdapter):
+    """
+    A logger adapter attaching contextual fields to records without copying or string-building.
+
+    Per-call `extra` fields are layered over the adapter's fields via a `collections.ChainMap`, and the resulting
+    mapping is attached to the record as its `context` attribute; the per-call fields are also set as the record's
+    attributes, as `logging.Logger` does. Because `logging.LoggerAdapter` checks the level
+    before calling `process`, no work is performed for records below the logger's effective level.
+
+    Parameters
+    ----------
+    logger : logging.Logger
+        The underlying logger.
+    fields : typing.Mapping[str, typing.Any], optional
+        The adapter's contextual fields.
+    """
+
+    def __init__(self, logger: logging.Logger, fields: typing.Optional[typing.Mapping[str, typing.Any]] = None):
+        super().__init__(logger, fields if fields is not None else {})
+
+    def bind(self, **fields: typing.Any) -> "Context":
+        """
+        Returns a child adapter whose fields are layered over (without copying) this adapter's fields.
+        """
+
+        return Context(self.logger, collections.ChainMap(fields, self.extra))
+
+    def process(self, msg, kwargs):
+        extra = kwargs.get("extra")
+
+        # --> per-call fields remain record attributes (as with a plain logger, e.g. for "%(key)s" formats).
+        kwargs["extra"] = {**extra, "context": collections.ChainMap(extra, self.extra)} if extra else {"context": self.extra}
+
+        return msg, kwargs
@@ -0,0 +1,95 @@
+import json
+import logging
+import pathlib
+
+import pytest
+
+import example.logging.structured
+
+logger = logging.getLogger(__name__)
+
+class Collector(logging.Handler):
+    def __init__(self):
+        super().__init__()
+
+        self.lines: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.lines.append(self.format(record))
+
+@pytest.fixture()
+def collector(request: pytest.FixtureRequest):
+    handler = Collector()
+    handler.setFormatter(example.logging.structured.Formatter(fields={"service": "example"}))
+
+    instance = logging.getLogger(request.node.name)
+    instance.handlers = [handler]
+    instance.propagate = False
+    instance.setLevel(logging.INFO)
+
+    yield instance, handler
+
+    instance.handlers = []
+
+def test_formatter_json_lines(collector):
+    instance, handler = collector
+
+    adapter = example.logging.structured.Context(instance, {"bucket": "example-bucket"}).bind(key="object.bin")
+
+    adapter.info("Downloaded %s", "object.bin", extra={"size": 1024})
+
+    payload = json.loads(handler.lines[-1])
+
+    assert payload["message"] == "Downloaded object.bin"
+    assert payload["level"] == "INFO"
+    assert payload["bucket"] == "example-bucket"
+    assert payload["key"] == "object.bin"
+    assert payload["size"] == 1024
+    assert payload["service"] == "example"
+    assert "\n" not in handler.lines[-1]
+
+def test_formatter_exception(collector):
+    instance, handler = collector
+
+    try:
+        raise ValueError("Example Exception")
+    except ValueError:
+        instance.exception("Failure")
+
+    payload = json.loads(handler.lines[-1])
+
+    assert "ValueError: Example Exception" in payload["exception"]
+
+def test_context_filtered_records(collector):
+    instance, handler = collector
+
+    class Unserializable:
+        def __str__(self):
+            raise AssertionError("Filtered Records Mustn't be Rendered")
+
+    adapter = example.logging.structured.Context(instance, {"value": Unserializable()})
+
+    adapter.debug("Filtered %s", Unserializable())
+
+    assert handler.lines == []
+
+def test_context_extra_attributes(collector):
+    instance, handler = collector
+
+    handler.setFormatter(logging.Formatter("%(message)s %(key)s"))
+
+    adapter = example.logging.structured.Context(instance, {"bucket": "example-bucket"})
+
+    adapter.info("Downloaded", extra={"key": "object.bin"})
+
+    assert handler.lines[-1] == "Downloaded object.bin"
+
+def test_context_bind_isolation():
+    parent = example.logging.structured.Context(logger, {"a": 1})
+    child = parent.bind(b=2)
+
+    assert dict(child.extra) == {"a": 1, "b": 2}
+    assert dict(parent.extra) == {"a": 1}
+
+def test_dumps():
+    assert json.loads(example.logging.structured.dumps({"key": "value", "path": pathlib.Path("/")})) == {"key": "value", "path": "/"}
@@ -3,6 +3,7 @@ The base module for fragrance models.
 """
 import os
 import tempfile
+import functools
 import typing
 import pathlib
 import logging
@@ -10,10 +11,15 @@ import logging
 import pydantic
 
 import example.models.internal.base
+import example.models.internal.filesystem
 import example.models.configuration
+import example.utilities.workspaces
 
 from pydantic import Field, WithJsonSchema
 
+if typing.TYPE_CHECKING:
+    import example.api.caches
+
 logger = logging.getLogger(__name__)
 
 class Base(example.models.internal.base.Model):
@@ -29,7 +35,9 @@ class Base(example.models.internal.base.Model):
     artifacts_directory: typing.Annotated[pathlib.Path, Field(strict=False), WithJsonSchema({})] = Field(default="artifacts", description="The parent directory that's used for storing output artifacts. If the value is relative, it will be resolved using the \"working-directory\". By default, the directory will not be created. See the \"create-artifacts-directory\" option for changing the default behavior.")
     create_artifacts_directory: bool = Field(default=False, description="Whether to create the artifacts directory if it doesn't already exist.")
 
-    temporary_directory: typing.Annotated[pathlib.Path, Field(strict=False), WithJsonSchema({"x-external-documentation": "https://docs.python.org/3/library/tempfile.html#tempfile.gettempdir"})] = Field(default=tempfile.gettempdir(), description="The parent directory that's used for storing temporary files. By default, the value is computed using the operating system's temporary specification. If the user's specification is different than the OS' default, then changes to \"tempfile.tempdir\" will be directly applied. If the path doesn't exist, it will be created.")
+    temporary_directory: typing.Annotated[pathlib.Path, Field(strict=False), WithJsonSchema({"x-external-documentation": "https://docs.python.org/3/library/tempfile.html#tempfile.gettempdir"})] = Field(default_factory=tempfile.gettempdir, description="The parent directory that's used for storing temporary files. By default, the value is computed using the operating system's temporary specification. If the user's specification is different than the OS' default, then changes to \"tempfile.tempdir\" will be directly applied. If the path doesn't exist, it will be created.")
+
+    lazy: bool = Field(default=False, description="Whether to defer path normalization, filesystem checks, and directory creation until the \"resolved-*\" properties are first accessed. Lazily evaluated filesystem checks are cached per unique path, and \"tempfile.tempdir\" is never updated. By default, all directories are evaluated during instantiation.")
 
     def model_post_init(self, __context: typing.Any) -> None:
         """
@@ -48,6 +56,10 @@ class Base(example.models.internal.base.Model):
             described in the summary section.
         """
 
+        # Defer all evaluation(s) to the "resolved_*" properties.
+        if self.lazy:
+            return
+
         # Evaluate the temporary directory.
         default_tempdir = tempfile.gettempdir()
 
@@ -99,3 +111,132 @@ class Base(example.models.internal.base.Model):
             self.artifacts_directory.mkdir(parents=True, exist_ok=True)
 
         logger.debug("Verified Valid Artifacts Directory: %s. Exists: %s", str(self.artifacts_directory), str(self.artifacts_directory.exists()))
+
+    @functools.cached_property
+    def resolved_temporary_directory(self) -> pathlib.Path:
+        """
+        The temporary directory's full system path.
+
+        When lazily evaluated, the directory is created upon first access; unlike an eagerly evaluated model's,
+        "tempfile.tempdir" isn't updated, such that reading the property has no process-wide side effect.
+        """
+
+        if not self.lazy:
+            return self.temporary_directory
+
+        directory = self.temporary_directory
+        if directory.is_absolute() is False:
+            directory = example.models.internal.filesystem.resolve(str(directory), os.getcwd())
+
+        if str(directory) != tempfile.gettempdir() and example.models.internal.filesystem.status(str(directory)).exists is False:
+            example.models.internal.filesystem.mkdir(directory)
+
+        return directory
+
+    @functools.cached_property
+    def resolved_working_directory(self) -> pathlib.Path:
+        """
+        The working directory's full system path.
+
+        When lazily evaluated, the directory is validated (and optionally created) upon first access.
+        """
+
+        if not self.lazy:
+            return self.working_directory
+
+        directory = example.models.internal.filesystem.resolve(str(self.working_directory), os.getcwd())
+
+        self._evaluate_directory(directory, "Working", self.create_working_directory)
+
+        return directory
+
+    @functools.cached_property
+    def resolved_artifacts_directory(self) -> pathlib.Path:
+        """
+        The artifacts directory's full system path, relative to the working directory if the value is relative.
+
+        When lazily evaluated, the directory is validated (and optionally created) upon first access.
+        """
+
+        if not self.lazy:
+            return self.artifacts_directory
+
+        directory = self.artifacts_directory
+        if directory.is_absolute() is False:
+            directory = example.models.internal.filesystem.resolve(str(directory), str(self.resolved_working_directory))
+
+        self._evaluate_directory(directory, "Artifacts", self.create_artifacts_directory)
+
+        return directory
+
+    @staticmethod
+    def _evaluate_directory(directory: pathlib.Path, name: str, create: bool) -> None:
+        """
+        Verifies a lazily-evaluated directory using cached filesystem probes, creating it if applicable.
+        """
+
+        status = example.models.internal.filesystem.status(str(directory))
+
+        if status.exists and status.directory is False:
+            raise ValueError(f"{name} directory '{directory}' is not a valid directory.")
+        elif not status.exists and create:
+            example.models.internal.filesystem.mkdir(directory)
+
+    def workspaces(self, quota: typing.Optional[int] = None, capacity: int = 16) -> example.utilities.workspaces.Pool:
+        """
+        Creates a pool of reusable, size-tracked workspaces beneath the model's temporary directory.
+
+        Parameters
+        ----------
+        quota : int, optional
+            The maximum total size (in bytes) of the pool's workspaces before least-recently-used idle
+            workspaces are evicted.
+        capacity : int
+            The maximum number of idle workspaces retained for reuse.
+
+        Returns
+        -------
+        example.utilities.workspaces.Pool
+            The workspace pool; callers are responsible for its cleanup.
+        """
+
+        return example.utilities.workspaces.Pool(directory=self.resolved_temporary_directory, quota=quota, capacity=capacity)
+
+    def listings(self, ttl: float = 300.0) -> "example.api.caches.Listings":
+        """
+        Opens the persistent S3 listing cache beneath the model's temporary directory.
+
+        Parameters
+        ----------
+        ttl : float
+            The number of seconds a cached listing is served before being incrementally refreshed.
+
+        Returns
+        -------
+        example.api.caches.Listings
+            The listing cache; callers are responsible for closing it.
+        """
+
+        # --> deferred, such that the models don't depend on (nor import) the API layer until a cache is opened.
+        import example.api.caches
+
+        return example.api.caches.Listings(path=self.resolved_temporary_directory.joinpath("example-s3-listings.sqlite3"), ttl=ttl)
+
+    def objects(self, budget: typing.Optional[int] = None) -> "example.api.caches.Objects":
+        """
+        Opens the shared, content-addressed S3 object cache beneath the model's temporary directory.
+
+        Parameters
+        ----------
+        budget : int, optional
+            The maximum total size (in bytes) of cached objects before least-recently-used objects are evicted.
+
+        Returns
+        -------
+        example.api.caches.Objects
+            The object cache; callers are responsible for closing it.
+        """
+
+        import example.api.caches
+
+        return example.api.caches.Objects(directory=self.resolved_temporary_directory.joinpath("example-s3-objects"), budget=budget)
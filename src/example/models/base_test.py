@@ -89,3 +89,71 @@ def test_base_instance_model_schema(request: pytest.FixtureRequest):
     content = json.dumps(v, indent=4, sort_keys=False)
 
     logger.debug("Schema: %s", content)
+
+def test_base_instance_workspaces(request: pytest.FixtureRequest):
+    instance = example.models.base.Base()
+
+    with instance.workspaces(quota=1024) as pool:
+        assert pool.directory.parent == instance.temporary_directory.resolve()
+
+        with pool.acquire() as workspace:
+            assert workspace.path.exists()
+
+def test_base_instance_lazy(request: pytest.FixtureRequest):
+    temporary = pathlib.Path(tempfile.gettempdir()).joinpath(request.node.name)
+
+    temporary.mkdir(parents=True, exist_ok=True)
+
+    try:
+        instance = example.models.base.Base(working_directory=temporary, create_artifacts_directory=True, lazy=True)
+
+        # --> nothing is evaluated nor created during instantiation.
+        assert not instance.artifacts_directory.is_absolute()
+        assert not temporary.joinpath("artifacts").exists()
+
+        assert instance.resolved_working_directory == temporary.resolve()
+        assert instance.resolved_artifacts_directory == temporary.resolve().joinpath("artifacts")
+        assert instance.resolved_artifacts_directory.exists()
+    finally:
+        shutil.rmtree(temporary, ignore_errors=True)
+
+def test_base_instance_lazy_temporary_directory(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch):
+    temporary = pathlib.Path(tempfile.gettempdir()).joinpath(request.node.name)
+
+    # --> restored upon teardown, should the model (incorrectly) update it.
+    monkeypatch.setattr(tempfile, "tempdir", tempfile.tempdir)
+
+    original = tempfile.tempdir
+
+    try:
+        instance = example.models.base.Base(temporary_directory=temporary.joinpath("temporary"), lazy=True)
+
+        assert instance.resolved_temporary_directory == temporary.joinpath("temporary")
+        assert instance.resolved_temporary_directory.exists()
+        assert instance.resolved_working_directory.exists()
+        assert instance.resolved_artifacts_directory is not None
+
+        assert tempfile.tempdir == original
+    finally:
+        shutil.rmtree(temporary, ignore_errors=True)
+
+def test_base_instance_lazy_invalid_directory(request: pytest.FixtureRequest):
+    temporary = pathlib.Path(tempfile.gettempdir()).joinpath(request.node.name)
+
+    temporary.mkdir(parents=True, exist_ok=True)
+    temporary.joinpath("artifacts").touch()
+
+    try:
+        instance = example.models.base.Base(working_directory=temporary, lazy=True)
+
+        with pytest.raises(ValueError):
+            _ = instance.resolved_artifacts_directory
+    finally:
+        shutil.rmtree(temporary, ignore_errors=True)
+
+def test_base_instance_eager_resolved_properties(request: pytest.FixtureRequest):
+    instance = example.models.base.Base()
+
+    assert instance.resolved_working_directory == instance.working_directory
+    assert instance.resolved_artifacts_directory == instance.artifacts_directory
+    assert instance.resolved_temporary_directory == instance.temporary_directory
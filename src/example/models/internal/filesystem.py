@@ -0,0 +1,91 @@
+"""
+Cached filesystem probes.
+
+Models that are instantiated frequently (e.g. per request) tend to evaluate the same handful of paths
+repeatedly. The following functions memoize path resolution and existence checks per unique path so
+that repeated evaluations avoid additional system calls. Callers that mutate the filesystem through
+these helpers (see `mkdir`) automatically invalidate the caches; external mutations require an
+explicit call to `invalidate`.
+"""
+from __future__ import annotations
+
+import functools
+import os
+import pathlib
+import stat
+import typing
+
+class Status(typing.NamedTuple):
+    """
+    The result of a single filesystem probe.
+
+    Attributes
+    ----------
+    exists : bool
+        Whether the path exists.
+    directory : bool
+        Whether the path exists and is a directory.
+    """
+
+    exists: bool
+    directory: bool
+
+@functools.lru_cache(maxsize=1024)
+def status(path: str) -> Status:
+    """
+    Evaluates whether a path exists, and whether it's a directory, via a single `os.stat` call.
+
+    Parameters
+    ----------
+    path : str
+        The path to evaluate.
+
+    Returns
+    -------
+    Status
+        The path's existence and directory status.
+    """
+
+    try:
+        statistics = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return Status(exists=False, directory=False)
+
+    return Status(exists=True, directory=stat.S_ISDIR(statistics.st_mode))
+
+@functools.lru_cache(maxsize=1024)
+def resolve(path: str, base: str) -> pathlib.Path:
+    """
+    Resolves a path to its full system path, relative to `base` if the path is relative.
+
+    Parameters
+    ----------
+    path : str
+        The path to resolve.
+    base : str
+        The absolute directory used to resolve relative paths.
+
+    Returns
+    -------
+    pathlib.Path
+        The resolved, absolute path.
+    """
+
+    return pathlib.Path(base).joinpath(path).resolve()
+
+def mkdir(path: pathlib.Path) -> None:
+    """
+    Creates a directory (including parents), and invalidates the cached probes.
+    """
+
+    path.mkdir(parents=True, exist_ok=True)
+
+    invalidate()
+
+def invalidate() -> None:
+    """
+    Clears all cached path resolutions and probes.
+    """
+
+    status.cache_clear()
+    resolve.cache_clear()
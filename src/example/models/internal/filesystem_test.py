@@ -0,0 +1,39 @@
+import pathlib
+import tempfile
+
+import pytest
+import logging
+
+import example.models.internal.filesystem as module
+
+logger = logging.getLogger(__name__)
+
+def test_status(request: pytest.FixtureRequest):
+    module.invalidate()
+
+    assert module.status(tempfile.gettempdir()) == module.Status(exists=True, directory=True)
+    assert module.status(str(pathlib.Path(tempfile.gettempdir()).joinpath(request.node.name, "missing"))).exists is False
+
+def test_status_cache(request: pytest.FixtureRequest):
+    module.invalidate()
+
+    module.status(tempfile.gettempdir())
+    module.status(tempfile.gettempdir())
+
+    assert module.status.cache_info().hits == 1
+
+def test_mkdir_invalidation(request: pytest.FixtureRequest):
+    target = pathlib.Path(tempfile.gettempdir()).joinpath(request.node.name)
+
+    try:
+        assert module.status(str(target)).exists is False
+
+        module.mkdir(target)
+
+        assert module.status(str(target)).directory is True
+    finally:
+        target.rmdir()
+
+def test_resolve():
+    assert module.resolve("artifacts", "/example") == pathlib.Path("/example/artifacts").resolve()
+    assert module.resolve("/absolute", "/example") == pathlib.Path("/absolute").resolve()
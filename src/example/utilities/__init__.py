@@ -0,0 +1,19 @@
+"""
+The utilities package provides general-purpose helpers.
+
+Modules are loaded lazily upon first attribute access (PEP 562).
+"""
+
+import importlib
+import typing
+
+__all__ = ["colors", "systems", "workspaces"]
+
+def __getattr__(name: str) -> typing.Any:
+    if name in __all__:
+        return importlib.import_module("{}.{}".format(__name__, name))
+
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+def __dir__() -> typing.List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -8,19 +8,25 @@ such as file and directory validations in system-level applications.
 
 from __future__ import annotations
 
+import contextlib
 import logging
+import mmap
 import os
 import pathlib
-import platform
 import shutil
+import socket
 import stat
+import sys
 import tempfile
 import typing
 
-import packaging.version
-
 logger = logging.getLogger(__name__)
 
+CHUNK_SIZE: int = 1024 * 1024
+"""
+The default chunk size (in bytes) used when iterating or transferring file contents.
+"""
+
 def append_file_stem(path: pathlib.Path, addition: str) -> pathlib.Path:
     """
     Append a string to the stem of a file name while retaining its original extension.
@@ -54,7 +60,7 @@ class Descriptor(pathlib.Path):
     """
 
     try:
-        if packaging.version.parse(platform.python_version()) < packaging.version.parse("3.12"):
+        if sys.version_info < (3, 12):
             _flavour = getattr(type(pathlib.Path()), "_flavour")
     except AttributeError as e:
         ...
@@ -353,3 +359,226 @@ class File(Descriptor):
         if not self.is_file():
             logger.error("Descriptor is not a file: %s", str(self.path.resolve()))
             raise RuntimeError("Descriptor is not a file: {}".format(str(self.path.resolve())))
+
+    @contextlib.contextmanager
+    def view(self, offset: int = 0, length: typing.Optional[int] = None) -> typing.Iterator[memoryview]:
+        """
+        Provides a read-only, memory-mapped view of the file's contents.
+
+        The file is mapped via `mmap` and exposed as a `memoryview`, meaning slicing and
+        inspecting the view never copies the underlying bytes into Python-level buffers.
+        Pages are loaded lazily by the operating system as they are accessed, which makes
+        the view suitable for inspecting multi-GB files.
+
+        The view itself is released when the context exits. Slices derived from it (e.g. `view[:4]`) and
+        retained beyond the context remain valid, keeping the file mapped until they're garbage collected;
+        callers retaining small parts of a large file should instead copy them (e.g. `bytes(view[:4])`).
+
+            with File("large.bin").view(offset=0, length=16) as header:
+                ...
+
+        Parameters
+        ----------
+        offset : int
+            The byte offset at which the view starts.
+        length : int, optional
+            The total number of bytes to expose. Defaults to the remainder of the file.
+
+        Yields
+        ------
+        memoryview
+            A read-only view over the requested region of the file.
+
+        Raises
+        ------
+        ValueError
+            If the offset or length falls outside the file's bounds.
+        """
+
+        size = self.stat().st_size
+
+        if offset < 0 or offset > size:
+            raise ValueError("Invalid Offset ({}) for File of Size ({}): {}".format(offset, size, str(self)))
+
+        end = size if length is None else offset + length
+
+        if length is not None and (length < 0 or end > size):
+            raise ValueError("Invalid Length ({}) for File of Size ({}): {}".format(length, size, str(self)))
+
+        # --> empty files cannot be memory-mapped.
+        if size == 0:
+            yield memoryview(b"")
+            return
+
+        # --> the mapping holds its own (duplicated) descriptor; the file needn't remain open.
+        with open(self, "rb") as file:
+            mapping = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        buffer = memoryview(mapping)
+        view = buffer[offset:end]
+
+        try:
+            yield view
+        finally:
+            view.release()
+            buffer.release()
+
+            try:
+                mapping.close()
+            except BufferError:
+                # --> slices of the view outlive the context; the file is unmapped once they're garbage collected.
+                logger.debug("Retaining Memory-Map of File with Outstanding View Slices: %s", str(self))
+
+    def chunks(self, size: int = CHUNK_SIZE) -> typing.Iterator[memoryview]:
+        """
+        Iterates over the file's contents in fixed-size, zero-copy chunks.
+
+        Each chunk is a read-only `memoryview` slice of a memory-mapped view of the file. A chunk
+        is released as soon as the iterator advances; callers needing to retain a chunk's data must
+        copy it (e.g. `bytes(chunk)`).
+
+        Parameters
+        ----------
+        size : int
+            The maximum size of each chunk in bytes. The final chunk may be smaller.
+
+        Yields
+        ------
+        memoryview
+            Consecutive read-only views of the file's contents.
+        """
+
+        if size <= 0:
+            raise ValueError("Chunk Size Must be a Positive Integer: {}".format(size))
+
+        with self.view() as view:
+            for offset in range(0, len(view), size):
+                with view[offset:offset + size] as chunk:
+                    yield chunk
+
+    def copy(self, destination: os.PathLike | str) -> File:
+        """
+        Copies the file's contents to the destination using in-kernel transfers.
+
+        The copy is attempted with `os.copy_file_range` (which may additionally leverage
+        server-side or reflink copies on supporting file-systems), then `os.sendfile`, before
+        falling back to a buffered `shutil.copyfileobj`. The destination is created or truncated.
+
+        Parameters
+        ----------
+        destination : os.PathLike | str
+            The target file's path, or an existing `File` instance.
+
+        Returns
+        -------
+        File
+            The destination file descriptor.
+
+        Raises
+        ------
+        shutil.SameFileError
+            If the destination is the file itself (including via a symbolic or hard link), which would otherwise be
+            truncated.
+        """
+
+        logger.debug("Attempting to Copy File: %s -> %s", str(self), str(destination))
+
+        with open(self, "rb") as source:
+            status = os.fstat(source.fileno())
+
+            try:
+                existing = os.stat(destination)
+            except FileNotFoundError:
+                existing = None
+
+            if existing is not None and (existing.st_dev, existing.st_ino) == (status.st_dev, status.st_ino):
+                raise shutil.SameFileError("Source and Destination are the Same File: {} -> {}".format(str(self), str(destination)))
+
+            with open(destination, "wb") as target:
+                transferred = File._transfer(source.fileno(), target.fileno(), status.st_size)
+
+        logger.debug("Successfully Copied File (%d Bytes): %s -> %s", transferred, str(self), str(destination))
+
+        return File(destination)
+
+    def send(self, connection: socket.socket, offset: int = 0, count: typing.Optional[int] = None) -> int:
+        """
+        Sends the file's contents over a connected socket without copying through user-space buffers.
+
+        Delegates to `socket.sendfile`, which uses `os.sendfile` where available.
+
+        Parameters
+        ----------
+        connection : socket.socket
+            A connected, blocking stream socket.
+        offset : int
+            The byte offset from which to begin sending.
+        count : int, optional
+            The total number of bytes to send. Defaults to the remainder of the file.
+
+        Returns
+        -------
+        int
+            The total number of bytes sent.
+        """
+
+        with open(self, "rb") as file:
+            total = connection.sendfile(file, offset=offset, count=count)
+
+        logger.debug("Sent %d Byte(s) over Socket: %s", total, str(self))
+
+        return total
+
+    @staticmethod
+    def _transfer(source: int, destination: int, count: int) -> int:
+        """
+        Transfers `count` bytes between two file descriptors, preferring zero-copy system calls.
+
+        A method that stops short of `count` bytes is continued by the next; the final, buffered method copies
+        until the end of the source.
+
+        Returns
+        -------
+        int
+            The total number of bytes transferred, which may differ from `count` if the source's reported size
+            differs from its contents.
+        """
+
+        offset = 0
+
+        for method in ("copy_file_range", "sendfile"):
+            function = getattr(os, method, None)
+            if function is None:
+                continue
+
+            try:
+                while offset < count:
+                    if method == "copy_file_range":
+                        written = function(source, destination, count - offset, offset, offset)
+                    else:
+                        written = function(destination, source, offset, count - offset)
+
+                    if written == 0:
+                        break
+
+                    offset += written
+                else:
+                    return offset
+
+                # --> e.g. procfs or sysfs sources, whose contents copy_file_range doesn't transfer; attempt the next method.
+                logger.debug("Transferred %d of %d Byte(s) via os.%s", offset, count, method)
+            except OSError as e:
+                # --> unsupported across the given file-systems or descriptor types; attempt the next method.
+                logger.debug("Unable to Transfer via os.%s: %s", method, e)
+
+            os.lseek(destination, offset, os.SEEK_SET)
+
+        os.lseek(source, offset, os.SEEK_SET)
+        os.lseek(destination, offset, os.SEEK_SET)
+
+        # --> copies until the end of the source, which may differ from its reported size.
+        with open(source, "rb", closefd=False) as reader, open(destination, "wb", closefd=False) as writer:
+            while data := reader.read(CHUNK_SIZE):
+                offset += writer.write(data)
+
+        return offset
@@ -1,4 +1,6 @@
 import os
+import shutil
+import socket
 
 import logging
 
@@ -56,3 +58,130 @@ def test_directory_temporary(request: pytest.FixtureRequest):
 
     assert directory.exists() is False
 
+
+def test_file_view(request: pytest.FixtureRequest):
+    with example.utilities.systems.Directory.temporary() as directory:
+        instance = example.utilities.systems.File(directory.path.joinpath(request.node.name), create=True)
+
+        instance.write_bytes(b"0123456789")
+
+        with instance.view() as view:
+            assert isinstance(view, memoryview)
+            assert view.readonly is True
+            assert bytes(view) == b"0123456789"
+
+        with instance.view(offset=2, length=3) as view:
+            assert bytes(view) == b"234"
+
+        with pytest.raises(ValueError):
+            with instance.view(offset=8, length=4):
+                ...
+
+def test_file_view_empty(request: pytest.FixtureRequest):
+    with example.utilities.systems.Directory.temporary() as directory:
+        instance = example.utilities.systems.File(directory.path.joinpath(request.node.name), create=True)
+
+        with instance.view() as view:
+            assert len(view) == 0
+
+def test_file_view_retained_slices(request: pytest.FixtureRequest):
+    with example.utilities.systems.Directory.temporary() as directory:
+        instance = example.utilities.systems.File(directory.path.joinpath(request.node.name), create=True)
+
+        instance.write_bytes(b"0123456789")
+
+        # --> slices retained beyond the context remain valid, rather than failing the context's exit.
+        with instance.view(offset=2) as view:
+            head = view[:4]
+
+        assert bytes(head) == b"2345"
+
+        with pytest.raises(ValueError):
+            bytes(view)
+
+def test_file_chunks(request: pytest.FixtureRequest):
+    with example.utilities.systems.Directory.temporary() as directory:
+        instance = example.utilities.systems.File(directory.path.joinpath(request.node.name), create=True)
+
+        content = os.urandom(1024 * 10 + 7)
+
+        instance.write_bytes(content)
+
+        chunks = [bytes(chunk) for chunk in instance.chunks(size=1024)]
+
+        assert len(chunks) == 11
+        assert len(chunks[-1]) == 7
+        assert b"".join(chunks) == content
+
+def test_file_copy(request: pytest.FixtureRequest):
+    with example.utilities.systems.Directory.temporary() as directory:
+        instance = example.utilities.systems.File(directory.path.joinpath(request.node.name), create=True)
+
+        content = os.urandom(1024 * 64 + 3)
+
+        instance.write_bytes(content)
+
+        destination = instance.copy(directory.path.joinpath("{}.copy".format(request.node.name)))
+
+        assert isinstance(destination, example.utilities.systems.File)
+        assert destination.read_bytes() == content
+
+def test_file_copy_short_transfer(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch):
+    with example.utilities.systems.Directory.temporary() as directory:
+        instance = example.utilities.systems.File(directory.path.joinpath(request.node.name), create=True)
+
+        content = os.urandom(1024 * 64 + 3)
+
+        instance.write_bytes(content)
+
+        copy_file_range = getattr(os, "copy_file_range", None)
+
+        # --> e.g. procfs or sysfs sources, for which the system calls transfer nothing (or stop short).
+        def partial(source, destination, count, offset_src=None, offset_dst=None):
+            return copy_file_range(source, destination, min(count, 1024), offset_src, offset_dst) if copy_file_range is not None and offset_src == 0 else 0
+
+        monkeypatch.setattr(os, "copy_file_range", partial, raising=False)
+        monkeypatch.setattr(os, "sendfile", lambda *arguments: 0, raising=False)
+
+        copied = instance.copy(directory.path.joinpath("copy.bin"))
+
+        assert copied.read_bytes() == content
+
+def test_file_copy_same_file(request: pytest.FixtureRequest):
+    with example.utilities.systems.Directory.temporary() as directory:
+        instance = example.utilities.systems.File(directory.path.joinpath(request.node.name), create=True)
+
+        content = os.urandom(1024)
+
+        instance.write_bytes(content)
+
+        os.symlink(instance, directory.path.joinpath("symbolic"))
+        os.link(instance, directory.path.joinpath("hard"))
+
+        for destination in (instance, directory.path.joinpath("symbolic"), directory.path.joinpath("hard")):
+            with pytest.raises(shutil.SameFileError):
+                instance.copy(destination)
+
+        assert instance.read_bytes() == content
+
+def test_file_send(request: pytest.FixtureRequest):
+    with example.utilities.systems.Directory.temporary() as directory:
+        instance = example.utilities.systems.File(directory.path.joinpath(request.node.name), create=True)
+
+        content = os.urandom(1024 * 4)
+
+        instance.write_bytes(content)
+
+        sender, receiver = socket.socketpair()
+
+        with sender, receiver:
+            total = instance.send(sender, offset=1024)
+
+            sender.shutdown(socket.SHUT_WR)
+
+            received = bytearray()
+            while data := receiver.recv(4096):
+                received.extend(data)
+
+        assert total == 1024 * 3
+        assert bytes(received) == content[1024:]
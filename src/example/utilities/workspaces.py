@@ -0,0 +1,331 @@
+"""
+The workspaces module provides a pool of reusable, size-tracked temporary directories.
+
+Creating and deleting a temporary directory per operation is comparatively expensive under load, and
+makes aggregate disk usage difficult to reason about. A `Pool` instead hands out `Workspace` directories
+from a single parent directory, recycles them once released, tracks the bytes each workspace holds, and
+evicts the least-recently-used idle workspaces once a size quota is exceeded.
+
+    pool = Pool(directory=configuration.temporary_directory, quota=10 * 1024 ** 3)
+
+    with pool.acquire() as workspace:
+        target = workspace.path.joinpath("object.bin")
+        ...
+"""
+
+from __future__ import annotations
+
+import collections
+import contextlib
+import dataclasses
+import itertools
+import logging
+import os
+import pathlib
+import shutil
+import tempfile
+import threading
+import time
+import typing
+
+logger = logging.getLogger(__name__)
+
+def usage(path: os.PathLike | str) -> int:
+    """
+    Computes the total size (in bytes) of all regular files beneath a directory.
+
+    Symbolic links are not followed, and files that disappear while walking are ignored.
+
+    Parameters
+    ----------
+    path : os.PathLike | str
+        The directory to measure.
+
+    Returns
+    -------
+    int
+        The sum of all regular files' sizes.
+    """
+
+    total = 0
+    stack = [os.fspath(path)]
+
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as iterator:
+                for entry in iterator:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            total += entry.stat(follow_symlinks=False).st_size
+                    except FileNotFoundError:
+                        continue
+        except FileNotFoundError:
+            continue
+
+    return total
+
+@dataclasses.dataclass(eq=False)
+class Workspace:
+    """
+    Represents a single pooled temporary directory.
+
+    Workspaces are obtained via `Pool.acquire` and are returned to their pool either explicitly via
+    `release`, or implicitly when used as a context manager. Each acquisition returns a distinct handle, holding
+    its own lease; once released, the handle's subsequent releases have no effect, even if its directory has since
+    been acquired by another caller.
+
+    Attributes
+    ----------
+    path : pathlib.Path
+        The workspace's absolute directory path.
+    pool : Pool
+        The pool that owns the workspace.
+    size : int
+        The workspace's last-measured size in bytes.
+    accessed : float
+        The monotonic timestamp of the workspace's last acquisition or release.
+    lease : int, optional
+        The handle's lease, unique to its acquisition; None once released.
+    """
+
+    path: pathlib.Path
+    pool: Pool = dataclasses.field(repr=False)
+    size: int = 0
+    accessed: float = dataclasses.field(default_factory=time.monotonic)
+    lease: typing.Optional[int] = None
+
+    def measure(self) -> int:
+        """
+        Measures, records, and returns the workspace's current size in bytes.
+        """
+
+        self.size = usage(self.path)
+
+        return self.size
+
+    def clear(self) -> None:
+        """
+        Removes the workspace's contents while retaining the directory itself.
+        """
+
+        with os.scandir(self.path) as iterator:
+            for entry in iterator:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path, ignore_errors=True)
+                else:
+                    with contextlib.suppress(FileNotFoundError):
+                        os.unlink(entry.path)
+
+        self.size = 0
+
+    def release(self, clear: bool = True) -> None:
+        """
+        Returns the workspace to its pool. See `Pool.release`.
+        """
+
+        self.pool.release(self, clear=clear)
+
+    def __fspath__(self) -> str:
+        return str(self.path)
+
+    def __enter__(self) -> Workspace:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+        return False
+
+class Pool:
+    """
+    A thread-safe pool of reusable temporary workspaces with quota tracking and LRU eviction.
+
+    Workspaces are created beneath a dedicated parent directory (itself created within `directory`), and are
+    recycled rather than deleted once released. Each released workspace's size is measured; when the pool's
+    total tracked usage exceeds `quota`, idle workspaces are evicted (deleted) in least-recently-used order.
+    Workspaces currently acquired are never evicted.
+
+    Parameters
+    ----------
+    directory : os.PathLike | str, optional
+        The directory in which the pool's parent directory is created. Defaults to `tempfile.gettempdir()`,
+        which reflects `example.models.base.Base.temporary_directory` once a model has been instantiated.
+    quota : int, optional
+        The maximum total size (in bytes) of all tracked workspaces. Defaults to unlimited.
+    capacity : int
+        The maximum number of idle workspaces retained for reuse; surplus idle workspaces are deleted.
+    prefix : str
+        The prefix used when naming the pool's parent directory.
+    """
+
+    def __init__(self, directory: typing.Optional[os.PathLike | str] = None, quota: typing.Optional[int] = None, capacity: int = 16, prefix: str = "workspaces-"):
+        if quota is not None and quota < 0:
+            raise ValueError("Invalid Workspace Pool Quota: {}".format(quota))
+
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+
+        self.directory = pathlib.Path(tempfile.mkdtemp(prefix=prefix, dir=directory)).resolve()
+        self.quota = quota
+        self.capacity = capacity
+
+        self._lock = threading.Lock()
+        self._counter = itertools.count()
+        self._leases = itertools.count()
+        self._idle: collections.OrderedDict[pathlib.Path, Workspace] = collections.OrderedDict()
+        self._leased: dict[pathlib.Path, Workspace] = {}
+
+        logger.debug("Initialized Workspace Pool: %s (Quota: %s)", str(self.directory), str(quota))
+
+    def acquire(self) -> Workspace:
+        """
+        Acquires an empty workspace, reusing the most-recently released idle workspace when available.
+
+        Returns
+        -------
+        Workspace
+            An exclusively-held workspace; release it via `Workspace.release` or a `with` statement.
+        """
+
+        with self._lock:
+            if self._idle:
+                _, idle = self._idle.popitem(last=True)
+
+                # --> a new handle, such that the previous holder's (stale) handle can't release this lease.
+                workspace = dataclasses.replace(idle, lease=next(self._leases))
+
+                # --> contents retained from a previous lease are discarded upon reuse.
+                if workspace.size > 0:
+                    workspace.clear()
+            else:
+                path = self.directory.joinpath(str(next(self._counter)))
+                path.mkdir(parents=False, exist_ok=False)
+
+                workspace = Workspace(path=path, pool=self, lease=next(self._leases))
+
+                logger.debug("Created Workspace: %s", str(path))
+
+            workspace.accessed = time.monotonic()
+
+            self._leased[workspace.path] = workspace
+
+        return workspace
+
+    def release(self, workspace: Workspace, clear: bool = True) -> None:
+        """
+        Returns a workspace to the pool for reuse.
+
+        Releasing an already released handle has no effect; in particular, its directory's contents are left
+        untouched, as they may belong to a subsequent lease.
+
+        Parameters
+        ----------
+        workspace : Workspace
+            A workspace previously obtained from `acquire`.
+        clear : bool
+            Whether to remove the workspace's contents. If `False`, the contents are retained (and counted
+            against the quota) until the workspace is reused, cleared, or evicted.
+        """
+
+        if workspace.pool is not self:
+            raise ValueError("Workspace Does Not Belong to Pool: {}".format(str(workspace.path)))
+
+        # --> the lease is ended before the contents are touched; neither idle nor leased, no other caller holds it.
+        with self._lock:
+            if workspace.lease is None or self._leased.get(workspace.path) is not workspace:
+                logger.debug("Ignoring Release of Released Workspace Handle: %s", str(workspace.path))
+
+                return
+
+            del self._leased[workspace.path]
+
+            workspace.lease = None
+
+        if clear:
+            workspace.clear()
+        else:
+            workspace.measure()
+
+        with self._lock:
+            workspace.accessed = time.monotonic()
+
+            self._idle[workspace.path] = workspace
+
+            self._enforce()
+
+    def usage(self) -> dict[pathlib.Path, int]:
+        """
+        Returns the last-measured size (in bytes) of every workspace, keyed by path.
+
+        Acquired workspaces are re-measured, as their contents may have changed since acquisition.
+        """
+
+        with self._lock:
+            leased = list(self._leased.values())
+            idle = list(self._idle.values())
+
+        return {**{workspace.path: workspace.measure() for workspace in leased}, **{workspace.path: workspace.size for workspace in idle}}
+
+    @property
+    def size(self) -> int:
+        """
+        The total tracked size (in bytes) across all of the pool's workspaces.
+        """
+
+        with self._lock:
+            return sum(workspace.size for workspace in itertools.chain(self._leased.values(), self._idle.values()))
+
+    def evict(self, workspace: Workspace) -> None:
+        """
+        Deletes an idle workspace from disk and removes it from the pool.
+        """
+
+        with self._lock:
+            if self._idle.pop(workspace.path, None) is None:
+                raise ValueError("Only Idle Workspaces Can Be Evicted: {}".format(str(workspace.path)))
+
+        shutil.rmtree(workspace.path, ignore_errors=True)
+
+        logger.debug("Evicted Workspace (%d Bytes): %s", workspace.size, str(workspace.path))
+
+    def cleanup(self) -> None:
+        """
+        Deletes the pool's parent directory, including all idle and acquired workspaces.
+        """
+
+        with self._lock:
+            self._idle.clear()
+            self._leased.clear()
+
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _enforce(self) -> None:
+        """
+        Evicts idle workspaces, least-recently-used first, until both the capacity and quota are satisfied.
+
+        The caller must hold the pool's lock.
+        """
+
+        total = sum(workspace.size for workspace in itertools.chain(self._leased.values(), self._idle.values()))
+
+        while self._idle and (len(self._idle) > self.capacity or (self.quota is not None and total > self.quota)):
+            path, workspace = self._idle.popitem(last=False)
+
+            shutil.rmtree(path, ignore_errors=True)
+
+            total -= workspace.size
+
+            logger.debug("Evicted Least-Recently-Used Workspace (%d Bytes): %s", workspace.size, str(path))
+
+        if self.quota is not None and total > self.quota:
+            logger.warning("Workspace Pool Exceeds Quota (%d > %d Bytes) with Only Acquired Workspaces Remaining: %s", total, self.quota, str(self.directory))
+
+    def __enter__(self) -> Pool:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.cleanup()
+
+        return False
@@ -0,0 +1,87 @@
+import logging
+
+import pytest
+
+import example.utilities.workspaces
+
+logger = logging.getLogger(__name__)
+
+def test_pool_acquire_release(request: pytest.FixtureRequest):
+    with example.utilities.workspaces.Pool() as pool:
+        with pool.acquire() as workspace:
+            assert workspace.path.exists() is True
+            assert workspace.path.parent == pool.directory
+
+            workspace.path.joinpath(request.node.name).write_bytes(b"0" * 128)
+
+            assert pool.usage()[workspace.path] == 128
+
+        # --> released workspaces are recycled and emptied.
+        with pool.acquire() as recycled:
+            assert recycled.path == workspace.path
+            assert list(recycled.path.iterdir()) == []
+
+    assert pool.directory.exists() is False
+
+def test_pool_retained_contents(request: pytest.FixtureRequest):
+    with example.utilities.workspaces.Pool() as pool:
+        workspace = pool.acquire()
+
+        workspace.path.joinpath(request.node.name).write_bytes(b"0" * 64)
+
+        workspace.release(clear=False)
+
+        assert pool.size == 64
+        assert workspace.path.joinpath(request.node.name).exists() is True
+
+def test_pool_quota_eviction(request: pytest.FixtureRequest):
+    with example.utilities.workspaces.Pool(quota=256) as pool:
+        first, second = pool.acquire(), pool.acquire()
+
+        first.path.joinpath(request.node.name).write_bytes(b"0" * 200)
+        second.path.joinpath(request.node.name).write_bytes(b"0" * 200)
+
+        first.release(clear=False)
+        second.release(clear=False)
+
+        # --> the least-recently-used workspace is evicted to satisfy the quota.
+        assert first.path.exists() is False
+        assert second.path.exists() is True
+        assert pool.size == 200
+
+def test_pool_stale_release(request: pytest.FixtureRequest):
+    with example.utilities.workspaces.Pool() as pool:
+        with pool.acquire() as first:
+            # --> a repeated release of the same lease (here, also by the context manager) is a no-op.
+            first.release()
+            first.release()
+
+            second = pool.acquire()
+            assert second.path == first.path and second is not first
+
+            second.path.joinpath(request.node.name).write_bytes(b"0" * 16)
+
+        # --> the stale handle's release (upon exiting the context) neither clears nor recycles the second lease.
+        assert second.path.joinpath(request.node.name).exists() is True
+        assert pool.acquire().path != second.path
+
+        second.release()
+
+        assert pool.acquire().path == second.path
+
+def test_pool_release_foreign_workspace():
+    with example.utilities.workspaces.Pool() as pool, example.utilities.workspaces.Pool() as other:
+        workspace = other.acquire()
+
+        with pytest.raises(ValueError):
+            pool.release(workspace)
+
+def test_usage(request: pytest.FixtureRequest):
+    with example.utilities.workspaces.Pool() as pool, pool.acquire() as workspace:
+        nested = workspace.path.joinpath("nested")
+        nested.mkdir()
+
+        nested.joinpath(request.node.name).write_bytes(b"0" * 10)
+        workspace.path.joinpath(request.node.name).write_bytes(b"0" * 5)
+
+        assert example.utilities.workspaces.usage(workspace) == 15